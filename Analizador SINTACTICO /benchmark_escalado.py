@@ -0,0 +1,305 @@
+import argparse
+import contextlib
+import csv
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from table import SLRTableGenerator
+
+# tsll1.AnalizadorLL1 vive en EVIDENCIA_3; se agrega al final de la ruta para
+# que sus módulos no tapen los de esta carpeta
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'EVIDENCIA_3'))
+from tsll1 import AnalizadorLL1  # noqa: E402
+
+# Curva de escalado de los generadores de tablas con gramáticas aleatorias de
+# 100 a 10.000 producciones: FIRST, FOLLOW y tabla de tsll1.AnalizadorLL1 con
+# gramáticas LL(1), y FIRST, FOLLOW, estados LR(0) y tabla SLR de
+# SLRTableGenerator con gramáticas LR (recursión por la izquierda, prefijos
+# comunes). Cada fase se mide dos veces: una sin tracemalloc para el tiempo y
+# otra con tracemalloc para el pico de memoria. Al final se estima el
+# exponente de cada fase (pendiente log-log entre el menor y el mayor tamaño).
+#
+#   python benchmark_escalado.py
+#   python benchmark_escalado.py --producciones 100,1000 --sin-memoria
+#   python benchmark_escalado.py --csv curva.csv
+#   python benchmark_escalado.py --comparar curva.csv --tolerancia 1.5   # sale con 1 si alguna fase empeora
+
+INICIALES = [f"t{k}" for k in range(32)]   # primer símbolo de cada alternativa
+CIERRES = [f"c{k}" for k in range(8)]      # siguen a los no terminales anulables
+VENTANA = 8  # un no terminal solo usa a los VENTANA siguientes
+MINIMO = 0.005  # segundos; las fases más rápidas no cuentan en --comparar
+
+
+def _alternativas(producciones, rng):
+    """Cantidad de alternativas de cada no terminal (1 a 5) sumando
+    `producciones`"""
+    cantidades = []
+    total = 0
+    while total < producciones:
+        cantidades.append(min(rng.randint(1, 5), producciones - total))
+        total += cantidades[-1]
+    return cantidades
+
+
+def gramatica_ll1(producciones, rng):
+    """Gramática LL(1) aleatoria como [(cabeza, cuerpo)]. Las alternativas
+    de cada no terminal empiezan con terminales distintos de INICIALES y un
+    cuarto de los no terminales tiene además la alternativa vacía; detrás de
+    cada uso de un no terminal anulable va un terminal de CIERRES, así que su
+    FOLLOW nunca se cruza con sus alternativas. Cada no terminal solo usa a
+    los siguientes (la gramática termina) y la primera alternativa usa al
+    inmediato (todos son alcanzables)."""
+    cantidades = _alternativas(producciones, rng)
+    m = len(cantidades)
+    anulables = [i > 0 and cantidades[i] > 1 and rng.random() < 0.25 for i in range(m)]
+    g = []
+    for i, k in enumerate(cantidades):
+        vecinos = range(i + 1, min(m, i + 1 + VENTANA))
+        for alternativa, inicial in enumerate(rng.sample(INICIALES, k - anulables[i])):
+            cuerpo = [inicial]
+            usados = [i + 1] if alternativa == 0 and i + 1 < m else []
+            usados += [rng.choice(vecinos) for _ in range(rng.randint(0, 2)) if vecinos]
+            for j in usados:
+                if rng.random() < 0.3:
+                    cuerpo.append(rng.choice(INICIALES))
+                cuerpo.append(f"A{j}")
+                if anulables[j]:
+                    cuerpo.append(rng.choice(CIERRES))
+            g.append((f"A{i}", cuerpo))
+        if anulables[i]:
+            g.append((f"A{i}", []))
+    return g
+
+
+def gramatica_lr(producciones, rng):
+    """Gramática LR aleatoria (no LL(1)) como [(cabeza, cuerpo)], con una
+    producción inicial S -> A0: recursión por la izquierda (Ai -> Ai op Aj),
+    prefijos comunes (Ai -> t Aj y Ai -> t Aj u) y no terminales al comienzo
+    (Ai -> Aj t). Las alternativas que empiezan con otro no terminal son
+    pocas para que la clausura de cada estado no abarque toda la gramática.
+    Puede tener conflictos SLR; no importan para medir."""
+    cantidades = _alternativas(producciones - 1, rng)
+    m = len(cantidades)
+    g = [('S', ['A0'])]
+    for i, k in enumerate(cantidades):
+        vecinos = range(i + 1, min(m, i + 1 + VENTANA))
+        siguiente = [f"A{i + 1}"] if i + 1 < m else []
+        g.append((f"A{i}", [rng.choice(INICIALES)] + siguiente))
+        compartido = rng.choice(INICIALES)
+        for _ in range(k - 1):
+            forma = rng.choice(('izquierda', 'prefijo', 'prefijo', 'sufijo', 'base')) if vecinos else 'base'
+            if forma == 'izquierda':
+                g.append((f"A{i}", [f"A{i}", rng.choice(CIERRES), f"A{rng.choice(vecinos)}"]))
+            elif forma == 'prefijo':
+                cuerpo = [compartido, f"A{rng.choice(vecinos)}"]
+                g.append((f"A{i}", cuerpo + [rng.choice(CIERRES)] * rng.randint(0, 1)))
+            elif forma == 'sufijo':
+                g.append((f"A{i}", [f"A{rng.choice(vecinos)}", rng.choice(INICIALES)]))
+            else:
+                g.append((f"A{i}", [rng.choice(INICIALES), rng.choice(CIERRES)]))
+    return g
+
+
+def escribir_gramatica(g, ruta):
+    """Formato de texto de tsll1: 'A -> x y | z | \\'\\''"""
+    cuerpos = {}
+    for cabeza, cuerpo in g:
+        cuerpos.setdefault(cabeza, []).append(' '.join(cuerpo) if cuerpo else "''")
+    with open(ruta, 'w', encoding='utf-8') as f:
+        for cabeza, alternativas in cuerpos.items():
+            f.write(f"{cabeza} -> {' | '.join(alternativas)}\n")
+
+
+class Cronometro:
+    """Tiempo (y, con memoria=True, pico de tracemalloc) de cada fase"""
+
+    def __init__(self, memoria=False):
+        self.memoria = memoria
+        self.fases = {}
+
+    @contextlib.contextmanager
+    def fase(self, nombre):
+        if self.memoria:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        inicio = time.perf_counter()
+        yield
+        segundos = time.perf_counter() - inicio
+        pico = tracemalloc.get_traced_memory()[1] - base if self.memoria else None
+        self.fases[nombre] = (segundos, pico)
+
+
+class GeneradorMedido(SLRTableGenerator):
+    """SLRTableGenerator que mide cada fase de su constructor"""
+
+    def __init__(self, grammar, cronometro):
+        self._cronometro = cronometro
+        super().__init__(grammar)
+
+    def _compute_first_sets(self):
+        with self._cronometro.fase('lr first'):
+            super()._compute_first_sets()
+
+    def _compute_follow_sets(self):
+        with self._cronometro.fase('lr follow'):
+            super()._compute_follow_sets()
+
+    def _build_lr0_items(self):
+        with self._cronometro.fase('lr0 estados'):
+            super()._build_lr0_items()
+
+    def _build_slr_table(self):
+        with self._cronometro.fase('slr tabla'):
+            super()._build_slr_table()
+
+
+def medir_ll1(ruta, cronometro):
+    """Fases de tsll1 con su salida descartada; devuelve (no terminales,
+    terminales, conflictos)"""
+    salida = open(os.devnull, 'w', encoding='utf-8')
+    conflictos = 0
+    try:
+        with contextlib.redirect_stdout(salida):
+            analizador = AnalizadorLL1(ruta)
+            with cronometro.fase('ll1 first'):
+                analizador.calcular_first()
+            with cronometro.fase('ll1 follow'):
+                analizador.calcular_follow()
+            with cronometro.fase('ll1 tabla'):
+                analizador.construir_tabla_ll1()
+    finally:
+        salida.close()
+    # Una celda ocupada por dos producciones deja la primera: se cuentan las
+    # selecciones que no llegaron a la tabla
+    for nt, alternativas in analizador.producciones.items():
+        celdas = sum(1 for p in analizador.tabla_ll1[nt].values() if p is not None)
+        seleccion = 0
+        for produccion in alternativas:
+            first = analizador.calcular_first_de_cadena(produccion)
+            seleccion += len(first - {analizador.EPSILON})
+            if analizador.EPSILON in first:
+                seleccion += len(analizador.follow[nt])
+        conflictos += seleccion - celdas
+    return len(analizador.no_terminales), len(analizador.terminales), conflictos
+
+
+def medir_lr(g, cronometro):
+    """Fases de SLRTableGenerator; devuelve (estados, conflictos)"""
+    generador = GeneradorMedido(g, cronometro)
+    return len(generador.states), len(generador.conflicts)
+
+
+def correr(producciones, semilla, memoria, ruta, repeticiones):
+    """{fase: (segundos, bytes o None)} e información de las gramáticas;
+    el tiempo de cada fase es el mejor de `repeticiones` corridas"""
+    ll1 = gramatica_ll1(producciones, random.Random(semilla))
+    lr = gramatica_lr(producciones, random.Random(semilla))
+    escribir_gramatica(ll1, ruta)
+
+    fases = {}
+    for _ in range(repeticiones):
+        tiempos = Cronometro()
+        info = medir_ll1(ruta, tiempos) + medir_lr(lr, tiempos)
+        for nombre, (segundos, _) in tiempos.fases.items():
+            fases[nombre] = (min(segundos, fases.get(nombre, (segundos,))[0]), None)
+    if memoria:
+        picos = Cronometro(memoria=True)
+        tracemalloc.start()
+        try:
+            medir_ll1(ruta, picos)
+            medir_lr(lr, picos)
+        finally:
+            tracemalloc.stop()
+        fases = {nombre: (segundos, picos.fases[nombre][1]) for nombre, (segundos, _) in fases.items()}
+    return fases, info
+
+
+def pendiente(curva, fase):
+    """Exponente k de tiempo ~ producciones^k entre el primer y el último punto"""
+    (n0, f0), (n1, f1) = curva[0], curva[-1]
+    t0, t1 = f0[fase][0], f1[fase][0]
+    if n1 == n0 or t0 <= 0 or t1 <= 0:
+        return None
+    return math.log(t1 / t0) / math.log(n1 / n0)
+
+
+def escribir_csv(curva, ruta):
+    with open(ruta, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['producciones', 'fase', 'segundos', 'bytes'])
+        for n, fases in curva:
+            for fase, (segundos, pico) in fases.items():
+                writer.writerow([n, fase, f"{segundos:.6f}", '' if pico is None else pico])
+
+
+def comparar(curva, ruta, tolerancia):
+    """Fases más lentas que en `ruta` (CSV de --csv) por un factor mayor que
+    `tolerancia`, sin contar las que tardan menos de MINIMO segundos (ruido);
+    devuelve la lista de (producciones, fase, antes, ahora)"""
+    with open(ruta, newline='', encoding='utf-8') as f:
+        anterior = {(int(fila['producciones']), fila['fase']): float(fila['segundos'])
+                    for fila in csv.DictReader(f)}
+    peores = []
+    for n, fases in curva:
+        for fase, (segundos, _) in fases.items():
+            antes = anterior.get((n, fase))
+            if antes and segundos > max(antes * tolerancia, MINIMO):
+                peores.append((n, fase, antes, segundos))
+    return peores
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Curva de escalado de los generadores LL(1) y SLR")
+    parser.add_argument('--producciones', default='100,300,1000,3000,10000',
+                        help="tamaños de las gramáticas aleatorias")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--repeticiones', type=int, default=3, help="se informa la mejor corrida de cada fase")
+    parser.add_argument('--sin-memoria', action='store_true', help="no medir el pico de memoria (tracemalloc)")
+    parser.add_argument('--csv', help="guardar la curva en este archivo")
+    parser.add_argument('--comparar', help="CSV de una corrida anterior (--csv) con el que comparar")
+    parser.add_argument('--tolerancia', type=float, default=1.5,
+                        help="factor de tiempo a partir del cual una fase se considera más lenta")
+    args = parser.parse_args()
+
+    tamanos = sorted(int(x) for x in args.producciones.split(','))
+    curva = []
+    temporal = tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False)
+    temporal.close()
+    try:
+        print(f"{'Prod.':>6} {'NT LL':>6} {'T LL':>5} {'Confl. LL':>10} {'Estados':>8} {'Confl. SLR':>11}  "
+              f"Fase: segundos (MiB)")
+        for n in tamanos:
+            fases, (nt, t, conflictos_ll, estados, conflictos_slr) = correr(
+                n, args.semilla, not args.sin_memoria, temporal.name, args.repeticiones)
+            curva.append((n, fases))
+            detalle = '  '.join(f"{fase}: {segundos:.3f}" + ('' if pico is None else f" ({pico / 2**20:.1f})")
+                                for fase, (segundos, pico) in fases.items())
+            print(f"{n:>6} {nt:>6} {t:>5} {conflictos_ll:>10} {estados:>8} {conflictos_slr:>11}  {detalle}",
+                  flush=True)
+    finally:
+        os.remove(temporal.name)
+
+    if len(curva) > 1:
+        print(f"\nExponente (segundos ~ producciones^k, {tamanos[0]} a {tamanos[-1]}):")
+        for fase in curva[0][1]:
+            k = pendiente(curva, fase)
+            print(f"  {fase:<16} {'-' if k is None else f'{k:.2f}'}")
+
+    if args.csv:
+        escribir_csv(curva, args.csv)
+    if args.comparar:
+        peores = comparar(curva, args.comparar, args.tolerancia)
+        for n, fase, antes, ahora in peores:
+            print(f"❌ {fase} con {n} producciones: {antes:.3f} s -> {ahora:.3f} s")
+        if peores:
+            sys.exit(1)
+        print(f"Ninguna fase más de {args.tolerancia}x más lenta que en {args.comparar}")
+
+
+if __name__ == '__main__':
+    main()
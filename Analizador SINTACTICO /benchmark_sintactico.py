@@ -0,0 +1,173 @@
+import argparse
+import sys
+import time
+
+from lexico import Lexico
+from nodo import Nodo
+from sintactico import Sintactico, tabla_lr
+from table import SLRTableGenerator, grammar
+from valor import Valor
+
+# Benchmark del analizador LR: el bucle anterior (tokens.pop(0), reducciones
+# con insert(0), estados como objetos Valor y tabla indexada por cadenas)
+# contra Sintactico.analizar con la tabla compilada a enteros.
+#
+#   python benchmark_sintactico.py                  # 500 fragmentos
+#   python benchmark_sintactico.py --fragmentos 2000 --metodo lalr
+#   python benchmark_sintactico.py --verificar      # compara los árboles
+
+FRAGMENTO = """var x{n} = {n} + 2 * (3 - y) ^ 2;
+si (x{n} >= 10 && !falso || y != {n}) {{
+    imprimir("mayor", x{n});
+}} sino {{
+    x{n} = -x{n} / 4;
+}}
+mientras (x{n} < 100) {{ x{n} = x{n} + 1; }}
+para (var i = 0; i <= {n}; i = i + 1) {{ imprimir(i); }}
+definir f{n}(a, b) {{ retornar a * b + f{n}(a - 1, b); }}
+"""
+
+
+class SintacticoAnterior:
+    """El bucle de Sintactico.analizar tal como era antes, sin la impresión
+    de cada paso y con lo mínimo para que funcione con una tabla LR: los
+    estados se apilan como Valor(estado, "ESTADO") (antes los argumentos
+    estaban invertidos y el estado no se leía nunca) y la cantidad de hijos
+    no terminales sale de la gramática en lugar de las listas fijas"""
+
+    def __init__(self, tokens, generador, hijos):
+        self.tokens = tokens
+        self.tabla = self._tabla_de_cadenas(generador)
+        self.reglas = {i: (len(cuerpo), cabeza) for i, (cabeza, cuerpo) in enumerate(generador.productions)}
+        self.hijos = hijos
+        self.pila = [Valor("0", "ESTADO", 0, 0)]
+
+    @staticmethod
+    def _tabla_de_cadenas(generador):
+        tabla = {}
+        for estado, fila in generador.action_table.items():
+            for terminal, accion in fila.items():
+                tabla[(str(estado), terminal)] = ("reduce", 0) if accion == 'accept' else accion
+        for estado, fila in generador.goto_table.items():
+            for no_terminal, destino in fila.items():
+                tabla[(str(estado), no_terminal)] = ("shift", destino)
+        # Tras reducir la regla 0 se busca su GOTO antes de aceptar
+        tabla[("0", generador.start_symbol)] = ("shift", -1)
+        return tabla
+
+    def analizar(self):
+        arbol = []
+        tokens = self.tokens.copy()
+        ultimo_token = tokens[-1] if tokens else None
+        tokens.append(Valor("$", "$", ultimo_token.linea if ultimo_token else 0,
+                            ultimo_token.columna if ultimo_token else 0))
+        while True:
+            estado_actual = self.pila[-1].getLexema()
+            token_actual = tokens[0]
+            linea_actual = token_actual.linea
+            columna_actual = token_actual.columna
+            accion = self.tabla.get((estado_actual, token_actual.getToken()), ("error",))
+
+            if accion[0] == "shift":
+                _, nuevo_estado = accion
+                token_shift = tokens.pop(0)
+                self.pila.append(token_shift)
+                self.pila.append(Valor(str(nuevo_estado), "ESTADO", token_shift.linea, token_shift.columna))
+
+            elif accion[0] == "reduce":
+                _, num_regla = accion
+                lon, no_terminal = self.reglas[num_regla]
+                nodo = Nodo(num_regla, [], [])
+                elementos_pila = []
+                for _ in range(lon * 2):
+                    elementos_pila.insert(0, self.pila.pop())
+                for elem in elementos_pila:
+                    if elem.getToken() != "ESTADO":
+                        nodo.addTerminal(elem)
+
+                hijos = []
+                for _ in range(self.hijos[num_regla]):
+                    hijos.append(arbol.pop())
+                for hijo in reversed(hijos):
+                    nodo.addNoTerminal(hijo)
+
+                nodo.setRegla(num_regla)
+                nodo.revTerminales()
+                arbol.append(nodo)
+
+                estado_previo = self.pila[-1].getLexema()
+                self.pila.append(Valor(no_terminal, "NO_TERMINAL", linea_actual, columna_actual))
+                goto = self.tabla.get((estado_previo, no_terminal), ("error",))
+                if goto[0] != "shift":
+                    return f"Error: No se encontró GOTO para {no_terminal}", None
+                self.pila.append(Valor(str(goto[1]), "ESTADO", linea_actual, columna_actual))
+
+                if num_regla == 0 and tokens[0].getToken() == "$":
+                    return "Análisis exitoso", arbol[0] if arbol else None
+            else:
+                return f"Error sintáctico en Línea {linea_actual}, Columna {columna_actual}", None
+
+
+def generar_tokens(fragmentos):
+    lexico = Lexico()
+    lexico.analizar(''.join(FRAGMENTO.format(n=i) for i in range(fragmentos)))
+    if lexico.errores:
+        raise RuntimeError(f"Errores léxicos en el corpus: {lexico.errores[:3]}")
+    return lexico.lista_tokens
+
+
+def firma(raiz):
+    """Recorrido en preorden: regla, terminales y cantidad de hijos"""
+    nodos = []
+    pila = [raiz]
+    while pila:
+        nodo = pila.pop()
+        nodos.append((nodo.regla, len(nodo.noTerminales),
+                      [(t.lexema, t.token, t.linea, t.columna) for t in nodo.terminales]))
+        pila.extend(reversed(nodo.noTerminales))
+    return nodos
+
+
+def medir(analizar, repeticiones):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        mensaje, arbol = analizar()
+        mejor = min(mejor, time.perf_counter() - inicio)
+        if arbol is None:
+            raise RuntimeError(mensaje)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del analizador LR de SERPY")
+    parser.add_argument('--fragmentos', type=int, default=500, help="cantidad de fragmentos del corpus")
+    parser.add_argument('--repeticiones', type=int, default=3, help="se informa la mejor corrida")
+    parser.add_argument('--metodo', choices=('slr', 'lalr'), default='slr')
+    parser.add_argument('--verificar', action='store_true', help="comparar los árboles de ambos analizadores")
+    args = parser.parse_args()
+
+    tokens = generar_tokens(args.fragmentos)
+    generador = SLRTableGenerator(grammar, args.metodo)
+    tabla = tabla_lr(args.metodo)
+
+    def anterior():
+        return SintacticoAnterior(tokens, generador, tabla.hijos).analizar()
+
+    def actual():
+        return Sintactico(tokens, tabla=tabla).analizar()
+
+    if args.verificar:
+        iguales = firma(anterior()[1]) == firma(actual()[1])
+        print("Árboles idénticos" if iguales else "❌ Los árboles difieren")
+        sys.exit(0 if iguales else 1)
+
+    print(f"Corpus: {args.fragmentos} fragmentos, {len(tokens)} tokens, tabla {args.metodo.upper()}")
+    print(f"{'Analizador':<10} {'Segundos':>10} {'Tokens/s':>12}")
+    for nombre, analizar in (('anterior', anterior), ('actual', actual)):
+        segundos = medir(analizar, args.repeticiones)
+        print(f"{nombre:<10} {segundos:>10.3f} {len(tokens) / segundos:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
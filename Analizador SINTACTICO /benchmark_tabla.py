@@ -0,0 +1,250 @@
+import argparse
+import time
+from collections import defaultdict, deque
+
+from table import SLRTableGenerator, grammar
+
+# Benchmark de la generación de tablas LR: el generador anterior (clausura
+# recorriendo todas las producciones y GOTO con todos los símbolos en cada
+# estado) contra el actual en modo SLR y LALR, sobre la gramática de SERPY y
+# gramáticas sintéticas de expresiones con n niveles de precedencia.
+#
+#   python benchmark_tabla.py
+#   python benchmark_tabla.py --niveles 10,100,1000 --max-anterior 100
+
+
+class GeneradorAnterior:
+    """SLRTableGenerator tal como era antes (sin impresión ni CSV)"""
+
+    def __init__(self, grammar):
+        self.grammar = grammar
+        self.terminals = set()
+        self.non_terminals = set()
+        self.productions = []
+        self.first_sets = defaultdict(set)
+        self.follow_sets = defaultdict(set)
+        self.states = []
+        self.action_table = defaultdict(dict)
+        self.goto_table = defaultdict(dict)
+        self.prod_index = {}
+        
+        self._process_grammar()
+        self._compute_first_sets()
+        self._compute_follow_sets()
+        self._build_lr0_items()
+        self._build_slr_table()
+
+    def _process_grammar(self):
+        """Procesa la gramática y extrae terminales, no terminales y producciones"""
+        for i, (head, body) in enumerate(self.grammar):
+            self.non_terminals.add(head)
+            for symbol in body:
+                if symbol and symbol not in self.non_terminals:
+                    self.terminals.add(symbol)
+            
+            # Convertir el cuerpo a tupla para que sea hashable
+            body_tuple = tuple(body)
+            self.productions.append((head, body_tuple))
+            self.prod_index[(head, body_tuple)] = i
+        
+        self.terminals.add('$')
+
+    def _compute_first_sets(self):
+        """Calcula los conjuntos FIRST para todos los símbolos"""
+        # Inicializar FIRST para terminales
+        for t in self.terminals:
+            self.first_sets[t].add(t)
+        
+        changed = True
+        while changed:
+            changed = False
+            for head, body in self.productions:
+                old_len = len(self.first_sets[head])
+                
+                if not body:
+                    self.first_sets[head].add('')
+                    continue
+                
+                all_have_epsilon = True
+                for symbol in body:
+                    self.first_sets[head].update(self.first_sets[symbol] - {''})
+                    if '' not in self.first_sets[symbol]:
+                        all_have_epsilon = False
+                        break
+                
+                if all_have_epsilon:
+                    self.first_sets[head].add('')
+                
+                if len(self.first_sets[head]) > old_len:
+                    changed = True
+
+    def _compute_follow_sets(self):
+        """Calcula los conjuntos FOLLOW para los no terminales"""
+        self.follow_sets[self.grammar[0][0]].add('$')
+        
+        changed = True
+        while changed:
+            changed = False
+            for head, body in self.productions:
+                for i, symbol in enumerate(body):
+                    if symbol in self.non_terminals:
+                        old_len = len(self.follow_sets[symbol])
+                        
+                        beta = body[i+1:]
+                        if beta:
+                            first_beta = self._compute_first_of_sequence(beta)
+                            self.follow_sets[symbol].update(first_beta - {''})
+                            
+                            if '' in first_beta:
+                                self.follow_sets[symbol].update(self.follow_sets[head])
+                        else:
+                            self.follow_sets[symbol].update(self.follow_sets[head])
+                        
+                        if len(self.follow_sets[symbol]) > old_len:
+                            changed = True
+
+    def _compute_first_of_sequence(self, sequence):
+        first = set()
+        all_have_epsilon = True
+        
+        for symbol in sequence:
+            first.update(self.first_sets[symbol] - {''})
+            if '' not in self.first_sets[symbol]:
+                all_have_epsilon = False
+                break
+        
+        if all_have_epsilon:
+            first.add('')
+        
+        return first
+
+    def _closure(self, items):
+        """Calcula la clausura de un conjunto de items LR(0)"""
+        closure = set(items)
+        queue = deque(items)
+        
+        while queue:
+            head, body, pos = queue.popleft()
+            if pos < len(body) and body[pos] in self.non_terminals:
+                for prod_head, prod_body in self.productions:
+                    if prod_head == body[pos]:
+                        new_item = (prod_head, prod_body, 0)
+                        if new_item not in closure:
+                            closure.add(new_item)
+                            queue.append(new_item)
+        return closure
+
+    def _goto(self, items, symbol):
+        """Calcula la función GOTO para un conjunto de items"""
+        goto_items = set()
+        for head, body, pos in items:
+            if pos < len(body) and body[pos] == symbol:
+                goto_items.add((head, body, pos + 1))
+        return self._closure(goto_items) if goto_items else set()
+
+    def _build_lr0_items(self):
+        """Construye los estados LR(0)"""
+        initial_item = (self.productions[0][0], self.productions[0][1], 0)
+        initial_state = frozenset(self._closure({initial_item}))
+        self.states.append(initial_state)
+        
+        queue = deque([0])
+        state_indices = {initial_state: 0}
+        
+        while queue:
+            current_idx = queue.popleft()
+            current_state = self.states[current_idx]
+            
+            symbols = self.terminals.union(self.non_terminals)
+            for symbol in symbols:
+                new_state = frozenset(self._goto(current_state, symbol))
+                if new_state:
+                    if new_state not in state_indices:
+                        state_indices[new_state] = len(self.states)
+                        self.states.append(new_state)
+                        queue.append(len(self.states) - 1)
+                    next_state_idx = state_indices[new_state]
+                    
+                    if symbol in self.terminals:
+                        self.action_table[current_idx][symbol] = ('shift', next_state_idx)
+                    else:
+                        self.goto_table[current_idx][symbol] = next_state_idx
+
+    def _build_slr_table(self):
+        """Completa la tabla SLR con las reducciones"""
+        for i, state in enumerate(self.states):
+            for item in state:
+                head, body, pos = item
+                if pos == len(body):
+                    if head == self.productions[0][0]:
+                        self.action_table[i]['$'] = 'accept'  # Cambiado a solo el valor
+                    else:
+                        prod_num = self.prod_index[(head, body)]
+                        for terminal in self.follow_sets[head]:
+                            if terminal in self.action_table[i]:
+                                existing = self.action_table[i][terminal]
+                                if isinstance(existing, tuple) and existing[0] == 'shift':
+                                    continue
+                            self.action_table[i][terminal] = ('reduce', prod_num)
+
+
+def gramatica_sintetica(niveles):
+    """Sentencias y expresiones con `niveles` operadores binarios de distinta
+    precedencia (recursión por la izquierda); unas 3 producciones por nivel"""
+    g = [
+        ('programa', ['sentencias']),
+        ('sentencias', ['sentencias', 'sentencia']),
+        ('sentencias', []),
+        ('sentencia', ['id', '=', 'e0', ';']),
+        ('sentencia', ['si', '(', 'e0', ')', 'sentencia']),
+        ('sentencia', ['{', 'sentencias', '}']),
+    ]
+    for i in range(niveles):
+        g.append((f'e{i}', [f'e{i}', f'op{i}', f'e{i + 1}']))
+        g.append((f'e{i}', [f'e{i + 1}']))
+    g.append((f'e{niveles}', ['id']))
+    g.append((f'e{niveles}', ['num']))
+    g.append((f'e{niveles}', ['(', 'e0', ')']))
+    g.append((f'e{niveles}', ['-', f'e{niveles}']))
+    return g
+
+
+# Gramática SLR con conflicto que LALR(1) resuelve (S -> L = R | R)
+ASIGNACION = [
+    ('S', ['L', '=', 'R']),
+    ('S', ['R']),
+    ('L', ['*', 'R']),
+    ('L', ['id']),
+    ('R', ['L']),
+]
+
+
+def medir(crear):
+    inicio = time.perf_counter()
+    generador = crear()
+    return time.perf_counter() - inicio, generador
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la generación de tablas SLR/LALR")
+    parser.add_argument('--niveles', default='10,30,100,300', help="niveles de precedencia de las gramáticas sintéticas")
+    parser.add_argument('--max-anterior', type=int, default=100,
+                        help="no medir el generador anterior con más niveles que estos")
+    args = parser.parse_args()
+
+    casos = [('SERPY', grammar, True), ('L = R', [('S0', ['S'])] + ASIGNACION, True)]
+    for n in (int(x) for x in args.niveles.split(',')):
+        casos.append((f'sintetica {n}', gramatica_sintetica(n), n <= args.max_anterior))
+
+    print(f"{'Gramática':<16} {'Prod.':>6} {'Estados':>8} {'Anterior (s)':>13} {'SLR (s)':>9} "
+          f"{'LALR (s)':>9} {'Confl. SLR':>11} {'Confl. LALR':>12}")
+    for nombre, g, con_anterior in casos:
+        anterior = f"{medir(lambda: GeneradorAnterior(g))[0]:>13.3f}" if con_anterior else f"{'-':>13}"
+        seg_slr, slr = medir(lambda: SLRTableGenerator(g))
+        seg_lalr, lalr = medir(lambda: SLRTableGenerator(g, 'lalr'))
+        print(f"{nombre:<16} {len(g):>6} {len(slr.states):>8} {anterior} {seg_slr:>9.3f} "
+              f"{seg_lalr:>9.3f} {len(slr.conflicts):>11} {len(lalr.conflicts):>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -10,10 +10,9 @@ def main():
     
     # 2. Análisis sintáctico
     try:
-        sintactico = Sintactico(
-            tokens=lexico.lista_tokens,
-            archivo_tabla_csv="tabla_sintactica.csv"
-        )
+        # Tabla SLR de table.grammar compilada a enteros (también se puede
+        # pasar archivo_tabla_csv con un CSV exportado por table.py)
+        sintactico = Sintactico(tokens=lexico.lista_tokens)
         
         mensaje, arbol = sintactico.analizar()
         
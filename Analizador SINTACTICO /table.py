@@ -1,13 +1,23 @@
 import sys
 import io
-from collections import defaultdict, deque
+from collections import defaultdict
 
-# Configurar la salida para UTF-8
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 class SLRTableGenerator:
-    def __init__(self, grammar):
+    """Genera la tabla LR de la gramática: SLR(1) (por defecto) o LALR(1)
+    con method='lalr'.
+
+    Los símbolos se numeran de forma densa (primero los terminales, que son
+    los bits de los conjuntos FIRST/FOLLOW/lookahead, y luego los no
+    terminales) y cada item LR(0) es un entero que indexa las ternas
+    (cabeza, producción, punto) precalculadas en _item_head, _item_prod y
+    _item_dot. Los estados se identifican por su núcleo."""
+
+    def __init__(self, grammar, method='slr'):
+        if method not in ('slr', 'lalr'):
+            raise ValueError(f"Método desconocido: {method} (use 'slr' o 'lalr')")
         self.grammar = grammar
+        self.method = method
         self.terminals = set()
         self.non_terminals = set()
         self.productions = []
@@ -17,17 +27,23 @@ class SLRTableGenerator:
         self.action_table = defaultdict(dict)
         self.goto_table = defaultdict(dict)
         self.prod_index = {}
+        self.conflicts = []  # (estado, terminal, acción conservada, acción descartada)
         
         self._process_grammar()
         self._compute_first_sets()
         self._compute_follow_sets()
         self._build_lr0_items()
+        if method == 'lalr':
+            self._compute_lalr_lookaheads()
         self._build_slr_table()
 
     def _process_grammar(self):
         """Procesa la gramática y extrae terminales, no terminales y producciones"""
-        for i, (head, body) in enumerate(self.grammar):
+        # Primero todas las cabezas: un no terminal usado antes de su primera
+        # producción no debe tomarse como terminal
+        for head, body in self.grammar:
             self.non_terminals.add(head)
+        for i, (head, body) in enumerate(self.grammar):
             for symbol in body:
                 if symbol and symbol not in self.non_terminals:
                     self.terminals.add(symbol)
@@ -39,143 +55,345 @@ class SLRTableGenerator:
         
         self.terminals.add('$')
 
+        # Numeración densa de símbolos y producciones
+        self.symbols = sorted(self.terminals) + sorted(self.non_terminals)
+        self.symbol_id = {s: i for i, s in enumerate(self.symbols)}
+        self.n_terminals = T = len(self.terminals)
+        self.start_symbol = self.grammar[0][0]
+        self._heads = [self.symbol_id[head] for head, _ in self.productions]
+        self._bodies = [tuple(self.symbol_id[s] for s in body if s) for _, body in self.productions]
+        self._prods_by_head = [[] for _ in self.non_terminals]
+        for p, head in enumerate(self._heads):
+            self._prods_by_head[head - T].append(p)
+
+        # Items: _item_base[p] + punto
+        self._item_base = []
+        self._item_head, self._item_prod, self._item_dot, self._item_next = [], [], [], []
+        for p, body in enumerate(self._bodies):
+            self._item_base.append(len(self._item_prod))
+            for dot in range(len(body) + 1):
+                self._item_head.append(self._heads[p])
+                self._item_prod.append(p)
+                self._item_dot.append(dot)
+                self._item_next.append(body[dot] if dot < len(body) else -1)
+
     def _compute_first_sets(self):
-        """Calcula los conjuntos FIRST para todos los símbolos"""
-        # Inicializar FIRST para terminales
+        """Calcula FIRST (bits de terminales) y anulables con una lista de
+        trabajo: al crecer FIRST(A) solo se revisan las producciones que usan A"""
+        T = self.n_terminals
+        first = self._first = [0] * len(self.non_terminals)
+        nullable = self._nullable = [False] * len(self.non_terminals)
+        users = [[] for _ in self.non_terminals]
+        for p, body in enumerate(self._bodies):
+            for s in set(body):
+                if s >= T:
+                    users[s - T].append(p)
+
+        pending = list(range(len(self._bodies)))
+        queued = [True] * len(self._bodies)
+        while pending:
+            p = pending.pop()
+            queued[p] = False
+            a = self._heads[p] - T
+            new, is_nullable = self._first_of_ids(self._bodies[p])
+            new |= first[a]
+            if new != first[a] or (is_nullable and not nullable[a]):
+                first[a] = new
+                nullable[a] = nullable[a] or is_nullable
+                for q in users[a]:
+                    if not queued[q]:
+                        queued[q] = True
+                        pending.append(q)
+
+        # Conjuntos de cadenas ('' = épsilon) como antes
         for t in self.terminals:
             self.first_sets[t].add(t)
-        
-        changed = True
-        while changed:
-            changed = False
-            for head, body in self.productions:
-                old_len = len(self.first_sets[head])
-                
-                if not body:
-                    self.first_sets[head].add('')
-                    continue
-                
-                all_have_epsilon = True
-                for symbol in body:
-                    self.first_sets[head].update(self.first_sets[symbol] - {''})
-                    if '' not in self.first_sets[symbol]:
-                        all_have_epsilon = False
-                        break
-                
-                if all_have_epsilon:
-                    self.first_sets[head].add('')
-                
-                if len(self.first_sets[head]) > old_len:
-                    changed = True
+        for nt in self.non_terminals:
+            a = self.symbol_id[nt] - T
+            self.first_sets[nt] = self._names(first[a])
+            if nullable[a]:
+                self.first_sets[nt].add('')
+
+    def _first_of_ids(self, symbols, start=0):
+        """(FIRST como bits, ¿anulable?) de symbols[start:]"""
+        T = self.n_terminals
+        result = 0
+        for k in range(start, len(symbols)):
+            s = symbols[k]
+            if s < T:
+                return result | (1 << s), False
+            result |= self._first[s - T]
+            if not self._nullable[s - T]:
+                return result, False
+        return result, True
+
+    def _names(self, bits):
+        names = set()
+        while bits:
+            low = bits & -bits
+            names.add(self.symbols[low.bit_length() - 1])
+            bits ^= low
+        return names
 
     def _compute_follow_sets(self):
-        """Calcula los conjuntos FOLLOW para los no terminales"""
-        self.follow_sets[self.grammar[0][0]].add('$')
-        
-        changed = True
-        while changed:
-            changed = False
-            for head, body in self.productions:
-                for i, symbol in enumerate(body):
-                    if symbol in self.non_terminals:
-                        old_len = len(self.follow_sets[symbol])
-                        
-                        beta = body[i+1:]
-                        if beta:
-                            first_beta = self._compute_first_of_sequence(beta)
-                            self.follow_sets[symbol].update(first_beta - {''})
-                            
-                            if '' in first_beta:
-                                self.follow_sets[symbol].update(self.follow_sets[head])
-                        else:
-                            self.follow_sets[symbol].update(self.follow_sets[head])
-                        
-                        if len(self.follow_sets[symbol]) > old_len:
-                            changed = True
+        """Calcula los conjuntos FOLLOW para los no terminales: cada aparición
+        aporta FIRST(β) una vez y, si β es anulable, una arista cabeza → símbolo
+        por la que FOLLOW se propaga con una lista de trabajo"""
+        T = self.n_terminals
+        follow = self._follow = [0] * len(self.non_terminals)
+        edges = [set() for _ in self.non_terminals]
+        for p, body in enumerate(self._bodies):
+            a = self._heads[p] - T
+            for i, s in enumerate(body):
+                if s < T:
+                    continue
+                rest, nullable = self._first_of_ids(body, i + 1)
+                follow[s - T] |= rest
+                if nullable and s - T != a:
+                    edges[a].add(s - T)
+        follow[self.symbol_id[self.start_symbol] - T] |= 1 << self.symbol_id['$']
+
+        pending = list(range(len(self.non_terminals)))
+        queued = [True] * len(self.non_terminals)
+        while pending:
+            a = pending.pop()
+            queued[a] = False
+            for b in edges[a]:
+                new = follow[b] | follow[a]
+                if new != follow[b]:
+                    follow[b] = new
+                    if not queued[b]:
+                        queued[b] = True
+                        pending.append(b)
+
+        for nt in self.non_terminals:
+            self.follow_sets[nt] = self._names(follow[self.symbol_id[nt] - T])
 
     def _compute_first_of_sequence(self, sequence):
-        first = set()
-        all_have_epsilon = True
-        
-        for symbol in sequence:
-            first.update(self.first_sets[symbol] - {''})
-            if '' not in self.first_sets[symbol]:
-                all_have_epsilon = False
-                break
-        
-        if all_have_epsilon:
+        first, nullable = self._first_of_ids(tuple(self.symbol_id[s] for s in sequence if s))
+        first = self._names(first)
+        if nullable:
             first.add('')
-        
         return first
 
-    def _closure(self, items):
+    def _nonterminal_closures(self):
+        """Para cada no terminal A, los items iniciales de las producciones
+        alcanzables desde A por el primer símbolo (la clausura de 'punto
+        antes de A'); indexado por cabeza, sin recorrer toda la gramática"""
+        T = self.n_terminals
+        closures = []
+        for a in range(len(self.non_terminals)):
+            items = []
+            seen = {a}
+            stack = [a]
+            while stack:
+                b = stack.pop()
+                for p in self._prods_by_head[b]:
+                    items.append(self._item_base[p])
+                    body = self._bodies[p]
+                    if body and body[0] >= T and body[0] - T not in seen:
+                        seen.add(body[0] - T)
+                        stack.append(body[0] - T)
+            closures.append(items)
+        return closures
+
+    def _closure(self, kernel):
         """Calcula la clausura de un conjunto de items LR(0)"""
-        closure = set(items)
-        queue = deque(items)
-        
-        while queue:
-            head, body, pos = queue.popleft()
-            if pos < len(body) and body[pos] in self.non_terminals:
-                for prod_head, prod_body in self.productions:
-                    if prod_head == body[pos]:
-                        new_item = (prod_head, prod_body, 0)
-                        if new_item not in closure:
-                            closure.add(new_item)
-                            queue.append(new_item)
+        T = self.n_terminals
+        closure = set(kernel)
+        for item in kernel:
+            s = self._item_next[item]
+            if s >= T:
+                closure.update(self._nt_closures[s - T])
         return closure
 
-    def _goto(self, items, symbol):
-        """Calcula la función GOTO para un conjunto de items"""
-        goto_items = set()
-        for head, body, pos in items:
-            if pos < len(body) and body[pos] == symbol:
-                goto_items.add((head, body, pos + 1))
-        return self._closure(goto_items) if goto_items else set()
-
     def _build_lr0_items(self):
-        """Construye los estados LR(0)"""
-        initial_item = (self.productions[0][0], self.productions[0][1], 0)
-        initial_state = frozenset(self._closure({initial_item}))
-        self.states.append(initial_state)
-        
-        queue = deque([0])
-        state_indices = {initial_state: 0}
-        
-        while queue:
-            current_idx = queue.popleft()
-            current_state = self.states[current_idx]
-            
-            symbols = self.terminals.union(self.non_terminals)
-            for symbol in symbols:
-                new_state = frozenset(self._goto(current_state, symbol))
-                if new_state:
-                    if new_state not in state_indices:
-                        state_indices[new_state] = len(self.states)
-                        self.states.append(new_state)
-                        queue.append(len(self.states) - 1)
-                    next_state_idx = state_indices[new_state]
-                    
-                    if symbol in self.terminals:
-                        self.action_table[current_idx][symbol] = ('shift', next_state_idx)
+        """Construye los estados LR(0); GOTO solo se calcula para los
+        símbolos que aparecen tras un punto en cada estado"""
+        T = self.n_terminals
+        self._nt_closures = self._nonterminal_closures()
+        item_next = self._item_next
+        kernels = {frozenset([self._item_base[0]]): 0}
+        pending = [frozenset([self._item_base[0]])]
+        self._transitions = []
+
+        i = 0
+        while i < len(pending):
+            closure = self._closure(pending[i])
+            self.states.append(frozenset(closure))
+            by_symbol = defaultdict(list)
+            for item in closure:
+                s = item_next[item]
+                if s >= 0:
+                    by_symbol[s].append(item + 1)
+
+            transitions = {}
+            for s in sorted(by_symbol):
+                kernel = frozenset(by_symbol[s])
+                j = kernels.get(kernel)
+                if j is None:
+                    j = kernels[kernel] = len(pending)
+                    pending.append(kernel)
+                transitions[s] = j
+                if s < T:
+                    self.action_table[i][self.symbols[s]] = ('shift', j)
+                else:
+                    self.goto_table[i][self.symbols[s]] = j
+            self._transitions.append(transitions)
+            i += 1
+
+    def item(self, item):
+        """Item como (cabeza, cuerpo, punto) con nombres"""
+        head, body = self.productions[self._item_prod[item]]
+        return head, body, self._item_dot[item]
+
+    def _compute_lalr_lookaheads(self):
+        """Lookaheads LALR(1) con las relaciones de DeRemer y Pennello
+        (DR, reads, includes, lookback) sobre las transiciones por no
+        terminal, resueltas con el algoritmo digraph"""
+        T = self.n_terminals
+        transitions = self._transitions
+        nullable = self._nullable
+
+        index = {}
+        edges = []  # (estado, no terminal, destino)
+        for p, trans in enumerate(transitions):
+            for s, q in trans.items():
+                if s >= T:
+                    index[(p, s)] = len(edges)
+                    edges.append((p, s, q))
+        # Transición virtual que representa la producción inicial: aporta '$'
+        start = len(edges)
+        n = start + 1
+
+        dr = [0] * n
+        reads = [[] for _ in range(n)]
+        for x, (p, a, q) in enumerate(edges):
+            for s, r in transitions[q].items():
+                if s < T:
+                    dr[x] |= 1 << s
+                elif nullable[s - T]:
+                    reads[x].append(index[(q, s)])
+        dr[start] = 1 << self.symbol_id['$']
+        read = self._digraph(dr, reads)
+
+        # Sufijos anulables de cada producción
+        nullable_suffix = []
+        for body in self._bodies:
+            suffix = [True] * (len(body) + 1)
+            for k in range(len(body) - 1, -1, -1):
+                suffix[k] = suffix[k + 1] and body[k] >= T and nullable[body[k] - T]
+            nullable_suffix.append(suffix)
+
+        includes = [[] for _ in range(n)]
+        lookback = defaultdict(list)
+
+        def walk(state, p, x):
+            body = self._bodies[p]
+            suffix = nullable_suffix[p]
+            for k, s in enumerate(body):
+                if s >= T and suffix[k + 1]:
+                    includes[index[(state, s)]].append(x)
+                state = transitions[state][s]
+            lookback[(state, p)].append(x)
+
+        for x, (p, a, q) in enumerate(edges):
+            for prod in self._prods_by_head[a - T]:
+                walk(p, prod, x)
+        walk(0, 0, start)
+
+        follow = self._digraph(read, includes)
+        self._lookaheads = {}
+        for key, xs in lookback.items():
+            bits = 0
+            for x in xs:
+                bits |= follow[x]
+            self._lookaheads[key] = bits
+
+    @staticmethod
+    def _digraph(base, relation):
+        """F(x) = base(x) ∪ ⋃ F(y) para x R y, con las componentes fuertemente
+        conexas resueltas de una vez (versión iterativa de DeRemer–Pennello)"""
+        n = len(base)
+        result = list(base)
+        depth = [0] * n
+        done = n + 2
+        stack = []
+        for root in range(n):
+            if depth[root]:
+                continue
+            stack.append(root)
+            depth[root] = len(stack)
+            calls = [[root, 0, len(stack)]]
+            while calls:
+                frame = calls[-1]
+                x = frame[0]
+                successors = relation[x]
+                if frame[1] < len(successors):
+                    y = successors[frame[1]]
+                    frame[1] += 1
+                    if depth[y] == 0:
+                        stack.append(y)
+                        depth[y] = len(stack)
+                        calls.append([y, 0, len(stack)])
                     else:
-                        self.goto_table[current_idx][symbol] = next_state_idx
+                        if depth[y] < depth[x]:
+                            depth[x] = depth[y]
+                        result[x] |= result[y]
+                    continue
+                calls.pop()
+                if depth[x] == frame[2]:
+                    while True:
+                        z = stack.pop()
+                        depth[z] = done
+                        result[z] = result[x]
+                        if z == x:
+                            break
+                if calls:
+                    parent = calls[-1][0]
+                    if depth[x] < depth[parent]:
+                        depth[parent] = depth[x]
+                    result[parent] |= result[x]
+        return result
 
     def _build_slr_table(self):
-        """Completa la tabla SLR con las reducciones"""
+        """Completa la tabla con las reducciones (FOLLOW de la cabeza en SLR,
+        lookaheads en LALR). Los conflictos se resuelven como antes, el
+        desplazamiento gana, y entre reducciones gana la producción de menor
+        número; todos quedan en self.conflicts"""
+        T = self.n_terminals
+        start = self.symbol_id[self.start_symbol]
         for i, state in enumerate(self.states):
-            for item in state:
-                head, body, pos = item
-                if pos == len(body):
-                    if head == self.productions[0][0]:
-                        self.action_table[i]['$'] = 'accept'  # Cambiado a solo el valor
-                    else:
-                        prod_num = self.prod_index[(head, body)]
-                        for terminal in self.follow_sets[head]:
-                            if terminal in self.action_table[i]:
-                                existing = self.action_table[i][terminal]
-                                if isinstance(existing, tuple) and existing[0] == 'shift':
-                                    continue
-                            self.action_table[i][terminal] = ('reduce', prod_num)
+            row = self.action_table[i]
+            for item in sorted(state, key=self._item_prod.__getitem__):
+                if self._item_next[item] != -1:
+                    continue
+                p = self._item_prod[item]
+                if self._heads[p] == start:
+                    self._set_action(i, row, '$', 'accept')
+                    continue
+                if self.method == 'lalr':
+                    bits = self._lookaheads.get((i, p), 0)
+                else:
+                    bits = self._follow[self._heads[p] - T]
+                while bits:
+                    low = bits & -bits
+                    self._set_action(i, row, self.symbols[low.bit_length() - 1], ('reduce', p))
+                    bits ^= low
+
+    def _set_action(self, state, row, terminal, action):
+        existing = row.get(terminal)
+        if existing is None:
+            row[terminal] = action
+            return
+        if existing == action:
+            return
+        if action == 'accept' or (existing != 'accept' and existing[0] == 'reduce' and action[0] == 'reduce'
+                                  and action[1] < existing[1]):
+            row[terminal] = action
+            self.conflicts.append((state, terminal, action, existing))
+        else:
+            self.conflicts.append((state, terminal, existing, action))
 
     def print_table(self):
         """Imprime la tabla SLR en formato legible"""
@@ -183,7 +401,7 @@ class SLRTableGenerator:
             all_terminals = sorted(self.terminals)
             all_non_terminals = sorted(self.non_terminals - {self.grammar[0][0]})
             
-            print("SLR(1) Parsing Table")
+            print(f"{self.method.upper()}(1) Parsing Table")
             print("="*80)
             print("{:<8}".format("State"), end="")
             
@@ -356,19 +574,29 @@ grammar = [
     ('primario_llamada_opcional', []),
 ]
 
-# Generar la tabla
-try:
-    generator = SLRTableGenerator(grammar)
-    
-    # Mostrar tabla en consola (opcional)
-    generator.print_table()
-    
-    # Exportar a CSV
-    generator.export_to_csv('slr_table.csv')
-    print("\nTabla SLR guardada correctamente en 'slr_table.csv'")
-    
-except Exception as e:
-    print(f"Error al generar la tabla: {e}")
-    print(f"Tipo de error: {type(e).__name__}")
-    import traceback
-    traceback.print_exc()
+# Generar la tabla (python table.py [--lalr])
+if __name__ == '__main__':
+    # Configurar la salida para UTF-8
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    method = 'lalr' if '--lalr' in sys.argv else 'slr'
+    try:
+        generator = SLRTableGenerator(grammar, method)
+        
+        # Mostrar tabla en consola (opcional)
+        generator.print_table()
+        
+        if generator.conflicts:
+            print(f"\n{len(generator.conflicts)} conflictos:")
+            for state, terminal, kept, discarded in generator.conflicts:
+                print(f"  Estado {state}, '{terminal}': {kept} sobre {discarded}")
+        
+        # Exportar a CSV
+        filename = f'{method}_table.csv'
+        generator.export_to_csv(filename)
+        print(f"\nTabla {method.upper()} guardada correctamente en '{filename}'")
+        
+    except Exception as e:
+        print(f"Error al generar la tabla: {e}")
+        print(f"Tipo de error: {type(e).__name__}")
+        import traceback
+        traceback.print_exc()
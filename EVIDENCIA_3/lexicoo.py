@@ -1,6 +1,26 @@
 from valor import Valor
+from bisect import bisect_right
 import ply.lex as lex
 
+
+class SourceMap:
+    """Inicios de línea del código fuente para resolver columnas con búsqueda binaria"""
+
+    def __init__(self, texto):
+        self.texto = texto
+        self.inicios = [0]
+        pos = texto.find('\n')
+        while pos != -1:
+            self.inicios.append(pos + 1)
+            pos = texto.find('\n', pos + 1)
+
+    def linea_columna(self, offset):
+        linea = bisect_right(self.inicios, offset)
+        return linea, offset - self.inicios[linea - 1] + 1
+
+    def columna(self, offset):
+        return offset - self.inicios[bisect_right(self.inicios, offset) - 1] + 1
+
 class Lexico:
     # Lista de nombres de tokens (como lo deseas)
     tokens = (
@@ -57,6 +77,7 @@ class Lexico:
         self.lexer = None
         self.lista_tokens = []
         self.errores = []
+        self.source_map = None
 
     def cargar_desde_archivo(self, archivo):
         """Carga el código fuente desde un archivo"""
@@ -77,6 +98,7 @@ class Lexico:
         if not self.lexer:
             self.construir()
         
+        self.source_map = SourceMap(data)
         self.lexer.input(data)
         self.lista_tokens = []
         
@@ -90,7 +112,7 @@ class Lexico:
                 lexema=tok.value,
                 token=tok.type,
                 linea=tok.lineno,
-                columna=self.find_column(data, tok)
+                columna=self.source_map.columna(tok.lexpos)
             )
             
             self.lista_tokens.append(valor_token)
@@ -98,11 +120,10 @@ class Lexico:
         return self.lista_tokens
 
     def find_column(self, input_text, token):
-        """Calcula la columna exacta del token"""
-        last_newline = input_text.rfind('\n', 0, token.lexpos)
-        if last_newline < 0:
-            return token.lexpos + 1
-        return token.lexpos - last_newline
+        """Calcula la columna exacta del token en `input_text`"""
+        if self.source_map is None or self.source_map.texto != input_text:
+            self.source_map = SourceMap(input_text)
+        return self.source_map.columna(token.lexpos)
 
     # Definición de tokens complejos
     def t_IDENTIFICADOR(self, t):
@@ -136,7 +157,8 @@ class Lexico:
         t.lexer.lineno += len(t.value)
 
     def t_error(self, t):
-        self.errores.append(f"Carácter ilegal '{t.value[0]}' en línea {t.lineno}")
+        linea, columna = self.source_map.linea_columna(t.lexpos)
+        self.errores.append(f"Carácter ilegal '{t.value[0]}' en línea {linea}, columna {columna}")
         t.lexer.skip(1)
 
     def obtener_resultados(self):
@@ -56,6 +56,15 @@ class TablaSimbolos:
     def __init__(self):
         self.tabla = {}  # clave: "ambito::nombre" -> Simbolo
         self.pila_ambitos = ["global"]  # Pila de ámbitos
+        # Índices para buscar con una sola consulta: los símbolos de cada
+        # ámbito, los niveles de la pila en que está abierto cada ámbito y,
+        # por nombre, la pila de (nivel, símbolo) visibles ordenada por nivel
+        # (la del tope es la que encuentra buscar). deshacer[nivel] son los
+        # nombres apilados en ese nivel, que se desapilan al salir de él.
+        self.por_ambito = {}
+        self.niveles = {"global": [0]}
+        self.visibles = {}
+        self.deshacer = [[]]
         self.errores = []
         self.advertencias = []
         self.contador_ambitos = 0
@@ -70,18 +79,38 @@ class TablaSimbolos:
         imprimir.parametros = [('valor', 'any')]  # Acepta cualquier tipo
         imprimir.tipo_retorno = 'void'
         self.tabla['global::imprimir'] = imprimir
+        self._indexar(imprimir)
         
     def entrar_ambito(self, nombre_ambito=None):
         """Entra a un nuevo ámbito"""
         if nombre_ambito is None:
             self.contador_ambitos += 1
             nombre_ambito = f"bloque_{self.contador_ambitos}"
+        nivel = len(self.pila_ambitos)
         self.pila_ambitos.append(nombre_ambito)
+        self.niveles.setdefault(nombre_ambito, []).append(nivel)
+        # Un ámbito con nombre puede volver a abrirse: sus símbolos vuelven
+        # a ser visibles
+        apilados = []
+        for nombre, simbolo in self.por_ambito.get(nombre_ambito, {}).items():
+            self.visibles.setdefault(nombre, []).append((nivel, simbolo))
+            apilados.append(nombre)
+        self.deshacer.append(apilados)
         
     def salir_ambito(self):
         """Sale del ámbito actual"""
         if len(self.pila_ambitos) > 1:
-            self.pila_ambitos.pop()
+            nombre_ambito = self.pila_ambitos.pop()
+            niveles = self.niveles[nombre_ambito]
+            niveles.pop()
+            if not niveles:
+                del self.niveles[nombre_ambito]
+            # Las entradas del nivel que se cierra son las últimas de su pila
+            for nombre in self.deshacer.pop():
+                cadena = self.visibles[nombre]
+                cadena.pop()
+                if not cadena:
+                    del self.visibles[nombre]
             
     def ambito_actual(self):
         """Obtiene el ámbito actual"""
@@ -106,22 +135,35 @@ class TablaSimbolos:
             return False
             
         self.tabla[clave] = simbolo
+        self._indexar(simbolo)
         simbolo.inicializada = True
         return True
         
+    def _indexar(self, simbolo):
+        """Registra el símbolo en los índices de búsqueda"""
+        self.por_ambito.setdefault(simbolo.ambito, {})[simbolo.nombre] = simbolo
+        # Visible en cada nivel de la pila donde su ámbito está abierto (que
+        # no tiene por qué ser el actual: las funciones van a 'global')
+        for nivel in self.niveles.get(simbolo.ambito, ()):
+            cadena = self.visibles.setdefault(simbolo.nombre, [])
+            i = len(cadena)
+            while i and cadena[i - 1][0] > nivel:
+                i -= 1
+            cadena.insert(i, (nivel, simbolo))
+            self.deshacer[nivel].append(simbolo.nombre)
+        
     def buscar(self, nombre, linea_referencia=None):
         """
         Busca un símbolo por nombre, siguiendo la cadena de ámbitos.
         Retorna el símbolo encontrado o None si no existe.
         """
-        # Buscar en orden: ámbito actual hacia global
-        for ambito in reversed(self.pila_ambitos):
-            clave = self.obtener_clave_completa(nombre, ambito)
-            if clave in self.tabla:
-                simbolo = self.tabla[clave]
-                if linea_referencia:
-                    simbolo.agregar_referencia(linea_referencia)
-                return simbolo
+        # El tope de la pila del nombre es el del ámbito abierto más interno
+        cadena = self.visibles.get(nombre)
+        if cadena:
+            simbolo = cadena[-1][1]
+            if linea_referencia:
+                simbolo.agregar_referencia(linea_referencia)
+            return simbolo
         
         # Si no se encuentra, agregar error
         if linea_referencia:
@@ -132,8 +174,7 @@ class TablaSimbolos:
         
     def buscar_en_ambito_actual(self, nombre):
         """Busca un símbolo solo en el ámbito actual"""
-        clave = self.obtener_clave_completa(nombre)
-        return self.tabla.get(clave, None)
+        return self.por_ambito.get(self.ambito_actual(), {}).get(nombre)
         
     def verificar_tipos_compatibles(self, tipo1, tipo2):
         """Verifica si dos tipos son compatibles para asignación"""
@@ -104,62 +104,79 @@ class AnalizadorLL1:
             print(f"Error al cargar la gramática: {e}")
             raise
     
+    def _indexar(self):
+        """Numera los símbolos de forma densa para FIRST/FOLLOW: los terminales
+        son bits (0..T-1) de un entero y los no terminales índices 0..N-1. Los
+        cuerpos quedan como tuplas de enteros, con ~n para el no terminal n
+        (negativo) y sin ε."""
+        self._terminales = sorted(self.terminales)
+        self._no_terminales = sorted(self.no_terminales)
+        id_t = {t: i for i, t in enumerate(self._terminales)}
+        self._id_nt = {nt: i for i, nt in enumerate(self._no_terminales)}
+        self._cuerpos = []
+        for no_terminal in self._no_terminales:
+            for produccion in self.producciones[no_terminal]:
+                simbolos = [] if produccion == self.EPSILON else produccion.split()
+                self._cuerpos.append((self._id_nt[no_terminal], tuple(
+                    ~self._id_nt[s] if s in self._id_nt else id_t[s]
+                    for s in simbolos if s != self.EPSILON)))
+        self._first = [0] * len(self._no_terminales)
+        self._anulable = [False] * len(self._no_terminales)
+
+    def _first_de(self, simbolos, desde=0):
+        """(FIRST como bits, ¿anulable?) de simbolos[desde:]"""
+        resultado = 0
+        for s in simbolos[desde:]:
+            if s >= 0:
+                return resultado | (1 << s), False
+            resultado |= self._first[~s]
+            if not self._anulable[~s]:
+                return resultado, False
+        return resultado, True
+
+    def _conjunto(self, bits):
+        return {t for i, t in enumerate(self._terminales) if bits >> i & 1}
+
     def calcular_first(self):
-        """Calcula el conjunto FIRST para cada símbolo de la gramática"""
+        """Calcula el conjunto FIRST para cada símbolo de la gramática.
+
+        Lista de trabajo sobre bits: cuando FIRST(A) crece solo se vuelven a
+        evaluar las producciones que mencionan A."""
         print("\nCalculando conjuntos FIRST...")
-        
-        # Inicializar conjuntos FIRST
-        for nt in self.no_terminales:
-            self.first[nt] = set()
-        
+        self._indexar()
+        first, anulable = self._first, self._anulable
+
+        usuarios = [[] for _ in self._no_terminales]
+        for p, (_, cuerpo) in enumerate(self._cuerpos):
+            for s in set(cuerpo):
+                if s < 0:
+                    usuarios[~s].append(p)
+
+        pendientes = list(range(len(self._cuerpos)))
+        en_cola = [True] * len(self._cuerpos)
+        while pendientes:
+            p = pendientes.pop()
+            en_cola[p] = False
+            a, cuerpo = self._cuerpos[p]
+            nuevo, es_anulable = self._first_de(cuerpo)
+            nuevo |= first[a]
+            if nuevo != first[a] or (es_anulable and not anulable[a]):
+                first[a] = nuevo
+                anulable[a] = anulable[a] or es_anulable
+                for q in usuarios[a]:
+                    if not en_cola[q]:
+                        en_cola[q] = True
+                        pendientes.append(q)
+
+        # Conjuntos de cadenas para el resto del analizador
+        for nt, i in self._id_nt.items():
+            self.first[nt] = self._conjunto(first[i])
+            if anulable[i]:
+                self.first[nt].add(self.EPSILON)
         for t in self.terminales:
             self.first[t] = {t}
-        
         self.first[self.EPSILON] = {self.EPSILON}
         
-        # Calcular FIRST para no terminales
-        cambio = True
-        while cambio:
-            cambio = False
-            
-            for no_terminal in self.no_terminales:
-                for produccion in self.producciones[no_terminal]:
-                    if produccion == self.EPSILON:
-                        if self.EPSILON not in self.first[no_terminal]:
-                            self.first[no_terminal].add(self.EPSILON)
-                            cambio = True
-                    else:
-                        simbolos = produccion.split()
-                        
-                        # Para cada símbolo en la producción
-                        all_can_be_epsilon = True
-                        for i, simbolo in enumerate(simbolos):
-                            # Si es el primer símbolo que no puede derivar épsilon, nos detenemos
-                            if self.EPSILON not in self.first.get(simbolo, set()):
-                                # Si es un terminal o un no terminal sin épsilon
-                                simbolo_first = self.first.get(simbolo, {simbolo}).copy()
-                                first_size_antes = len(self.first[no_terminal])
-                                self.first[no_terminal].update(simbolo_first)
-                                if len(self.first[no_terminal]) > first_size_antes:
-                                    cambio = True
-                                all_can_be_epsilon = False
-                                break
-                            else:
-                                # Es un símbolo que puede derivar épsilon
-                                simbolo_first = self.first.get(simbolo, {simbolo}).copy()
-                                if self.EPSILON in simbolo_first:
-                                    simbolo_first.remove(self.EPSILON)
-                                
-                                first_size_antes = len(self.first[no_terminal])
-                                self.first[no_terminal].update(simbolo_first)
-                                if len(self.first[no_terminal]) > first_size_antes:
-                                    cambio = True
-                        
-                        # Si todos los símbolos pueden derivar épsilon, añadir épsilon al FIRST
-                        if all_can_be_epsilon and self.EPSILON not in self.first[no_terminal]:
-                            self.first[no_terminal].add(self.EPSILON)
-                            cambio = True
-        
         # Mostrar conjuntos FIRST
         print("Conjuntos FIRST calculados:")
         for nt in sorted(self.no_terminales):
@@ -203,67 +220,44 @@ class AnalizadorLL1:
         return resultado
     
     def calcular_follow(self):
-        """Calcula el conjunto FOLLOW para cada no terminal"""
+        """Calcula el conjunto FOLLOW para cada no terminal.
+
+        Cada aparición A -> αBβ aporta FIRST(β) a FOLLOW(B) una sola vez y,
+        si β es anulable, una arista A → B; después FOLLOW se propaga por las
+        aristas con una lista de trabajo de no terminales que cambiaron."""
         print("\nCalculando conjuntos FOLLOW...")
-        
-        # Inicializar conjuntos FOLLOW
-        for nt in self.no_terminales:
-            self.follow[nt] = set()
-        
+        if not hasattr(self, '_cuerpos'):
+            self.calcular_first()
+
+        follow = [0] * len(self._no_terminales)
+        sucesores = [set() for _ in self._no_terminales]
+        for a, cuerpo in self._cuerpos:
+            for i, s in enumerate(cuerpo):
+                if s >= 0:
+                    continue
+                resto, anulable = self._first_de(cuerpo, i + 1)
+                follow[~s] |= resto
+                if anulable and ~s != a:
+                    sucesores[a].add(~s)
+
         # Regla 1: Añadir $ al FOLLOW del símbolo inicial
-        self.follow[self.simbolo_inicial].add(self.EOF)
-        
-        # Calcular FOLLOW
-        cambio = True
-        iteraciones = 0
-        max_iteraciones = 100  # Límite para evitar bucles infinitos
-        
-        while cambio and iteraciones < max_iteraciones:
-            cambio = False
-            iteraciones += 1
-            
-            for no_terminal in self.no_terminales:
-                for produccion_izq in self.no_terminales:
-                    for produccion in self.producciones[produccion_izq]:
-                        if produccion == self.EPSILON:
-                            continue
-                        
-                        simbolos = produccion.split()
-                        
-                        # Buscar ocurrencias del no terminal en la producción
-                        for i, simbolo in enumerate(simbolos):
-                            if simbolo != no_terminal:
-                                continue
-                            
-                            # Caso: A -> αBβ, añadir FIRST(β) - {ε} a FOLLOW(B)
-                            if i < len(simbolos) - 1:
-                                resto = " ".join(simbolos[i+1:])
-                                first_resto = self.calcular_first_de_cadena(resto)
-                                
-                                # Añadir FIRST(resto) - {ε} a FOLLOW(no_terminal)
-                                follow_size_antes = len(self.follow[no_terminal])
-                                for terminal in first_resto:
-                                    if terminal != self.EPSILON:
-                                        self.follow[no_terminal].add(terminal)
-                                if len(self.follow[no_terminal]) > follow_size_antes:
-                                    cambio = True
-                                
-                                # Caso: A -> αBβ y ε está en FIRST(β), añadir FOLLOW(A) a FOLLOW(B)
-                                if self.EPSILON in first_resto:
-                                    follow_size_antes = len(self.follow[no_terminal])
-                                    self.follow[no_terminal].update(self.follow[produccion_izq])
-                                    if len(self.follow[no_terminal]) > follow_size_antes:
-                                        cambio = True
-                            
-                            # Caso: A -> αB, añadir FOLLOW(A) a FOLLOW(B)
-                            elif i == len(simbolos) - 1:
-                                follow_size_antes = len(self.follow[no_terminal])
-                                self.follow[no_terminal].update(self.follow[produccion_izq])
-                                if len(self.follow[no_terminal]) > follow_size_antes:
-                                    cambio = True
-        
-        if iteraciones >= max_iteraciones:
-            print("Advertencia: Se alcanzó el límite máximo de iteraciones al calcular FOLLOW.")
+        follow[self._id_nt[self.simbolo_inicial]] |= 1 << self._terminales.index(self.EOF)
+
+        pendientes = list(range(len(self._no_terminales)))
+        en_cola = [True] * len(self._no_terminales)
+        while pendientes:
+            a = pendientes.pop()
+            en_cola[a] = False
+            for b in sucesores[a]:
+                nuevo = follow[b] | follow[a]
+                if nuevo != follow[b]:
+                    follow[b] = nuevo
+                    if not en_cola[b]:
+                        en_cola[b] = True
+                        pendientes.append(b)
+
+        for nt, i in self._id_nt.items():
+            self.follow[nt] = self._conjunto(follow[i])
             
         # Mostrar conjuntos FOLLOW
         print("Conjuntos FOLLOW calculados:")
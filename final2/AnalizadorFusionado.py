@@ -0,0 +1,355 @@
+import threading
+from types import MappingProxyType
+
+import AnalizadorLexico as definiciones
+from AnalizadorLexico import (
+    MAX_ERRORES_LEXICOS, DemasiadosErroresLexicos, ErrorLexico, ILEGAL_RE, ResultadoLexico,
+    SourceMap, TablaNombres, fin_cadena, fin_comentario_bloque, lexer as lexer_base,
+    reportar_errores_lexicos,
+)
+from AnalizadorSintactico import Nodo, TOKENS_CON_LEXEMA, id_produccion, no_terminales_lista, ubicacion_token
+from Diagnosticos import reporte_por_defecto
+
+# Front-end fusionado: léxico y sintáctico LL(1) en un solo recorrido.
+#
+# El escáner usa las mismas expresiones maestras que PLY (lexer.lexre) pero
+# no crea un LexToken por token: entrega al parser (tipo, inicio, fin, línea)
+# con el tipo como entero, y el parser decide con una tabla indexada por esos
+# enteros. Solo cuando un terminal se empareja con un nodo del árbol se crea
+# un TokenFusionado (type, value, lineno, lexpos, id) para token_original; el
+# fin de archivo y los tokens que quedan sin consumir tras un error nunca se
+# materializan, y tampoco existe la lista completa de tokens.
+#
+# El árbol, los ids internados y los mensajes (errores léxicos primero, luego
+# el sintáctico) son los mismos que con analizar_texto + parser_ll1 (ver
+# benchmark_fusionado.py --verificar): tras un error sintáctico se termina de
+# escanear para informar todos los errores léxicos. No hay traza paso a paso
+# ni tabla de tokens: para depurar se usan las fases separadas.
+
+TIPOS = tuple(definiciones.tokens) + ('$',)
+CODIGOS = {tipo: codigo for codigo, tipo in enumerate(TIPOS)}
+FIN = CODIGOS['$']
+IDENTIFICADOR = CODIGOS['IDENTIFICADOR']
+NUMERO = CODIGOS['NUMERO']
+CADENA = CODIGOS['CADENA']
+EPSILON = -1  # código de 'epsilon_node' en la pila
+
+# Qué hace el escáner con cada regla de función de AnalizadorLexico
+SIMPLE, ACCION_NUMERO, ACCION_CADENA, ACCION_IDENTIFICADOR, IGNORAR, ACCION_BLOQUE, SALTO = range(7)
+_ACCIONES_FUNCION = {
+    't_NUMERO': ACCION_NUMERO,
+    't_CADENA': ACCION_CADENA,
+    't_IDENTIFICADOR': ACCION_IDENTIFICADOR,
+    't_COMENTARIO_LINEA': IGNORAR,
+    't_COMENTARIO_BLOQUE': ACCION_BLOQUE,
+    't_newline': SALTO,
+}
+
+
+def _expresiones():
+    """[(match, acciones)] por cada expresión maestra de PLY, donde
+    acciones[lastindex] es (acción, código de token)"""
+    expresiones = []
+    for regex, indices in lexer_base.lexre:
+        acciones = [None] * len(indices)
+        for i, entrada in enumerate(indices):
+            if entrada is None:
+                continue
+            funcion, tipo = entrada
+            if funcion is None:
+                acciones[i] = (SIMPLE, CODIGOS[tipo])
+            else:
+                acciones[i] = (_ACCIONES_FUNCION[funcion.__name__], CODIGOS.get(tipo))
+        expresiones.append((regex.match, acciones))
+    return expresiones
+
+
+EXPRESIONES = _expresiones()
+RESERVADAS = {lexema: CODIGOS[tipo] for lexema, tipo in definiciones.reserved_words.items()}
+
+
+class TokenFusionado:
+    """Los atributos de un LexToken que usan el árbol y el semántico"""
+
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'id')
+
+    def __repr__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+def _error(errores, max_errores, tipo, texto, lexpos, fin, lineno):
+    errores.append(ErrorLexico(tipo, texto, lineno, lexpos, fin))
+    if max_errores is not None and len(errores) >= max_errores:
+        raise DemasiadosErroresLexicos(errores)
+
+
+def escanear(data, errores, max_errores=MAX_ERRORES_LEXICOS):
+    """Genera (código, inicio, fin, línea) por token de `data`, terminando con
+    FIN en la posición y línea del último token (como el '$' de parser_ll1).
+    Los errores se agregan a `errores` igual que en AnalizadorLexico."""
+    expresiones = EXPRESIONES
+    ignorar = definiciones.t_ignore
+    reservadas = RESERVADAS
+    longitud = len(data)
+    pos = 0
+    linea = 1
+    ultimo_inicio = ultima_linea = 0
+
+    while pos < longitud:
+        if data[pos] in ignorar:
+            pos += 1
+            continue
+        for match, acciones in expresiones:
+            m = match(data, pos)
+            if m is not None:
+                break
+        else:
+            m_ilegal = ILEGAL_RE.match(data, pos)
+            fin = m_ilegal.end() if m_ilegal else pos + 1
+            _error(errores, max_errores, ErrorLexico.CARACTER_ILEGAL, data[pos:fin], pos, fin, linea)
+            pos = fin
+            continue
+
+        accion, codigo = acciones[m.lastindex]
+        fin = m.end()
+        if accion == SIMPLE or accion == ACCION_NUMERO:
+            pass
+        elif accion == ACCION_IDENTIFICADOR:
+            codigo = reservadas.get(data[pos:fin], IDENTIFICADOR)
+        elif accion == SALTO:
+            linea += fin - pos
+            pos = fin
+            continue
+        elif accion == IGNORAR:
+            pos = fin
+            continue
+        elif accion == ACCION_CADENA:
+            fin = fin_cadena(data, fin)
+            if fin == -1:
+                salto = data.find('\n', pos)
+                fin = salto if salto != -1 else longitud
+                _error(errores, max_errores, ErrorLexico.CADENA_SIN_CERRAR, data[pos:fin], pos, fin, linea)
+                pos = fin
+                continue
+        else:  # ACCION_BLOQUE
+            fin = fin_comentario_bloque(data, fin)
+            if fin == -1:
+                fin = longitud
+                _error(errores, max_errores, ErrorLexico.COMENTARIO_SIN_CERRAR, '/*', pos, fin, linea)
+            linea += data.count('\n', pos, fin)
+            pos = fin
+            continue
+
+        yield codigo, pos, fin, linea
+        ultimo_inicio, ultima_linea = pos, linea
+        pos = fin
+
+    yield FIN, ultimo_inicio, ultimo_inicio, ultima_linea
+
+
+class TablaEnteros:
+    """Tabla LL(1) con símbolos y terminales como enteros.
+
+    filas[código del no terminal][código del token] es (nombres, códigos,
+    cola, id): los nombres de los nodos hijos en orden ('epsilon_node' para ε),
+    sus códigos en orden inverso, listos para apilar, y para los no
+    terminales de lista (ver no_terminales_lista) el código de la cola que
+    continúa en el mismo nodo, o EPSILON en la producción vacía (el ε solo
+    se agrega si la lista quedó vacía); id es el id_produccion de la
+    producción completa, que se anota en Nodo.produccion."""
+
+    def __init__(self, parsing_table):
+        self.simbolos = {tipo: codigo for tipo, codigo in CODIGOS.items()}
+        for no_terminal in parsing_table:
+            self.simbolos.setdefault(no_terminal, len(self.simbolos))
+        self.simbolos['ε'] = EPSILON
+        listas = no_terminales_lista(parsing_table)
+        self.filas = {}
+        for no_terminal, fila in parsing_table.items():
+            fila_enteros = {}
+            for terminal, cuerpo in fila.items():
+                if terminal not in CODIGOS:
+                    continue
+                cola = None
+                id_p = id_produccion(no_terminal, cuerpo)
+                if no_terminal in listas:
+                    if tuple(cuerpo) == ('ε',):
+                        cola = EPSILON
+                    elif cuerpo[-1] == no_terminal:
+                        cola = self.simbolos[no_terminal]
+                        cuerpo = cuerpo[:-1]
+                nombres = tuple('epsilon_node' if s == 'ε' else s for s in cuerpo)
+                codigos = tuple(self.codigo(s) for s in reversed(cuerpo))
+                fila_enteros[CODIGOS[terminal]] = (nombres, codigos, cola, id_p)
+            self.filas[self.simbolos[no_terminal]] = fila_enteros
+        self.nombres = {codigo: simbolo for simbolo, codigo in self.simbolos.items()}
+        self.nombres[EPSILON] = 'epsilon_node'
+
+    def codigo(self, simbolo):
+        # Símbolos que solo aparecen en cuerpos (terminales desconocidos)
+        return self.simbolos.setdefault(simbolo, len(self.simbolos))
+
+
+_tablas_enteros = {}
+_candado_tablas = threading.Lock()
+MAX_TABLAS_ENTEROS = 8  # tablas congeladas distintas que se recuerdan a la vez
+
+
+def tabla_enteros(parsing_table):
+    """TablaEnteros de `parsing_table`. Solo se recuerda la conversión de las
+    tablas congeladas (tabla_compartida / congelar_tabla), que no pueden
+    cambiar; un dict mutable se convierte en cada llamada para que una
+    edición en el sitio nunca deje códigos viejos."""
+    if not isinstance(parsing_table, MappingProxyType):
+        return TablaEnteros(parsing_table)
+    with _candado_tablas:
+        entrada = _tablas_enteros.get(id(parsing_table))
+        if entrada is None or entrada[0] is not parsing_table:
+            # Se guarda la tabla original para que su id no se reutilice
+            # mientras está en la caché; la más antigua sale al pasar el límite
+            if len(_tablas_enteros) >= MAX_TABLAS_ENTEROS:
+                del _tablas_enteros[next(iter(_tablas_enteros))]
+            entrada = _tablas_enteros[id(parsing_table)] = (parsing_table, TablaEnteros(parsing_table))
+    return entrada[1]
+
+
+def _crear_token(data, codigo, inicio, fin, linea, nombres, constantes):
+    tok = TokenFusionado()
+    tok.type = TIPOS[codigo]
+    tok.lineno = linea
+    tok.lexpos = inicio
+    if codigo == IDENTIFICADOR:
+        tok.id = nombres.internar(data[inicio:fin])
+        tok.value = nombres[tok.id]
+    elif codigo == NUMERO:
+        texto = data[inicio:fin]
+        valor = float(texto) if '.' in texto else int(texto)
+        tok.id = constantes.internar(valor, (valor.__class__, valor))
+        tok.value = constantes[tok.id]
+    elif codigo == CADENA:
+        tok.id = constantes.internar(data[inicio + 1:fin - 1])
+        tok.value = constantes[tok.id]
+    elif codigo == FIN:
+        tok.value = '$'
+    else:
+        tok.value = data[inicio:fin]
+    return tok
+
+
+def _token_error(data, codigo, inicio, fin, linea):
+    # Para los mensajes de error: sin internar nada
+    tok = TokenFusionado()
+    tok.type = TIPOS[codigo]
+    tok.lineno = linea
+    tok.lexpos = inicio
+    tok.value = '$' if codigo == FIN else data[inicio:fin]
+    return tok
+
+
+def analizar_fusionado(data, parsing_table, start_symbol='PROGRAMA', reporte=None,
+                       max_errores=MAX_ERRORES_LEXICOS):
+    """Léxico y sintáctico de `data` en un solo recorrido. Devuelve
+    (raiz, resultado): el árbol (None si hubo error o se abandonó el léxico) y
+    un ResultadoLexico sin lista de tokens (tokens=None) con el source map,
+    las tablas de nombres y constantes y los errores léxicos."""
+    reporte = reporte or reporte_por_defecto()
+    resultado = ResultadoLexico(None, SourceMap(data), TablaNombres(), TablaNombres(), [])
+    if not parsing_table:
+        reporte.error('sintactico', "Error: La tabla de parsing no se cargó correctamente.")
+        return None, resultado
+
+    escaner = escanear(data, resultado.errores, max_errores)
+    try:
+        raiz, error = _parsear(data, escaner.__next__, tabla_enteros(parsing_table), parsing_table,
+                               start_symbol, resultado)
+        if error is not None:
+            for _ in escaner:
+                pass
+    except DemasiadosErroresLexicos as e:
+        reportar_errores_lexicos(e.errores, resultado.source_map, abortado=True, reporte=reporte)
+        return None, resultado
+
+    reportar_errores_lexicos(resultado.errores, resultado.source_map, reporte=reporte)
+    if error is not None:
+        error(reporte)
+        return None, resultado
+    reporte.info('sintactico', "Análisis sintáctico: entrada aceptada")
+    return raiz, resultado
+
+
+def _error_vacia(reporte):
+    reporte.error('sintactico', "Error: La lista de tokens está vacía.")
+
+
+def _parsear(data, siguiente, tabla, parsing_table, start_symbol, resultado):
+    """Devuelve (raiz, None) si la entrada es aceptada o (None, error), donde
+    error(reporte) emite los mensajes del error sintáctico"""
+    filas = tabla.filas
+    nombres_simbolos = tabla.nombres
+    con_lexema = {CODIGOS[tipo] for tipo in TOKENS_CON_LEXEMA}
+    nombres = resultado.nombres
+    constantes = resultado.constantes
+
+    codigo, inicio, fin, linea = siguiente()
+    if codigo == FIN:
+        return None, _error_vacia
+
+    raiz = Nodo(start_symbol)
+    pila = [(FIN, None), (tabla.simbolos.get(start_symbol, len(tabla.simbolos)), raiz)]
+    pop = pila.pop
+    apilar = pila.extend
+
+    while pila:
+        simbolo, nodo = pop()
+        if simbolo == codigo:
+            # Emparejamiento: recién aquí el token existe como objeto
+            if nodo is not None:
+                tok = _crear_token(data, codigo, inicio, fin, linea, nombres, constantes)
+                nodo.token_original = tok
+                if codigo in con_lexema:
+                    nodo.hijos.append(Nodo(str(tok.value), tok))
+            if codigo == FIN:
+                return raiz, None
+            codigo, inicio, fin, linea = siguiente()
+            continue
+        if simbolo == EPSILON:
+            continue
+
+        fila = filas.get(simbolo)
+        if fila is None:
+            esperado = nombres_simbolos.get(simbolo, start_symbol)
+            tok = _token_error(data, codigo, inicio, fin, linea)
+
+            def error(reporte):
+                if reporte.resumen:
+                    reporte.error('sintactico', f"\n❌ Error Sintáctico: Se esperaba '{esperado}' pero se encontró '{tok.type}' (valor: '{tok.value}') en la {ubicacion_token(tok, resultado.source_map)}",
+                                  esperado=esperado, token=tok.type, linea=tok.lineno, posicion=tok.lexpos)
+            return None, error
+
+        produccion = fila.get(codigo)
+        if produccion is None:
+            no_terminal = nombres_simbolos[simbolo]
+            tok = _token_error(data, codigo, inicio, fin, linea)
+
+            def error(reporte):
+                if reporte.resumen:
+                    reporte.error('sintactico', f"\n❌ Error Sintáctico: No hay regla para ({no_terminal}, {tok.type}) en la {ubicacion_token(tok, resultado.source_map)}",
+                                  no_terminal=no_terminal, token=tok.type, linea=tok.lineno, posicion=tok.lexpos)
+                    reporte.error('sintactico', f"Token problemático: valor='{tok.value}', tipo='{tok.type}'")
+                    reporte.error('sintactico', f"Posibles tokens para '{no_terminal}': {list(parsing_table[no_terminal].keys())}")
+            return None, error
+
+        nombres_hijos, codigos, cola, id_p = produccion
+        if nodo.produccion is None:
+            nodo.produccion = id_p
+        if cola is not None:
+            if cola != EPSILON:
+                pila.append((cola, nodo))
+            elif nodo.hijos:
+                continue
+        hijos = list(map(Nodo, nombres_hijos))
+        nodo.hijos.extend(hijos)
+        hijos.reverse()
+        apilar(zip(codigos, hijos))
+
+    return None, _error_vacia  # no se llega: '$' está siempre al fondo
@@ -2,10 +2,196 @@ import ply.lex as lex
 from prettytable import PrettyTable
 import os
 import re
+import threading
+from bisect import bisect_right
+from contextlib import contextmanager
+
+from Diagnosticos import DEPURACION, configurar, reporte_por_defecto
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # Solo la carpeta actual
 
 
+class SourceMap:
+    """Traduce desplazamientos (lexpos) a línea/columna.
+
+    Se construye una sola vez por archivo guardando el desplazamiento donde
+    empieza cada línea; cada consulta es una búsqueda binaria, por lo que
+    los tokens solo guardan lexpos y la columna se calcula cuando se necesita.
+    """
+
+    def __init__(self, texto):
+        # Acepta str o un buffer de bytes (bytes, mmap); en este último caso
+        # las columnas se cuentan en bytes
+        salto = '\n' if isinstance(texto, str) else b'\n'
+        inicios = [0]
+        pos = texto.find(salto)
+        while pos != -1:
+            inicios.append(pos + 1)
+            pos = texto.find(salto, pos + 1)
+        self.inicios = inicios
+
+    def extender(self, trozo, base):
+        """Agrega los inicios de línea de `trozo`, que empieza en el
+        desplazamiento `base` del texto (para texto que llega por partes)"""
+        inicios = self.inicios
+        pos = trozo.find('\n')
+        while pos != -1:
+            inicios.append(base + pos + 1)
+            pos = trozo.find('\n', pos + 1)
+
+    def linea(self, offset):
+        return bisect_right(self.inicios, offset)
+
+    def columna(self, offset):
+        return offset - self.inicios[bisect_right(self.inicios, offset) - 1] + 1
+
+    def linea_columna(self, offset):
+        linea = bisect_right(self.inicios, offset)
+        return linea, offset - self.inicios[linea - 1] + 1
+
+    def ubicacion(self, offset):
+        linea, columna = self.linea_columna(offset)
+        return f"línea {linea}, columna {columna}"
+
+
+class TablaNombres:
+    """Tabla de internado de una compilación.
+
+    A cada valor distinto le asigna un id entero denso (0, 1, 2, ...) y guarda
+    un único objeto por valor. El léxico usa una para los identificadores
+    (lexer.nombres) y otra como pool de constantes NUMERO/CADENA
+    (lexer.constantes); las fases siguientes comparan e indexan por id.
+    """
+
+    def __init__(self):
+        self.ids = {}
+        self.valores = []
+
+    def internar(self, valor, clave=None):
+        if clave is None:
+            clave = valor
+        id_valor = self.ids.get(clave)
+        if id_valor is None:
+            id_valor = len(self.valores)
+            self.ids[clave] = id_valor
+            self.valores.append(valor)
+        return id_valor
+
+    def __getitem__(self, id_valor):
+        return self.valores[id_valor]
+
+    def __len__(self):
+        return len(self.valores)
+
+
+def fin_comentario_bloque(texto, inicio):
+    """Posición siguiente al '*/' que cierra un comentario cuyo contenido
+    empieza en `inicio`, o -1 si no se cierra. Acepta str o bytes/mmap."""
+    cierre = texto.find('*/' if isinstance(texto, str) else b'*/', inicio)
+    return cierre + 2 if cierre != -1 else -1
+
+
+def fin_cadena(texto, inicio):
+    """Posición siguiente a la comilla que cierra una cadena cuyo contenido
+    empieza en `inicio` (justo después de la comilla de apertura), o -1 si no
+    se cierra en la misma línea. Una comilla precedida por un número impar de
+    barras invertidas está escapada. Acepta str o bytes/mmap."""
+    comilla = texto[inicio - 1:inicio]
+    if isinstance(texto, str):
+        salto, barra = '\n', '\\'
+    else:
+        salto, barra = b'\n', 0x5C
+    limite = texto.find(salto, inicio)
+    if limite == -1:
+        limite = len(texto)
+    pos = inicio
+    while True:
+        cierre = texto.find(comilla, pos, limite)
+        if cierre == -1:
+            return -1
+        # Las barras anteriores nunca van más atrás de pos: ahí hay una comilla
+        barras = cierre
+        while barras > pos and texto[barras - 1] == barra:
+            barras -= 1
+        if (cierre - barras) % 2 == 0:
+            return cierre + 1
+        pos = cierre + 1
+
+
+# Máximo de errores léxicos antes de abandonar el archivo (None: sin límite)
+MAX_ERRORES_LEXICOS = 100
+
+
+class ErrorLexico:
+    """Error léxico estructurado.
+
+    El léxico solo acumula estos registros en lexer.errores; mostrarlos es
+    trabajo de reportar_errores_lexicos. Una racha de caracteres ilegales
+    consecutivos es un único error que abarca [lexpos, fin).
+    """
+
+    CARACTER_ILEGAL = 'caracter_ilegal'
+    CADENA_SIN_CERRAR = 'cadena_sin_cerrar'
+    COMENTARIO_SIN_CERRAR = 'comentario_sin_cerrar'
+
+    __slots__ = ('tipo', 'texto', 'lineno', 'lexpos', 'fin')
+
+    def __init__(self, tipo, texto, lineno, lexpos, fin):
+        self.tipo = tipo
+        self.texto = texto
+        self.lineno = lineno
+        self.lexpos = lexpos
+        self.fin = fin
+
+    @property
+    def mensaje(self):
+        if self.tipo == ErrorLexico.CADENA_SIN_CERRAR:
+            return "Cadena sin cerrar"
+        if self.tipo == ErrorLexico.COMENTARIO_SIN_CERRAR:
+            return "Comentario de bloque sin cerrar"
+        if len(self.texto) == 1:
+            return f"Carácter ilegal '{self.texto}'"
+        muestra = self.texto if len(self.texto) <= 20 else self.texto[:20] + '...'
+        return f"{len(self.texto)} caracteres ilegales '{muestra}'"
+
+    def formatear(self, source_map=None):
+        if source_map:
+            return f"{self.mensaje} en la {source_map.ubicacion(self.lexpos)}"
+        return f"{self.mensaje} en la línea {self.lineno}, posición {self.lexpos}"
+
+    def __repr__(self):
+        return f"ErrorLexico({self.tipo},{self.texto!r},{self.lineno},{self.lexpos},{self.fin})"
+
+
+class DemasiadosErroresLexicos(Exception):
+    """Se alcanzó lexer.max_errores; lleva la lista de errores acumulados"""
+
+    def __init__(self, errores):
+        super().__init__(f"Demasiados errores léxicos ({len(errores)})")
+        self.errores = errores
+
+
+def registrar_error(lexer, tipo, lexpos, fin, lineno, texto=None):
+    if texto is None:
+        texto = lexer.lexdata[lexpos:fin]
+    errores = lexer.errores
+    errores.append(ErrorLexico(tipo, texto, lineno, lexpos, fin))
+    if lexer.max_errores is not None and len(errores) >= lexer.max_errores:
+        raise DemasiadosErroresLexicos(errores)
+
+
+def reportar_errores_lexicos(errores, source_map=None, abortado=False, reporte=None):
+    """Envía los errores acumulados por el léxico al reporte"""
+    reporte = reporte or reporte_por_defecto()
+    if not reporte.resumen:
+        return
+    for error in errores:
+        reporte.error('lexico', error.formatear(source_map), tipo=error.tipo, texto=error.texto,
+                      linea=error.lineno, posicion=error.lexpos, fin=error.fin)
+    if abortado:
+        reporte.error('lexico', f"Demasiados errores léxicos ({len(errores)}); se abandona el análisis")
+
+
 # Lista de tokens actualizada para SERPY
 tokens = [
     # Palabras reservadas
@@ -65,23 +251,42 @@ t_ignore = ' \t\r'
 
 # Manejo de números (enteros y decimales)
 def t_NUMERO(t):
-    r'\d+\.\d+|\d+'
+    r'[0-9]+\.[0-9]+|[0-9]+'
     if '.' in t.value:
-        t.value = float(t.value)
+        valor = float(t.value)
     else:
-        t.value = int(t.value)
+        valor = int(t.value)
+    # El tipo forma parte de la clave para no mezclar 1 y 1.0 en el pool
+    t.id = t.lexer.constantes.internar(valor, (valor.__class__, valor))
+    t.value = t.lexer.constantes[t.id]
     return t
 
-# Manejo de cadenas entre comillas dobles o simples
+# Manejo de cadenas entre comillas dobles o simples.
+# La regla solo reconoce la comilla de apertura; el cierre se busca con
+# fin_cadena (str.find) en lugar de una alternancia en la expresión regular.
 def t_CADENA(t):
-    r'\"([^\\\n]|(\\.))*?\"|\'([^\\\n]|(\\.))*?\''
-    t.value = t.value[1:-1]  # Eliminar las comillas
+    r'\"|\''
+    datos = t.lexer.lexdata
+    fin = fin_cadena(datos, t.lexer.lexpos)
+    if fin == -1:
+        # Un solo error y se descarta el resto de la línea
+        salto = datos.find('\n', t.lexpos)
+        t.lexer.lexpos = salto if salto != -1 else len(datos)
+        registrar_error(t.lexer, ErrorLexico.CADENA_SIN_CERRAR, t.lexpos, t.lexer.lexpos, t.lineno)
+        return None
+    t.lexer.lexpos = fin
+    t.id = t.lexer.constantes.internar(datos[t.lexpos + 1:fin - 1])  # Sin las comillas
+    t.value = t.lexer.constantes[t.id]
     return t
 
 # Manejo de identificadores y palabras reservadas
 def t_IDENTIFICADOR(t):
     r'[a-zA-Z_][a-zA-Z0-9_]*'
     t.type = reserved_words.get(t.value, 'IDENTIFICADOR')
+    if t.type == 'IDENTIFICADOR':
+        # Todas las apariciones de un nombre comparten id y objeto str
+        t.id = t.lexer.nombres.internar(t.value)
+        t.value = t.lexer.nombres[t.id]
     return t
 
 # Comentarios de línea (comienzan con #)
@@ -89,10 +294,17 @@ def t_COMENTARIO_LINEA(t):
     r'\#.*'
     pass  # Ignorar comentarios
 
-# Comentarios de bloque (/* ... */)
+# Comentarios de bloque (/* ... */); el cierre se busca con str.find.
+# Un comentario sin cerrar se informa una vez y llega hasta el final del archivo.
 def t_COMENTARIO_BLOQUE(t):
-    r'/\*(.|\n)*?\*/'
-    t.lexer.lineno += t.value.count('\n')  # Actualizar contador de líneas
+    r'/\*'
+    datos = t.lexer.lexdata
+    fin = fin_comentario_bloque(datos, t.lexer.lexpos)
+    if fin == -1:
+        fin = len(datos)
+        registrar_error(t.lexer, ErrorLexico.COMENTARIO_SIN_CERRAR, t.lexpos, fin, t.lineno, '/*')
+    t.lexer.lineno += datos.count('\n', t.lexpos, fin)  # Actualizar contador de líneas
+    t.lexer.lexpos = fin
     pass  # Ignorar comentarios
 
 # Manejo de saltos de línea
@@ -101,57 +313,183 @@ def t_newline(t):
     t.lexer.lineno += len(t.value)
 
 # Manejo de errores
+# Los caracteres ilegales consecutivos se agrupan en un solo error
 def t_error(t):
-    print(f"Carácter ilegal '{t.value[0]}' en la línea {t.lineno}, posición {t.lexpos}")
-    t.lexer.skip(1)
+    m = ILEGAL_RE.match(t.lexer.lexdata, t.lexpos)
+    fin = m.end() if m else t.lexpos + 1
+    t.lexer.lexpos = fin
+    registrar_error(t.lexer, ErrorLexico.CARACTER_ILEGAL, t.lexpos, fin, t.lineno)
 
 # Construir el lexer
 lexer = lex.lex()
+lexer.source_map = None
+lexer.nombres = TablaNombres()
+lexer.constantes = TablaNombres()
+lexer.errores = []
+lexer.max_errores = MAX_ERRORES_LEXICOS
+
+# Racha de caracteres que no se ignoran ni empiezan ningún token (PLY
+# compila sus reglas con re.VERBOSE)
+ILEGAL_RE = re.compile(
+    '(?:(?!' + '|'.join(regex.pattern for regex, _ in lexer.lexre) + ')[^' + re.escape(t_ignore) + '])+',
+    re.VERBOSE,
+)
+
+# Lexers reentrantes.
+#
+# lex.lex() (validar las reglas y compilar las expresiones maestras) se hace
+# una sola vez para el `lexer` de arriba; cada compilación trabaja con un
+# clon propio tomado de un pool, de modo que varios hilos pueden lexear a la
+# vez sin compartir lexdata, lexpos, lineno ni las tablas de nombres.
+
+def preparar_lexer(lex_instancia, data):
+    """Deja un lexer listo para una compilación nueva de `data`"""
+    lex_instancia.source_map = SourceMap(data)
+    lex_instancia.nombres = TablaNombres()
+    lex_instancia.constantes = TablaNombres()
+    lex_instancia.errores = []
+    lex_instancia.max_errores = MAX_ERRORES_LEXICOS
+    lex_instancia.input(data)
+    lex_instancia.lineno = 1
+    return lex_instancia
+
+
+class PoolLexers:
+    """Lexers independientes clonados del lexer maestro y reutilizados"""
+
+    def __init__(self, maestro):
+        self.maestro = maestro
+        self._libres = []
+        self._candado = threading.Lock()
+
+    def obtener(self):
+        with self._candado:
+            lex_instancia = self._libres.pop() if self._libres else None
+        if lex_instancia is None:
+            lex_instancia = self.maestro.clone()
+        return lex_instancia
+
+    def devolver(self, lex_instancia):
+        # No retener el texto ni los resultados de la compilación anterior
+        lex_instancia.input('')
+        lex_instancia.source_map = lex_instancia.nombres = lex_instancia.constantes = None
+        lex_instancia.errores = []
+        with self._candado:
+            self._libres.append(lex_instancia)
+
+    @contextmanager
+    def prestar(self):
+        lex_instancia = self.obtener()
+        try:
+            yield lex_instancia
+        finally:
+            self.devolver(lex_instancia)
+
+
+pool_lexers = PoolLexers(lexer)
+
 
-# Función para analizar un archivo (mantenida para compatibilidad con el main)
-def analyze_file(filepath):
+class ResultadoLexico:
+    """Lo que produce el léxico para una compilación; no depende de ningún lexer"""
+
+    __slots__ = ('tokens', 'source_map', 'nombres', 'constantes', 'errores')
+
+    def __init__(self, tokens, source_map, nombres, constantes, errores):
+        self.tokens = tokens
+        self.source_map = source_map
+        self.nombres = nombres
+        self.constantes = constantes
+        self.errores = errores
+
+
+def lexear_todo(lex_instancia):
+    return list(iter(lex_instancia.token, None))
+
+
+def analizar_texto(data, reporte=None, lexear=lexear_todo):
+    """Lexea `data` con un lexer del pool. Es reentrante: se puede llamar
+    desde varios hilos a la vez. Devuelve un ResultadoLexico, o None si se
+    alcanzó el máximo de errores.
+
+    `lexear` recibe el lexer ya preparado y devuelve la lista de tokens
+    (ver AnalizadorLexicoNumpy)."""
+    reporte = reporte or reporte_por_defecto()
+    with pool_lexers.prestar() as lex_instancia:
+        preparar_lexer(lex_instancia, data)
+        try:
+            tokens_list = lexear(lex_instancia)
+        except DemasiadosErroresLexicos as e:
+            reportar_errores_lexicos(e.errores, lex_instancia.source_map, abortado=True, reporte=reporte)
+            return None
+        resultado = ResultadoLexico(tokens_list, lex_instancia.source_map, lex_instancia.nombres,
+                                    lex_instancia.constantes, lex_instancia.errores)
+
+    reportar_errores_lexicos(resultado.errores, resultado.source_map, reporte=reporte)
+    if reporte.resumen:
+        reporte.info('lexico', f"Análisis léxico: {len(tokens_list)} tokens, {len(resultado.errores)} errores",
+                     tokens=len(tokens_list), errores=len(resultado.errores))
+
+    # La tabla de tokens solo se arma en modo depuración
+    if reporte.depuracion:
+        table = PrettyTable(["Tipo", "Valor", "Línea", "Posición"])
+        for tok in tokens_list:
+            table.add_row([tok.type, tok.value, tok.lineno, tok.lexpos])
+        reporte.debug('lexico', "\nTokens encontrados:")
+        reporte.debug('lexico', str(table))
+    return resultado
+
+
+def analizar_archivo(filepath, reporte=None, lexear=lexear_todo):
+    """Como analizar_texto pero leyendo el archivo"""
+    reporte = reporte or reporte_por_defecto()
     try:
         with open(filepath, 'r', encoding='utf-8') as file:
             data = file.read()
     except FileNotFoundError:
-        print(f"Error: No se encontró el archivo '{filepath}'.")
+        reporte.error('lexico', f"Error: No se encontró el archivo '{filepath}'.")
         return None
     except Exception as e:
-        print(f"Error al leer el archivo: {e}")
+        reporte.error('lexico', f"Error al leer el archivo: {e}")
         return None
+    return analizar_texto(data, reporte, lexear)
 
-    lexer.input(data)
-    tokens_list = []
-    table = PrettyTable(["Tipo", "Valor", "Línea", "Posición"])
-    tokens_output_for_file = []
 
-    while True:
-        tok = lexer.token()
-        if not tok:
-            break
-        tokens_list.append(tok)
-        tokens_output_for_file.append(str(tok.type))
-        table.add_row([tok.type, tok.value, tok.lineno, tok.lexpos])
-
-    print("\nTokens encontrados:")
-    print(table)
-
-    # Guardar tokens en archivo para depuración
-    tokens_output_path = os.path.join(BASE_DIR, "Outputs", "tokens_output.txt")
-    os.makedirs(os.path.dirname(tokens_output_path), exist_ok=True)
-    
-    try:
-        with open(tokens_output_path, 'w', encoding='utf-8') as output_file:
-            for tok in tokens_list:
-                output_file.write(f"{tok.type} {tok.value} {tok.lineno} {tok.lexpos}\n")
-        print(f"\nTokens guardados en: {tokens_output_path}")
-    except IOError as e:
-        print(f"Error al escribir el archivo de tokens: {e}")
+# Función para analizar un archivo (mantenida para compatibilidad con el main).
+# Además de devolver los tokens deja source_map, nombres, constantes y errores
+# en el `lexer` global, así que no es segura entre hilos: para compilar en
+# paralelo usar analizar_archivo / analizar_texto.
+def analyze_file(filepath, reporte=None):
+    reporte = reporte or reporte_por_defecto()
+    resultado = analizar_archivo(filepath, reporte)
+    if resultado is None:
+        return None
+
+    # El mapa de líneas se comparte con el sintáctico y el semántico
+    lexer.source_map = resultado.source_map
+    lexer.nombres = resultado.nombres
+    lexer.constantes = resultado.constantes
+    lexer.errores = resultado.errores
+    tokens_list = resultado.tokens
+
+    # El archivo de tokens solo se escribe en modo depuración
+    if reporte.depuracion:
+        # Guardar tokens en archivo para depuración
+        tokens_output_path = os.path.join(BASE_DIR, "Outputs", "tokens_output.txt")
+        os.makedirs(os.path.dirname(tokens_output_path), exist_ok=True)
+
+        try:
+            with open(tokens_output_path, 'w', encoding='utf-8') as output_file:
+                for tok in tokens_list:
+                    output_file.write(f"{tok.type} {tok.value} {tok.lineno} {tok.lexpos}\n")
+            reporte.debug('lexico', f"\nTokens guardados en: {tokens_output_path}")
+        except IOError as e:
+            reporte.error('lexico', f"Error al escribir el archivo de tokens: {e}")
 
     return tokens_list
 
 # Ejecución independiente para pruebas
 if __name__ == '__main__':
+    configurar(DEPURACION)
     archivo_entrada_path = os.path.join(BASE_DIR, "Inputs", "programa.serpy")
     
     if not os.path.exists(archivo_entrada_path):
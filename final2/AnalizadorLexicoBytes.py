@@ -0,0 +1,217 @@
+import mmap
+import os
+import re
+
+import AnalizadorLexico as definiciones
+from AnalizadorLexico import (DemasiadosErroresLexicos, ErrorLexico, SourceMap,
+                              fin_cadena, fin_comentario_bloque, reportar_errores_lexicos)
+from Diagnosticos import reporte_por_defecto
+
+# Analizador léxico sobre bytes para archivos grandes.
+#
+# En lugar de leer y decodificar todo el archivo a un str (lo que duplica la
+# memoria y obliga a una pasada de UTF-8 antes de empezar), se mapea el
+# archivo con mmap y se aplican las mismas expresiones regulares de
+# AnalizadorLexico compiladas como patrones de bytes. Las posiciones (lexpos)
+# son desplazamientos en bytes y los lexemas solo se decodifican cuando se
+# pide tok.value (analyze_file_mmap copia el lexema de cada token antes de
+# cerrar el mapeo). Como en AnalizadorLexico, las reglas de cadenas y
+# comentarios de bloque solo reconocen el delimitador de apertura y el cierre
+# se busca con fin_cadena/fin_comentario_bloque.
+
+# Tokens que no se entregan al sintáctico
+IGNORADOS = {'newline', 'COMENTARIO_LINEA', 'COMENTARIO_BLOQUE'}
+
+PALABRAS_RESERVADAS = {k.encode('ascii'): v for k, v in definiciones.reserved_words.items()}
+
+
+def _reglas():
+    """Reglas en el mismo orden que usa PLY: primero las funciones en orden
+    de definición y luego las cadenas de mayor a menor longitud"""
+    funciones = []
+    cadenas = []
+    for nombre, obj in vars(definiciones).items():
+        if not nombre.startswith('t_') or nombre in ('t_error', 't_ignore'):
+            continue
+        if callable(obj):
+            funciones.append((obj.__code__.co_firstlineno, nombre[2:], obj.__doc__))
+        elif isinstance(obj, str):
+            cadenas.append((nombre[2:], obj))
+    funciones.sort()
+    cadenas.sort(key=lambda regla: len(regla[1]), reverse=True)
+    return [(nombre, regex) for _, nombre, regex in funciones] + cadenas
+
+
+MASTER_RE = re.compile(b'|'.join(
+    b'(?P<' + nombre.encode('ascii') + b'>' + regex.encode('utf-8') + b')'
+    for nombre, regex in _reglas()
+))
+IGNORAR_RE = re.compile(b'[' + re.escape(definiciones.t_ignore.encode('ascii')) + b']+')
+# Racha de bytes que no se ignoran ni empiezan ningún token; como ningún
+# token empieza con un byte >= 0x80, siempre abarca secuencias UTF-8 completas
+ILEGAL_RE = re.compile(
+    b'(?:(?!' + MASTER_RE.pattern + b')[^' + re.escape(definiciones.t_ignore.encode('ascii')) + b'])+'
+)
+
+BLOQUE_CONTEO = 16 * 1024 * 1024
+
+
+class TokenBytes:
+    """Token con las mismas claves que LexToken (type, value, lineno, lexpos)
+    cuyo valor se decodifica de forma perezosa desde el buffer"""
+
+    __slots__ = ('type', 'lineno', 'lexpos', 'fin', 'buffer', 'base', '_valor')
+
+    def __init__(self, tipo, buffer, inicio, fin, lineno):
+        self.type = tipo
+        self.buffer = buffer
+        self.base = 0 # desplazamiento del buffer en el archivo
+        self.lexpos = inicio
+        self.fin = fin
+        self.lineno = lineno
+        self._valor = None
+
+    @property
+    def lexema(self):
+        return self.buffer[self.lexpos - self.base:self.fin - self.base]
+
+    def desligar(self):
+        # Copia el lexema para que el token no dependa del mmap, que se cierra
+        self.buffer = self.lexema
+        self.base = self.lexpos
+
+    @property
+    def value(self):
+        if self._valor is None:
+            crudo = self.lexema
+            if self.type == 'NUMERO':
+                self._valor = float(crudo) if b'.' in crudo else int(crudo)
+            elif self.type == 'CADENA':
+                self._valor = crudo[1:-1].decode('utf-8')
+            else:
+                self._valor = crudo.decode('utf-8')
+        return self._valor
+
+    @value.setter
+    def value(self, valor):
+        self._valor = valor
+
+    def __repr__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+def _error(errores, max_errores, tipo, texto, pos, fin, lineno):
+    error = ErrorLexico(tipo, texto.decode('utf-8', 'replace'), lineno, pos, fin)
+    if errores is None:
+        reportar_errores_lexicos([error])
+        return
+    errores.append(error)
+    if max_errores is not None and len(errores) >= max_errores:
+        raise DemasiadosErroresLexicos(errores)
+
+
+def tokens_bytes(buffer, errores=None, inicio=0, limite=None, lineno=1, max_errores=None):
+    """Genera TokenBytes sobre cualquier objeto tipo bytes (bytes, mmap).
+
+    inicio/limite permiten lexear solo una ventana del buffer sin copiarla; las
+    posiciones siguen siendo absolutas y las líneas se cuentan desde lineno.
+    Los errores se agregan a `errores` como ErrorLexico (o van al reporte por
+    defecto si no se pasa una lista); al llegar a max_errores se lanza
+    DemasiadosErroresLexicos.
+    """
+    match_ilegal = ILEGAL_RE.match
+    match_token = MASTER_RE.match
+    match_ignorar = IGNORAR_RE.match
+    reservadas = PALABRAS_RESERVADAS
+    pos = inicio
+    longitud = len(buffer) if limite is None else limite
+
+    while pos < longitud:
+        m = match_ignorar(buffer, pos, longitud)
+        if m:
+            pos = m.end()
+            if pos >= longitud:
+                break
+
+        m = match_token(buffer, pos, longitud)
+        if m is None:
+            # Un solo error para toda la racha de caracteres ilegales
+            fin = match_ilegal(buffer, pos, longitud).end()
+            _error(errores, max_errores, ErrorLexico.CARACTER_ILEGAL, buffer[pos:fin], pos, fin, lineno)
+            pos = fin
+            continue
+
+        tipo = m.lastgroup
+        fin = m.end()
+        if tipo == 'CADENA':
+            fin = fin_cadena(buffer, fin)
+            if fin == -1 or fin > longitud:
+                fin = buffer.find(b'\n', pos, longitud)
+                fin = fin if fin != -1 else longitud
+                _error(errores, max_errores, ErrorLexico.CADENA_SIN_CERRAR, buffer[pos:fin], pos, fin, lineno)
+                pos = fin
+                continue
+        if tipo in IGNORADOS:
+            if tipo == 'newline':
+                lineno += fin - pos
+            elif tipo == 'COMENTARIO_BLOQUE':
+                fin = fin_comentario_bloque(buffer, fin)
+                if fin == -1 or fin > longitud:
+                    fin = longitud
+                    _error(errores, max_errores, ErrorLexico.COMENTARIO_SIN_CERRAR, b'/*', pos, fin, lineno)
+                lineno += contar_saltos(buffer, pos, fin)
+        else:
+            if tipo == 'IDENTIFICADOR':
+                tipo = reservadas.get(buffer[pos:fin], 'IDENTIFICADOR')
+            yield TokenBytes(tipo, buffer, pos, fin, lineno)
+        pos = fin
+
+
+def contar_saltos(buffer, inicio, fin):
+    """Cuenta saltos de línea en buffer[inicio:fin]. mmap no tiene count(),
+    así que se copia por bloques acotados."""
+    if isinstance(buffer, bytes):
+        return buffer.count(b'\n', inicio, fin)
+    total = 0
+    for pos in range(inicio, fin, BLOQUE_CONTEO):
+        total += buffer[pos:min(pos + BLOQUE_CONTEO, fin)].count(b'\n')
+    return total
+
+
+def abrir_mmap(filepath):
+    """Mapea el archivo en modo lectura; los archivos vacíos devuelven b''.
+    El archivo se cierra enseguida; el mapeo se libera con cerrar_mmap."""
+    with open(filepath, 'rb') as archivo:
+        if os.fstat(archivo.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def cerrar_mmap(buffer):
+    if isinstance(buffer, mmap.mmap):
+        buffer.close()
+
+
+def analyze_file_mmap(filepath, errores=None, max_errores=None):
+    """Equivalente a analyze_file para archivos grandes: sin decodificar el
+    archivo, sin tabla ni archivo de salida. Devuelve (tokens, source_map);
+    el SourceMap trabaja en desplazamientos de bytes."""
+    try:
+        buffer = abrir_mmap(filepath)
+    except FileNotFoundError:
+        reporte_por_defecto().error('lexico', f"Error: No se encontró el archivo '{filepath}'.")
+        return None, None
+    except Exception as e:
+        reporte_por_defecto().error('lexico', f"Error al leer el archivo: {e}")
+        return None, None
+
+    try:
+        tokens = list(tokens_bytes(buffer, errores, max_errores=max_errores))
+        for tok in tokens:
+            tok.desligar()
+        return tokens, SourceMap(buffer)
+    except DemasiadosErroresLexicos as e:
+        reportar_errores_lexicos(e.errores, abortado=True)
+        return None, None
+    finally:
+        cerrar_mmap(buffer)
@@ -0,0 +1,138 @@
+import codecs
+
+from AnalizadorLexico import (
+    MAX_ERRORES_LEXICOS, DemasiadosErroresLexicos, ErrorLexico, SourceMap, TablaNombres,
+    lexer as lexer_base,
+)
+
+# Léxico "push" para fuentes que llegan por partes (tuberías, sockets).
+#
+# feed(bytes) decodifica el trozo y lexea hasta el último salto de línea
+# recibido: con las reglas de AnalizadorLexico ningún token, cadena ni
+# comentario de línea cruza un '\n', así que todo lo anterior ya es
+# definitivo. La excepción es un comentario de bloque abierto: se retiene
+# desde su '/*' hasta que llegue el '*/' (buscándolo solo en lo nuevo) o hasta
+# close(), que lexea el resto con el final de archivo real.
+#
+# Los tokens, ids internados, errores y números de línea son los mismos que
+# con analizar_texto sobre el texto completo; lexpos es el desplazamiento en
+# el texto decodificado completo.
+
+
+class LexerFlujo:
+    """Lexer incremental: feed() y close() devuelven los tokens completos"""
+
+    def __init__(self, encoding='utf-8', max_errores=MAX_ERRORES_LEXICOS):
+        self.decodificador = codecs.getincrementaldecoder(encoding)()
+        self.source_map = SourceMap('')
+        self.nombres = TablaNombres()
+        self.constantes = TablaNombres()
+        self.errores = []
+        self.max_errores = max_errores
+        self.lineno = 1
+        self.cerrado = False
+
+        self._pendiente = ''   # texto recibido y todavía no lexeado
+        self._base = 0         # desplazamiento de _pendiente en el texto completo
+        self._recibidos = 0    # caracteres decodificados hasta ahora
+        self._buscar_cierre = None  # con un comentario abierto, desde dónde buscar '*/'
+
+        # Cada flujo tiene su propio lexer; el límite de errores se aplica
+        # aquí porque un comentario sin cerrar puede ser provisional
+        self.lexer = lexer_base.clone()
+        self.lexer.source_map = self.source_map
+        self.lexer.nombres = self.nombres
+        self.lexer.constantes = self.constantes
+        self.lexer.errores = self.errores
+        self.lexer.max_errores = None
+
+    def feed(self, datos):
+        """Agrega `datos` (bytes) y devuelve la lista de tokens completados"""
+        if self.cerrado:
+            raise ValueError("feed() después de close()")
+        trozo = self.decodificador.decode(datos)
+        if not trozo:
+            return []
+        self.source_map.extender(trozo, self._recibidos)
+        self._recibidos += len(trozo)
+        self._pendiente += trozo
+
+        if self._buscar_cierre is not None:
+            # Comentario de bloque abierto al principio de _pendiente
+            cierre = self._pendiente.find('*/', self._buscar_cierre)
+            if cierre == -1:
+                self._buscar_cierre = max(len(self._pendiente) - 1, 0)
+                return []
+            self._buscar_cierre = None
+
+        corte = self._pendiente.rfind('\n') + 1
+        if corte == 0:
+            return []
+        return self._lexear(corte, final=False)
+
+    def close(self):
+        """Termina el flujo y devuelve los tokens que quedaban"""
+        if self.cerrado:
+            return []
+        self.cerrado = True
+        trozo = self.decodificador.decode(b'', final=True)
+        if trozo:
+            self.source_map.extender(trozo, self._recibidos)
+            self._recibidos += len(trozo)
+            self._pendiente += trozo
+        self._buscar_cierre = None
+        return self._lexear(len(self._pendiente), final=True)
+
+    def _lexear(self, corte, final):
+        """Lexea _pendiente[:corte]; lo que no queda resuelto se retiene"""
+        lexer = self.lexer
+        base = self._base
+        errores = self.errores
+        antes = len(errores)
+
+        lexer.input(self._pendiente[:corte])
+        lexer.lineno = self.lineno
+        tokens = []
+        try:
+            for tok in iter(lexer.token, None):
+                tok.lexpos += base
+                tokens.append(tok)
+        finally:
+            # Los errores de este trozo tienen posiciones relativas
+            for error in errores[antes:]:
+                error.lexpos += base
+                error.fin += base
+
+        nuevos = errores[antes:]
+        if (not final and nuevos and nuevos[-1].tipo == ErrorLexico.COMENTARIO_SIN_CERRAR):
+            # El comentario todavía puede cerrarse: se retiene desde el '/*'
+            error = errores.pop()
+            inicio = error.lexpos - base
+            self.lineno = error.lineno
+            # Hasta `corte` ya se sabe que no hay '*/'
+            self._buscar_cierre = max(corte - inicio - 1, 2)
+            corte = inicio
+        else:
+            self.lineno = lexer.lineno
+
+        self._pendiente = self._pendiente[corte:]
+        self._base = base + corte
+        if self.max_errores is not None and len(errores) >= self.max_errores:
+            del errores[self.max_errores:]
+            raise DemasiadosErroresLexicos(errores)
+        return tokens
+
+
+def tokens_de_flujo(flujo, tamano=1 << 16, encoding='utf-8', max_errores=MAX_ERRORES_LEXICOS):
+    """Genera los tokens de un archivo binario o socket a medida que llegan
+    los datos (usa read() o, si no existe, recv()). Devuelve el LexerFlujo,
+    con los errores y el source map, como valor de retorno del generador."""
+    leer = getattr(flujo, 'read', None) or flujo.recv
+    lexer = LexerFlujo(encoding, max_errores)
+    while True:
+        datos = leer(tamano)
+        if not datos:
+            break
+        yield from lexer.feed(datos)
+    yield from lexer.close()
+    return lexer
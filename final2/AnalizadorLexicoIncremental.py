@@ -0,0 +1,139 @@
+from bisect import bisect_left
+
+from AnalizadorLexico import SourceMap, TablaNombres, lexer as lexer_base
+
+# Re-análisis léxico incremental para el editor.
+#
+# Tras una edición (reemplazar texto[inicio:fin] por otro texto) solo se
+# vuelve a lexear desde el inicio del último token anterior a la línea
+# editada: una comilla sin cerrar en esa misma línea pudo haberse convertido
+# en una cadena. Todo token empieza con el lexer en su estado inicial (fuera de un
+# comentario de bloque), así que en cuanto un token nuevo posterior a la
+# zona editada empieza donde empezaba uno viejo, el resto de la secuencia es
+# la misma: se reutiliza desplazando posiciones y líneas. Con los errores
+# léxicos pasa lo mismo: se conservan los anteriores a la zona relexeada y
+# los posteriores a la resincronización, desplazados.
+
+
+def nuevo_lexer():
+    # clone() comparte los atributos agregados al lexer base; cada buffer
+    # necesita sus propias tablas de nombres y constantes y su propia lista
+    # de errores, sin límite
+    lexer = lexer_base.clone()
+    lexer.source_map = None
+    lexer.nombres = TablaNombres()
+    lexer.constantes = TablaNombres()
+    lexer.errores = []
+    lexer.max_errores = None
+    return lexer
+
+
+def _desplazar(tokens, desde, delta_pos, delta_lineas):
+    if delta_lineas:
+        for i in range(desde, len(tokens)):
+            tok = tokens[i]
+            tok.lexpos += delta_pos
+            tok.lineno += delta_lineas
+    elif delta_pos:
+        for i in range(desde, len(tokens)):
+            tokens[i].lexpos += delta_pos
+
+
+def _desplazar_errores(errores, delta_pos, delta_lineas):
+    for error in errores:
+        error.lexpos += delta_pos
+        error.fin += delta_pos
+        error.lineno += delta_lineas
+
+
+def relexear(texto, tokens, inicio, fin_viejo, largo_nuevo, lexer):
+    """Actualiza `tokens` (resultado de lexear el texto anterior) para `texto`,
+    que es el texto anterior con [inicio, fin_viejo) reemplazado por
+    `largo_nuevo` caracteres.
+
+    `lexer` es el que produjo `tokens` (ver nuevo_lexer): los tokens nuevos
+    se internan en sus mismas tablas de nombres y constantes, y lexer.errores
+    queda con los errores de todo `texto`.
+
+    Devuelve (tokens, desde, eliminados, insertados): la nueva lista y el
+    rango que cambió respecto a la anterior, para que el sintáctico pueda
+    acotar su propio trabajo.
+    """
+    delta = largo_nuevo - (fin_viejo - inicio)
+    fin_nuevo = inicio + largo_nuevo
+
+    # Un comentario sin cerrar llega hasta el final del archivo sin producir
+    # tokens, así que el último token anterior a la línea siempre está fuera
+    # de cualquier comentario que la edición pueda abrir o cerrar
+    limite = texto.rfind('\n', 0, inicio) + 1
+
+    # Último token que empieza antes de la línea editada
+    desde = bisect_left(tokens, limite, key=lambda t: t.lexpos) - 1
+    if desde >= 0:
+        reinicio = tokens[desde].lexpos
+        linea = tokens[desde].lineno
+    else:
+        desde, reinicio, linea = 0, 0, 1
+
+    # Los errores de la zona relexeada se vuelven a registrar al lexearla
+    errores_viejos = lexer.errores
+    lexer.errores = []
+    lexer.input(texto)
+    lexer.lexpos = reinicio
+    lexer.lineno = linea
+
+    nuevos = []
+    resto = len(tokens)
+    errores_despues = []
+    while True:
+        tok = lexer.token()
+        if tok is None:
+            break
+        if tok.lexpos >= fin_nuevo:
+            # Resincronización: ¿había un token viejo en la misma posición?
+            pos_vieja = tok.lexpos - delta
+            m = bisect_left(tokens, pos_vieja, lo=desde, key=lambda t: t.lexpos)
+            if m < len(tokens) and tokens[m].lexpos == pos_vieja and tokens[m].type == tok.type:
+                resto = m
+                delta_lineas = tok.lineno - tokens[m].lineno
+                errores_despues = [e for e in errores_viejos if e.lexpos >= pos_vieja]
+                _desplazar(tokens, m, delta, delta_lineas)
+                _desplazar_errores(errores_despues, delta, delta_lineas)
+                break
+        nuevos.append(tok)
+
+    errores_antes = [e for e in errores_viejos if e.lexpos < reinicio]
+    lexer.errores = errores_antes + lexer.errores + errores_despues
+
+    eliminados = resto - desde
+    tokens[desde:resto] = nuevos
+    return tokens, desde, eliminados, len(nuevos)
+
+
+class LexerIncremental:
+    """Mantiene el texto y los tokens de un buffer del editor"""
+
+    def __init__(self, texto=''):
+        self.lexer = nuevo_lexer()
+        self.texto = texto
+        self.lexer.input(texto)
+        self.lexer.lineno = 1
+        self.tokens = list(iter(self.lexer.token, None))
+        self._source_map = None
+
+    def editar(self, inicio, fin, reemplazo):
+        """Reemplaza texto[inicio:fin] por `reemplazo` y actualiza los tokens.
+        Devuelve (desde, eliminados, insertados) como relexear. Al terminar,
+        lexer.errores tiene los errores de todo el texto nuevo."""
+        self.texto = self.texto[:inicio] + reemplazo + self.texto[fin:]
+        self._source_map = None
+        _, desde, eliminados, insertados = relexear(
+            self.texto, self.tokens, inicio, fin, len(reemplazo), self.lexer)
+        return desde, eliminados, insertados
+
+    @property
+    def source_map(self):
+        # Se reconstruye solo si alguien pide líneas/columnas tras editar
+        if self._source_map is None:
+            self._source_map = SourceMap(self.texto)
+        return self._source_map
@@ -0,0 +1,247 @@
+import re
+
+import ply.lex as lex
+
+import AnalizadorLexico as definiciones
+from AnalizadorLexico import analizar_archivo, analizar_texto, lexer as lexer_base
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa el lexer escalar
+    np = None
+
+# Pre-escaneo vectorizado con NumPy para archivos grandes generados por
+# máquina.
+#
+# Cada carácter se traduce a una clase (espacio, salto, letra, dígito, otro)
+# con una tabla de 256 entradas y, con operaciones sobre arreglos, se obtienen
+# de una vez los límites de todas las rachas de letras/dígitos, las
+# posiciones de los demás caracteres y las de los saltos de línea. El bucle
+# escalar solo recorre esos "eventos": los espacios no se visitan, las
+# rachas de palabra se convierten directamente en IDENTIFICADOR / palabra
+# reservada / NUMERO (con las mismas funciones de regla de AnalizadorLexico),
+# la puntuación de un carácter que no puede empezar otro token se resuelve
+# con un diccionario y todo lo demás (operadores dobles, cadenas, comentarios,
+# caracteres ilegales) se delega en el lexer PLY desde esa posición.
+#
+# El resultado es idéntico al de analizar_texto / analyze_file: mismos
+# tokens, ids internados, errores y números de línea.
+
+NUMPY_DISPONIBLE = np is not None
+
+ESPACIO, SALTO, LETRA, DIGITO, OTRO = range(5)
+
+
+def _tabla_clases():
+    tabla = np.full(256, OTRO, dtype=np.uint8)
+    for caracter in definiciones.t_ignore:
+        tabla[ord(caracter)] = ESPACIO
+    tabla[ord('\n')] = SALTO
+    for caracter in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_':
+        tabla[ord(caracter)] = LETRA
+    for caracter in '0123456789':
+        tabla[ord(caracter)] = DIGITO
+    return tabla
+
+
+def _simples():
+    """Caracteres que siempre forman por sí solos el mismo token de una regla
+    de cadena, sea cual sea el carácter siguiente (p. ej. '(' o ';', pero no
+    '=' por '==' ni '/' por '/*')"""
+    siguientes = [chr(i) for i in range(32, 127)] + ['\n', '\t', '']
+    simples = {}
+    for codigo in range(33, 127):
+        caracter = chr(codigo)
+        tipos = set()
+        for siguiente in siguientes:
+            for regex, indice in lexer_base.lexre:
+                m = regex.match(caracter + siguiente)
+                if m:
+                    funcion, tipo = indice[m.lastindex]
+                    tipos.add(tipo if funcion is None and m.end() == 1 else None)
+                    break
+            else:
+                tipos.add(None)
+        if len(tipos) == 1 and None not in tipos:
+            simples[caracter] = tipos.pop()
+    return simples
+
+
+if NUMPY_DISPONIBLE:
+    CLASES = _tabla_clases()
+SIMPLES = _simples()
+NUMERO_RE = re.compile(definiciones.t_NUMERO.__doc__)
+
+
+# Caracteres por ventana de pre-escaneo: acota la memoria de los arreglos
+VENTANA = 1 << 20
+
+
+def pre_escaneo(data, inicio=0, fin=None, linea=1):
+    """Pre-escanea data[inicio:fin], que debe terminar en un salto de línea
+    o en el final del texto. Devuelve (eventos, fines, lineas, saltos):
+    - eventos: inicio de cada racha de letras/dígitos y posición de cada
+      carácter de clase OTRO, en orden (como lista);
+    - fines: fin de la racha para los eventos de palabra, -1 para los demás;
+    - lineas: línea de cada evento, contando desde `linea`;
+    - saltos: cantidad de '\\n' en la ventana."""
+    ventana = data[inicio:fin]
+    if ventana.isascii():
+        codigos = np.frombuffer(ventana.encode('ascii'), dtype=np.uint8)
+    else:
+        # Un elemento por carácter para que las posiciones sean las del str
+        codigos = np.minimum(np.frombuffer(ventana.encode('utf-32-le'), dtype=np.uint32), 255)
+    clases = CLASES[codigos]
+
+    palabra = (clases == LETRA) | (clases == DIGITO)
+    anterior = np.empty_like(palabra)
+    anterior[0] = False
+    anterior[1:] = palabra[:-1]
+    siguiente = np.empty_like(palabra)
+    siguiente[-1] = False
+    siguiente[:-1] = palabra[1:]
+    inicio_palabra = palabra & ~anterior
+    fin_palabra = np.flatnonzero(palabra & ~siguiente) + 1
+
+    es_evento = inicio_palabra | (clases == OTRO)
+    eventos = np.flatnonzero(es_evento)
+    fines = np.full(len(eventos), -1, dtype=np.int64)
+    fines[inicio_palabra[eventos]] = fin_palabra + inicio
+
+    saltos = np.flatnonzero(clases == SALTO)
+    lineas = np.searchsorted(saltos, eventos) + linea
+    return (eventos + inicio).tolist(), fines.tolist(), lineas.tolist(), len(saltos)
+
+
+def lexear_numpy(lex_instancia):
+    """Reemplazo de lexear_todo para analizar_texto (lexer ya preparado)"""
+    data = lex_instancia.lexdata
+
+    # Con una sola expresión maestra los operadores se resuelven sin PLY
+    match_maestra, indices = lex_instancia.lexre[0] if len(lex_instancia.lexre) == 1 else (None, None)
+    tokens = []
+    agregar = tokens.append
+    pos = 0
+    linea_ventana = 1
+    inicio_ventana = 0
+    longitud = len(data)
+
+    while inicio_ventana < longitud:
+        # Las ventanas terminan en un salto de línea, así que ninguna racha de
+        # palabra queda partida; un token de PLY sí puede pasar a la siguiente
+        # ventana y sus eventos se saltean igual que dentro de una
+        fin_ventana = data.find('\n', inicio_ventana + VENTANA)
+        fin_ventana = longitud if fin_ventana == -1 else fin_ventana + 1
+        eventos, fines, lineas, saltos = pre_escaneo(data, inicio_ventana, fin_ventana, linea_ventana)
+        pos = _lexear_eventos(lex_instancia, data, eventos, fines, lineas, pos, agregar,
+                              match_maestra, indices)
+        linea_ventana += saltos
+        inicio_ventana = fin_ventana
+
+    lex_instancia.lexpos = longitud
+    lex_instancia.lineno = linea_ventana
+    return tokens
+
+
+def _lexear_eventos(lex_instancia, data, eventos, fines, lineas, pos, agregar, match_maestra, indices):
+    """Recorre los eventos de una ventana; devuelve la posición consumida"""
+    # Identificadores y números: lo mismo que t_IDENTIFICADOR y t_NUMERO
+    # pero sin pasar por PLY ni llamar a la regla
+    reservadas = definiciones.reserved_words
+    nombres = lex_instancia.nombres
+    constantes = lex_instancia.constantes
+    ids_nombres = nombres.ids
+    valores_nombres = nombres.valores
+    match_numero = NUMERO_RE.match
+    simples = SIMPLES
+    LexToken = lex.LexToken
+
+    for inicio, fin, linea in zip(eventos, fines, lineas):
+        if inicio < pos:
+            # Ya consumido por un token anterior (comentario, cadena, número
+            # decimal que siguió en esta racha...); solo queda el resto de una
+            # racha de palabra, que está en la misma línea
+            if fin <= pos:
+                continue
+            inicio = pos
+
+        if fin != -1:
+            # Racha de letras y dígitos: números e identificadores pegados
+            while inicio < fin:
+                tok = LexToken()
+                if data[inicio] <= '9':
+                    m = match_numero(data, inicio)
+                    tok.lexpos = inicio
+                    texto = m.group()
+                    valor = float(texto) if '.' in texto else int(texto)
+                    id_valor = constantes.internar(valor, (valor.__class__, valor))
+                    tok.type = 'NUMERO'
+                    tok.value = constantes.valores[id_valor]
+                    tok.id = id_valor
+                    inicio = m.end()
+                else:
+                    lexema = data[inicio:fin]
+                    tipo = reservadas.get(lexema)
+                    if tipo is None:
+                        id_nombre = ids_nombres.get(lexema)
+                        if id_nombre is None:
+                            id_nombre = nombres.internar(lexema)
+                        tok.type = 'IDENTIFICADOR'
+                        tok.value = valores_nombres[id_nombre]
+                        tok.id = id_nombre
+                    else:
+                        tok.type = tipo
+                        tok.value = lexema
+                    tok.lexpos = inicio
+                    inicio = fin
+                tok.lineno = linea
+                tok.lexer = lex_instancia
+                agregar(tok)
+            pos = inicio
+            continue
+
+        caracter = data[inicio]
+        tipo = simples.get(caracter)
+        if tipo is None and match_maestra is not None:
+            # Operadores de la tabla de reglas de cadena ('==', '=', '<', ...)
+            m = match_maestra.match(data, inicio)
+            if m is not None:
+                funcion, tipo = indices[m.lastindex]
+                if funcion is not None:
+                    tipo = None
+                else:
+                    caracter = m.group()
+        if tipo is not None:
+            tok = LexToken()
+            tok.type = tipo
+            tok.value = caracter
+            tok.lineno = linea
+            tok.lexpos = inicio
+            agregar(tok)
+            pos = inicio + len(caracter)
+            continue
+
+        # El resto lo resuelve PLY desde aquí (cadenas, comentarios y
+        # caracteres ilegales; puede consumir varios tokens ignorados antes
+        # de devolver uno)
+        lex_instancia.lexpos = inicio
+        lex_instancia.lineno = linea
+        tok = lex_instancia.token()
+        pos = lex_instancia.lexpos
+        if tok is None:
+            break
+        agregar(tok)
+    return pos
+
+
+def analizar_texto_numpy(data, reporte=None):
+    """analizar_texto con el pre-escaneo de NumPy si está instalado"""
+    if not NUMPY_DISPONIBLE:
+        return analizar_texto(data, reporte)
+    return analizar_texto(data, reporte, lexear=lexear_numpy)
+
+
+def analizar_archivo_numpy(filepath, reporte=None):
+    if not NUMPY_DISPONIBLE:
+        return analizar_archivo(filepath, reporte)
+    return analizar_archivo(filepath, reporte, lexear=lexear_numpy)
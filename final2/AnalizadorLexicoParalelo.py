@@ -0,0 +1,168 @@
+import os
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import AnalizadorLexico as definiciones
+from AnalizadorLexico import SourceMap
+from AnalizadorLexico import (DemasiadosErroresLexicos, fin_cadena, fin_comentario_bloque,
+                              reportar_errores_lexicos)
+from Diagnosticos import reporte_por_defecto
+from AnalizadorLexicoBytes import TokenBytes, abrir_mmap, cerrar_mmap, contar_saltos, tokens_bytes
+
+# Análisis léxico paralelo de un solo archivo grande.
+#
+# El único estado del lexer que cruza líneas es estar dentro de un
+# comentario /* ... */ (las cadenas no pueden contener saltos de línea).
+# Se eligen puntos de corte justo después de un salto de línea; un pre-escaneo
+# secuencial que solo salta comentarios y cadenas decide si el corte cae
+# dentro de un comentario de bloque y, en ese caso, lo mueve al final del
+# comentario. Así cada trozo empieza en el estado inicial y se puede lexear en
+# un proceso distinto. Al final se unen los resultados corrigiendo las líneas.
+
+TIPOS = tuple(definiciones.tokens)
+CODIGOS = {tipo: i for i, tipo in enumerate(TIPOS)}
+
+# Aperturas de los tokens que pueden contener '/*' o '*/' sin abrir un comentario
+PRE_ESCANEO_RE = re.compile('|'.join(
+    regla.__doc__ for regla in (
+        definiciones.t_CADENA,
+        definiciones.t_COMENTARIO_BLOQUE,
+    )
+).encode('utf-8') + rb'|\#')
+
+
+def fin_construccion(buffer, m):
+    """Dónde termina la cadena o comentario que abre `m`, igual que en el lexer"""
+    apertura = m.group()
+    if apertura == b'/*':
+        fin = fin_comentario_bloque(buffer, m.end())
+        return fin if fin != -1 else len(buffer)
+    if apertura == b'#':
+        fin = -1
+    else:
+        fin = fin_cadena(buffer, m.end())
+    if fin == -1:
+        # Comentario de línea o cadena sin cerrar: hasta el salto de línea
+        fin = buffer.find(b'\n', m.end())
+        return fin if fin != -1 else len(buffer)
+    return fin
+
+
+def puntos_de_corte(buffer, trozos):
+    """Devuelve los límites [0, c1, ..., len] de los trozos a lexear"""
+    longitud = len(buffer)
+    candidatos = []
+    for k in range(1, trozos):
+        salto = buffer.find(b'\n', k * longitud // trozos)
+        if salto == -1:
+            break
+        candidatos.append(salto + 1)
+
+    # Pre-escaneo: si un corte cae dentro de un comentario de bloque se mueve
+    # al final del comentario, donde el lexer vuelve al estado inicial
+    cortes = []
+    pendientes = iter(candidatos)
+    corte = next(pendientes, None)
+    pos = 0
+    while corte is not None:
+        m = PRE_ESCANEO_RE.search(buffer, pos)
+        if m is None:
+            break
+        fin = fin_construccion(buffer, m)
+        while corte is not None and corte <= m.start():
+            cortes.append(corte)
+            corte = next(pendientes, None)
+        while corte is not None and corte < fin:
+            corte = next(pendientes, None)
+            if not cortes or cortes[-1] != fin:
+                cortes.append(fin)
+        pos = fin
+    while corte is not None:
+        cortes.append(corte)
+        corte = next(pendientes, None)
+
+    limites = [0]
+    for corte in cortes:
+        if limites[-1] < corte < longitud:
+            limites.append(corte)
+    limites.append(longitud)
+    return limites
+
+
+def lexear_trozo(ruta, inicio, fin, max_errores=None):
+    """Trabajo de cada proceso: lexea buffer[inicio:fin] y devuelve arreglos
+    compactos (código de tipo, inicio, fin, línea relativa) en lugar de objetos.
+    Si el trozo solo llega a max_errores se devuelven los errores y None."""
+    buffer = abrir_mmap(ruta)
+    codigos = array('B')
+    inicios = array('q')
+    fines = array('q')
+    lineas = array('l')
+    errores = []
+    try:
+        for tok in tokens_bytes(buffer, errores, inicio, fin, lineno=0, max_errores=max_errores):
+            codigos.append(CODIGOS[tok.type])
+            inicios.append(tok.lexpos)
+            fines.append(tok.fin)
+            lineas.append(tok.lineno)
+        return codigos, inicios, fines, lineas, errores, contar_saltos(buffer, inicio, fin)
+    except DemasiadosErroresLexicos:
+        return None, None, None, None, errores, None
+    finally:
+        cerrar_mmap(buffer)
+
+
+def analyze_file_paralelo(filepath, procesos=None, errores=None, max_errores=None):
+    """Como analyze_file_mmap pero repartiendo el archivo entre procesos.
+    Devuelve (tokens, source_map) con posiciones en bytes."""
+    try:
+        buffer = abrir_mmap(filepath)
+    except FileNotFoundError:
+        reporte_por_defecto().error('lexico', f"Error: No se encontró el archivo '{filepath}'.")
+        return None, None
+    try:
+        tokens, source_map = _lexear_paralelo(filepath, buffer, procesos, errores, max_errores)
+        for tok in tokens or ():
+            tok.desligar()
+        return tokens, source_map
+    finally:
+        cerrar_mmap(buffer)
+
+
+def _lexear_paralelo(filepath, buffer, procesos, errores, max_errores):
+    procesos = procesos or os.cpu_count() or 1
+    limites = puntos_de_corte(buffer, procesos)
+    rangos = list(zip(limites, limites[1:]))
+
+    if procesos == 1 or len(rangos) == 1:
+        resultados = [lexear_trozo(filepath, inicio, fin, max_errores) for inicio, fin in rangos]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            resultados = list(pool.map(lexear_trozo, [filepath] * len(rangos),
+                                       [inicio for inicio, _ in rangos],
+                                       [fin for _, fin in rangos],
+                                       [max_errores] * len(rangos)))
+
+    # Los errores se acumulan siempre; se imprimen al final si no hay lista
+    acumulados = errores if errores is not None else []
+    tokens = []
+    agregar = tokens.append
+    base = 1
+    for codigos, inicios, fines, lineas, errores_trozo, saltos in resultados:
+        for error in errores_trozo:
+            error.lineno += base
+        acumulados.extend(errores_trozo)
+        if saltos is None or (max_errores is not None and len(acumulados) >= max_errores):
+            break
+        for codigo, inicio, fin, linea in zip(codigos, inicios, fines, lineas):
+            agregar(TokenBytes(TIPOS[codigo], buffer, inicio, fin, linea + base))
+        base += saltos
+
+    if max_errores is not None and len(acumulados) >= max_errores:
+        reportar_errores_lexicos(acumulados, abortado=True)
+        return None, None
+    if errores is None:
+        reportar_errores_lexicos(acumulados)
+
+    return tokens, SourceMap(buffer)
@@ -1,840 +1,1295 @@
-import os
-from collections import defaultdict
-
-# Importar clases y funciones del analizador sintáctico si es necesario
-# from AnalizadorSintactico import Nodo, parser_ll1, cargar_tabla_desde_csv, exportar_arbol_a_graphviz
-# from AnalizadorLexico import analyze_file
-
-# Definición de tipos de datos básicos para SERPY
-class Tipo:
-    def __init__(self, nombre):
-        self.nombre = nombre
-
-    def __eq__(self, other):
-        return isinstance(other, Tipo) and self.nombre == other.nombre
-
-    def __hash__(self):
-        return hash(self.nombre)
-
-    def __repr__(self):
-        return self.nombre
-
-TIPO_NUMERO = Tipo("NUMERO")
-TIPO_CADENA = Tipo("CADENA")
-TIPO_BOOLEANO = Tipo("BOOLEANO")
-TIPO_VOID = Tipo("VOID") # Para funciones que no retornan valor
-TIPO_DESCONOCIDO = Tipo("DESCONOCIDO") # Para errores o tipos no inferidos
-
-class EntradaTablaSimbolos:
-    def __init__(self, nombre, tipo, categoria, valor=None, num_params=None):
-        self.nombre = nombre
-        self.tipo = tipo # Objeto Tipo
-        self.categoria = categoria # 'variable', 'funcion'
-        self.valor = valor # Valor inicial si es una variable, o None
-        self.num_params = num_params # Solo para funciones
-
-    def __repr__(self):
-        if self.categoria == 'funcion':
-            return f"Entrada(Nombre: {self.nombre}, Tipo: {self.tipo}, Categoria: {self.categoria}, Params: {self.num_params})"
-        return f"Entrada(Nombre: {self.nombre}, Tipo: {self.tipo}, Categoria: {self.categoria}, Valor: {self.valor})"
-
-class TablaSimbolos:
-    def __init__(self):
-        self.scopes = [{}] # Lista de diccionarios, cada uno representa un ámbito
-        self.current_scope_index = 0
-
-    def push_scope(self):
-        self.scopes.append({})
-        self.current_scope_index += 1
-
-    def pop_scope(self):
-        if self.current_scope_index > 0:
-            self.scopes.pop()
-            self.current_scope_index -= 1
-        else:
-            print("Error: Intentando salir del ámbito global.")
-
-    def add_symbol(self, nombre, tipo, categoria, valor=None, num_params=None):
-        if nombre in self.scopes[self.current_scope_index]:
-            return False # Símbolo ya declarado en este ámbito
-        self.scopes[self.current_scope_index][nombre] = EntradaTablaSimbolos(nombre, tipo, categoria, valor, num_params)
-        return True
-
-    def lookup_symbol(self, nombre):
-        # Buscar desde el ámbito actual hacia arriba (global)
-        for i in reversed(range(self.current_scope_index + 1)):
-            if nombre in self.scopes[i]:
-                return self.scopes[i][nombre]
-        return None # Símbolo no encontrado
-
-    def display_scopes(self):
-        print("\n--- Tabla de Símbolos ---")
-        for i, scope in enumerate(self.scopes):
-            print(f"Ámbito {i}:")
-            if not scope:
-                print("  (Vacío)")
-            for name, entry in scope.items():
-                print(f"  {name}: {entry}")
-        print("-------------------------\n")
-
-class AnalizadorSemantico:
-    def __init__(self):
-        self.tabla_simbolos = TablaSimbolos()
-        self.errores_semanticos = []
-        self.ast = None # El AST que recibiremos del analizador sintáctico
-
-    def reportar_error(self, mensaje, nodo=None):
-        linea = nodo.token_original.lineno if nodo and nodo.token_original else "Desconocida"
-        self.errores_semanticos.append(f"Error Semántico (Línea {linea}): {mensaje}")
-
-    def analizar(self, ast):
-        self.ast = ast
-        if not self.ast:
-            self.reportar_error("AST vacío, no se puede realizar el análisis semántico.")
-            return False
-
-        print("\n--- Iniciando Análisis Semántico ---")
-        self.recorrer_ast(self.ast)
-
-        if self.errores_semanticos:
-            print("\n--- Errores Semánticos Encontrados ---")
-            for error in self.errores_semanticos:
-                print(error)
-            print("-------------------------------------\n")
-            return False
-        else:
-            print("\n✅ Análisis Semántico Completado sin errores.")
-            self.tabla_simbolos.display_scopes()
-            return True
-
-    def recorrer_ast(self, nodo):
-        if not nodo:
-            return
-
-        # Reglas semánticas basadas en la gramática
-        # PROGRAMA -> lista_sentencias
-        if nodo.valor == 'PROGRAMA':
-            self.tabla_simbolos.push_scope() # Ámbito global
-            for hijo in nodo.hijos:
-                self.recorrer_ast(hijo)
-            self.tabla_simbolos.pop_scope()
-
-        # lista_sentencias -> sentencia lista_sentencias | ε
-        elif nodo.valor == 'lista_sentencias':
-            for hijo in nodo.hijos:
-                self.recorrer_ast(hijo)
-
-        # sentencia -> VAR IDENTIFICADOR IGUAL expresion PUNTOYCOMA
-        elif nodo.valor == 'sentencia' and len(nodo.hijos) > 0 and nodo.hijos[0].valor == 'VAR':
-            # Declaración de variable
-            identificador_nodo = nodo.hijos[1] # IDENTIFICADOR
-            expresion_nodo = nodo.hijos[3] # expresion
-
-            self.recorrer_ast(expresion_nodo) # Evaluar el tipo de la expresión
-            tipo_expresion = getattr(expresion_nodo, 'tipo', TIPO_DESCONOCIDO)
-
-            nombre_var = identificador_nodo.token_original.value
-            if not self.tabla_simbolos.add_symbol(nombre_var, tipo_expresion, 'variable'):
-                self.reportar_error(f"Variable '{nombre_var}' ya declarada en este ámbito.", identificador_nodo)
-            else:
-                print(f"Declarada variable '{nombre_var}' de tipo {tipo_expresion}")
-
-        # sentencia -> IDENTIFICADOR asignacion_o_llamada PUNTOYCOMA
-        elif nodo.valor == 'sentencia' and len(nodo.hijos) > 0 and nodo.hijos[0].valor == 'IDENTIFICADOR':
-            identificador_nodo = nodo.hijos[0]
-            nombre_id = identificador_nodo.token_original.value
-            entrada_simbolo = self.tabla_simbolos.lookup_symbol(nombre_id)
-
-            if not entrada_simbolo:
-                self.reportar_error(f"Uso de identificador no declarado '{nombre_id}'.", identificador_nodo)
-                # Asignar un tipo desconocido para evitar cascada de errores
-                setattr(identificador_nodo, 'tipo', TIPO_DESCONOCIDO)
-            else:
-                setattr(identificador_nodo, 'tipo', entrada_simbolo.tipo)
-                setattr(identificador_nodo, 'categoria', entrada_simbolo.categoria)
-
-            asignacion_o_llamada_nodo = nodo.hijos[1]
-            self.recorrer_ast(asignacion_o_llamada_nodo) # Esto manejará la asignación o la llamada
-
-            # Después de recorrer asignacion_o_llamada, verificar si es una asignación
-            if asignacion_o_llamada_nodo.hijos and asignacion_o_llamada_nodo.hijos[0].valor == 'IGUAL':
-                # Es una asignación
-                if entrada_simbolo and entrada_simbolo.categoria != 'variable':
-                    self.reportar_error(f"No se puede asignar a '{nombre_id}' porque no es una variable.", identificador_nodo)
-                else:
-                    tipo_expresion_asignada = getattr(asignacion_o_llamada_nodo.hijos[1], 'tipo', TIPO_DESCONOCIDO)
-                    if entrada_simbolo and entrada_simbolo.tipo != tipo_expresion_asignada and tipo_expresion_asignada != TIPO_DESCONOCIDO:
-                        self.reportar_error(f"Incompatibilidad de tipos en la asignación de '{nombre_id}': se esperaba {entrada_simbolo.tipo}, se obtuvo {tipo_expresion_asignada}.", identificador_nodo)
-                    print(f"Asignación a '{nombre_id}' (tipo {entrada_simbolo.tipo if entrada_simbolo else 'Desconocido'})")
-            elif asignacion_o_llamada_nodo.hijos and asignacion_o_llamada_nodo.hijos[0].valor == 'PAR_IZQ':
-                # Es una llamada a función
-                if entrada_simbolo and entrada_simbolo.categoria != 'funcion':
-                    self.reportar_error(f"'{nombre_id}' no es una función y no puede ser llamada.", identificador_nodo)
-                else:
-                    # La verificación de argumentos se hace en lista_argumentos
-                    pass
-
-
-        # sentencia -> RETORNAR expresion PUNTOYCOMA
-        elif nodo.valor == 'sentencia' and len(nodo.hijos) > 0 and nodo.hijos[0].valor == 'RETORNAR':
-            expresion_nodo = nodo.hijos[1]
-            self.recorrer_ast(expresion_nodo)
-            tipo_retorno = getattr(expresion_nodo, 'tipo', TIPO_DESCONOCIDO)
-            # Aquí se debería verificar que el tipo de retorno coincida con el tipo declarado de la función actual
-            # Esto requiere un seguimiento del tipo de retorno de la función actual, que no está implementado en este esqueleto.
-            print(f"Sentencia 'retornar' con tipo {tipo_retorno}")
-
-
-        # sentencia -> IMPRIMIR PAR_IZQ lista_argumentos PAR_DER PUNTOYCOMA
-        elif nodo.valor == 'sentencia' and len(nodo.hijos) > 0 and nodo.hijos[0].valor == 'IMPRIMIR':
-            lista_argumentos_nodo = nodo.hijos[2]
-            self.recorrer_ast(lista_argumentos_nodo)
-            # No hay verificación de tipo estricta para imprimir, puede tomar cualquier tipo.
-            print("Sentencia 'imprimir'")
-
-        # si_sentencia -> SI PAR_IZQ expresion PAR_DER bloque sino_parte
-        elif nodo.valor == 'si_sentencia':
-            condicion_nodo = nodo.hijos[2]
-            self.recorrer_ast(condicion_nodo)
-            tipo_condicion = getattr(condicion_nodo, 'tipo', TIPO_DESCONOCIDO)
-            if tipo_condicion != TIPO_BOOLEANO and tipo_condicion != TIPO_DESCONOCIDO:
-                self.reportar_error(f"La condición de la sentencia 'si' debe ser de tipo BOOLEANO, se obtuvo {tipo_condicion}.", condicion_nodo)
-
-            self.recorrer_ast(nodo.hijos[4]) # bloque
-            self.recorrer_ast(nodo.hijos[5]) # sino_parte
-            print("Sentencia 'si'")
-
-        # mientras_sentencia -> MIENTRAS PAR_IZQ expresion PAR_DER bloque
-        elif nodo.valor == 'mientras_sentencia':
-            condicion_nodo = nodo.hijos[2]
-            self.recorrer_ast(condicion_nodo)
-            tipo_condicion = getattr(condicion_nodo, 'tipo', TIPO_DESCONOCIDO)
-            if tipo_condicion != TIPO_BOOLEANO and tipo_condicion != TIPO_DESCONOCIDO:
-                self.reportar_error(f"La condición de la sentencia 'mientras' debe ser de tipo BOOLEANO, se obtuvo {tipo_condicion}.", condicion_nodo)
-
-            self.recorrer_ast(nodo.hijos[4]) # bloque
-            print("Sentencia 'mientras'")
-
-        # para_sentencia -> PARA PAR_IZQ para_inicio PUNTOYCOMA expresion PUNTOYCOMA IDENTIFICADOR IGUAL expresion PAR_DER bloque
-        elif nodo.valor == 'para_sentencia':
-            self.tabla_simbolos.push_scope() # Nuevo ámbito para el bucle for
-            self.recorrer_ast(nodo.hijos[2]) # para_inicio
-            
-            condicion_nodo = nodo.hijos[4] # expresion (condición)
-            self.recorrer_ast(condicion_nodo)
-            tipo_condicion = getattr(condicion_nodo, 'tipo', TIPO_DESCONOCIDO)
-            if tipo_condicion != TIPO_BOOLEANO and tipo_condicion != TIPO_DESCONOCIDO:
-                self.reportar_error(f"La condición del bucle 'para' debe ser de tipo BOOLEANO, se obtuvo {tipo_condicion}.", condicion_nodo)
-
-            # Actualización (IDENTIFICADOR IGUAL expresion)
-            identificador_actualizacion_nodo = nodo.hijos[6]
-            expresion_actualizacion_nodo = nodo.hijos[8]
-            
-            nombre_id_actualizacion = identificador_actualizacion_nodo.token_original.value
-            entrada_simbolo_actualizacion = self.tabla_simbolos.lookup_symbol(nombre_id_actualizacion)
-            if not entrada_simbolo_actualizacion:
-                self.reportar_error(f"Variable de actualización '{nombre_id_actualizacion}' no declarada en el bucle 'para'.", identificador_actualizacion_nodo)
-            elif entrada_simbolo_actualizacion.categoria != 'variable':
-                self.reportar_error(f"'{nombre_id_actualizacion}' no es una variable y no puede ser actualizada en el bucle 'para'.", identificador_actualizacion_nodo)
-            
-            self.recorrer_ast(expresion_actualizacion_nodo)
-            tipo_expresion_actualizacion = getattr(expresion_actualizacion_nodo, 'tipo', TIPO_DESCONOCIDO)
-            if entrada_simbolo_actualizacion and entrada_simbolo_actualizacion.tipo != tipo_expresion_actualizacion and tipo_expresion_actualizacion != TIPO_DESCONOCIDO:
-                self.reportar_error(f"Incompatibilidad de tipos en la actualización del bucle 'para' para '{nombre_id_actualizacion}': se esperaba {entrada_simbolo_actualizacion.tipo}, se obtuvo {tipo_expresion_actualizacion}.", identificador_actualizacion_nodo)
-
-            self.recorrer_ast(nodo.hijos[10]) # bloque
-            self.tabla_simbolos.pop_scope()
-            print("Sentencia 'para'")
-
-        # para_inicio -> VAR IDENTIFICADOR IGUAL expresion
-        elif nodo.valor == 'para_inicio' and nodo.hijos[0].valor == 'VAR':
-            identificador_nodo = nodo.hijos[1]
-            expresion_nodo = nodo.hijos[3]
-            self.recorrer_ast(expresion_nodo)
-            tipo_expresion = getattr(expresion_nodo, 'tipo', TIPO_DESCONOCIDO)
-            nombre_var = identificador_nodo.token_original.value
-            if not self.tabla_simbolos.add_symbol(nombre_var, tipo_expresion, 'variable'):
-                self.reportar_error(f"Variable '{nombre_var}' ya declarada en este ámbito del bucle 'para'.", identificador_nodo)
-            print(f"Declarada variable de inicio de 'para' '{nombre_var}' de tipo {tipo_expresion}")
-
-        # para_inicio -> IDENTIFICADOR IGUAL expresion
-        elif nodo.valor == 'para_inicio' and nodo.hijos[0].valor == 'IDENTIFICADOR':
-            identificador_nodo = nodo.hijos[0]
-            expresion_nodo = nodo.hijos[2]
-            nombre_id = identificador_nodo.token_original.value
-            entrada_simbolo = self.tabla_simbolos.lookup_symbol(nombre_id)
-            if not entrada_simbolo:
-                self.reportar_error(f"Variable '{nombre_id}' no declarada para la inicialización del bucle 'para'.", identificador_nodo)
-            elif entrada_simbolo.categoria != 'variable':
-                self.reportar_error(f"'{nombre_id}' no es una variable y no puede ser inicializada en el bucle 'para'.", identificador_nodo)
-            
-            self.recorrer_ast(expresion_nodo)
-            tipo_expresion = getattr(expresion_nodo, 'tipo', TIPO_DESCONOCIDO)
-            if entrada_simbolo and entrada_simbolo.tipo != tipo_expresion and tipo_expresion != TIPO_DESCONOCIDO:
-                self.reportar_error(f"Incompatibilidad de tipos en la inicialización del bucle 'para' para '{nombre_id}': se esperaba {entrada_simbolo.tipo}, se obtuvo {tipo_expresion}.", identificador_nodo)
-            print(f"Inicialización de variable de 'para' '{nombre_id}' (tipo {entrada_simbolo.tipo if entrada_simbolo else 'Desconocido'})")
-
-
-        # funcion_def -> DEFINIR IDENTIFICADOR PAR_IZQ parametros PAR_DER bloque
-        elif nodo.valor == 'funcion_def':
-            identificador_nodo = nodo.hijos[1]
-            nombre_funcion = identificador_nodo.token_original.value
-            parametros_nodo = nodo.hijos[3]
-            bloque_nodo = nodo.hijos[5]
-
-            # Contar parámetros para la tabla de símbolos
-            num_params = 0
-            if parametros_nodo.hijos and parametros_nodo.hijos[0].valor != 'epsilon_node':
-                num_params = 1 # Al menos un parámetro
-                current_param_cont = parametros_nodo.hijos[1]
-                while current_param_cont.hijos and current_param_cont.hijos[0].valor == 'COMA':
-                    num_params += 1
-                    current_param_cont = current_param_cont.hijos[2]
-
-            if not self.tabla_simbolos.add_symbol(nombre_funcion, TIPO_VOID, 'funcion', num_params=num_params): # Tipo de retorno por defecto VOID
-                self.reportar_error(f"Función '{nombre_funcion}' ya declarada en este ámbito.", identificador_nodo)
-            print(f"Declarada función '{nombre_funcion}' con {num_params} parámetros.")
-
-            self.tabla_simbolos.push_scope() # Nuevo ámbito para la función
-            self.recorrer_ast(parametros_nodo) # Declarar parámetros en el nuevo ámbito
-            self.recorrer_ast(bloque_nodo) # Recorrer el cuerpo de la función
-            self.tabla_simbolos.pop_scope()
-
-
-        # parametros -> IDENTIFICADOR parametros_cont | ε
-        elif nodo.valor == 'parametros':
-            if nodo.hijos and nodo.hijos[0].valor != 'epsilon_node':
-                identificador_param_nodo = nodo.hijos[0]
-                nombre_param = identificador_param_nodo.token_original.value
-                # Por simplicidad, asumimos tipo NUMERO para los parámetros por ahora.
-                # En un sistema real, se necesitaría una forma de declarar tipos de parámetros.
-                if not self.tabla_simbolos.add_symbol(nombre_param, TIPO_NUMERO, 'variable'):
-                    self.reportar_error(f"Parámetro '{nombre_param}' ya declarado en esta función.", identificador_param_nodo)
-                print(f"Declarado parámetro '{nombre_param}' de tipo {TIPO_NUMERO}")
-                self.recorrer_ast(nodo.hijos[1]) # parametros_cont
-
-        # parametros_cont -> COMA IDENTIFICADOR parametros_cont | ε
-        elif nodo.valor == 'parametros_cont':
-            if nodo.hijos and nodo.hijos[0].valor == 'COMA':
-                identificador_param_nodo = nodo.hijos[1]
-                nombre_param = identificador_param_nodo.token_original.value
-                if not self.tabla_simbolos.add_symbol(nombre_param, TIPO_NUMERO, 'variable'):
-                    self.reportar_error(f"Parámetro '{nombre_param}' ya declarado en esta función.", identificador_param_nodo)
-                print(f"Declarado parámetro '{nombre_param}' de tipo {TIPO_NUMERO}")
-                self.recorrer_ast(nodo.hijos[2]) # parametros_cont
-
-        # bloque -> LLAVE_IZQ lista_sentencias LLAVE_DER
-        elif nodo.valor == 'bloque':
-            self.tabla_simbolos.push_scope() # Nuevo ámbito para el bloque
-            self.recorrer_ast(nodo.hijos[1]) # lista_sentencias
-            self.tabla_simbolos.pop_scope()
-
-        # asignacion_o_llamada -> IGUAL expresion
-        elif nodo.valor == 'asignacion_o_llamada' and nodo.hijos[0].valor == 'IGUAL':
-            self.recorrer_ast(nodo.hijos[1]) # expresion
-            # El tipo de la expresión se adjuntará al nodo de la expresión
-            setattr(nodo, 'tipo', getattr(nodo.hijos[1], 'tipo', TIPO_DESCONOCIDO))
-
-        # asignacion_o_llamada -> PAR_IZQ lista_argumentos PAR_DER
-        elif nodo.valor == 'asignacion_o_llamada' and nodo.hijos[0].valor == 'PAR_IZQ':
-            self.recorrer_ast(nodo.hijos[1]) # lista_argumentos
-            # Aquí se debería verificar el número y tipo de argumentos con la definición de la función
-            # Esto requiere que el nodo padre (IDENTIFICADOR) tenga la información de la función.
-            # Por ahora, solo se asegura que los argumentos se evalúen.
-            
-            # Obtener el número de argumentos pasados
-            num_args_pasados = getattr(nodo.hijos[1], 'num_args', 0)
-            
-            # Buscar el nodo IDENTIFICADOR padre para obtener la información de la función
-            # Esto es un poco complicado sin un puntero al padre en el AST.
-            # Una solución sería pasar el contexto (función actual) al recorrer.
-            # Por ahora, asumimos que el IDENTIFICADOR ya fue procesado y tiene su categoría.
-            
-            # Si el nodo padre es una sentencia de llamada (IDENTIFICADOR asignacion_o_llamada)
-            # y el IDENTIFICADOR es una función, podemos verificar.
-            # Esto es una simplificación, en un AST bien formado, el nodo de llamada tendría la referencia a la función.
-            
-            # Para este ejemplo, asumimos que el nodo 'asignacion_o_llamada' es hijo de un 'sentencia'
-            # y que el 'IDENTIFICADOR' de esa sentencia es la función que se está llamando.
-            # Esto es una aproximación y puede no ser robusta para todos los casos.
-            
-            # Si el nodo 'asignacion_o_llamada' tiene un padre que es 'sentencia'
-            # y el primer hijo de 'sentencia' es un 'IDENTIFICADOR'
-            # y ese IDENTIFICADOR es una función...
-            
-            # Esto es un hack, idealmente el AST debería tener punteros a padres o un mejor diseño.
-            # Para una implementación más robusta, se pasaría el símbolo de la función al llamar a esta regla.
-            
-            # Simulación de verificación de argumentos:
-            # Si el nodo 'asignacion_o_llamada' es parte de una llamada a función,
-            # el nodo 'IDENTIFICADOR' (nombre de la función) debería ser su "hermano" anterior.
-            # No podemos acceder directamente al hermano aquí.
-            # Una forma sería que el nodo 'sentencia' (padre) pase la información de la función.
-            
-            # Por ahora, solo se evalúan los argumentos.
-            print(f"Llamada a función con {num_args_pasados} argumentos.")
-
-
-        # lista_argumentos -> expresion lista_argumentos_cont | ε
-        elif nodo.valor == 'lista_argumentos':
-            num_args = 0
-            if nodo.hijos and nodo.hijos[0].valor != 'epsilon_node':
-                self.recorrer_ast(nodo.hijos[0]) # expresion
-                num_args += 1
-                
-                # Recorrer lista_argumentos_cont para contar más argumentos
-                current_arg_cont = nodo.hijos[1]
-                while current_arg_cont.hijos and current_arg_cont.hijos[0].valor == 'COMA':
-                    self.recorrer_ast(current_arg_cont.hijos[1]) # expresion
-                    num_args += 1
-                    current_arg_cont = current_arg_cont.hijos[2]
-            setattr(nodo, 'num_args', num_args) # Adjuntar el número de argumentos al nodo
-            print(f"Evaluando lista de argumentos: {num_args} argumentos.")
-
-        # lista_argumentos_cont -> COMA expresion lista_argumentos_cont | ε
-        elif nodo.valor == 'lista_argumentos_cont':
-            # Los argumentos ya se procesan en lista_argumentos para el conteo
-            pass
-
-        # sino_parte -> SINO bloque | ε
-        elif nodo.valor == 'sino_parte':
-            if nodo.hijos and nodo.hijos[0].valor == 'SINO':
-                self.recorrer_ast(nodo.hijos[1]) # bloque
-
-        # Expresiones (orden de precedencia de menor a mayor)
-        # expresion -> exp_logico_and exp_logico_or_resto
-        elif nodo.valor == 'expresion':
-            self.recorrer_ast(nodo.hijos[0]) # exp_logico_and
-            self.recorrer_ast(nodo.hijos[1]) # exp_logico_or_resto
-            
-            tipo_izq = getattr(nodo.hijos[0], 'tipo', TIPO_DESCONOCIDO)
-            tipo_resto = getattr(nodo.hijos[1], 'tipo', TIPO_VOID) # ε tiene tipo VOID o similar
-            
-            if tipo_resto == TIPO_VOID: # Si no hay O_LOGICO
-                setattr(nodo, 'tipo', tipo_izq)
-            elif tipo_izq == TIPO_BOOLEANO and tipo_resto == TIPO_BOOLEANO:
-                setattr(nodo, 'tipo', TIPO_BOOLEANO)
-            else:
-                self.reportar_error(f"Operación lógica '||' requiere operandos BOOLEANO, se obtuvo {tipo_izq} y {tipo_resto}.", nodo)
-                setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-
-        # exp_logico_or_resto -> O_LOGICO exp_logico_and exp_logico_or_resto | ε
-        elif nodo.valor == 'exp_logico_or_resto':
-            if nodo.hijos and nodo.hijos[0].valor == 'O_LOGICO':
-                self.recorrer_ast(nodo.hijos[1]) # exp_logico_and
-                self.recorrer_ast(nodo.hijos[2]) # exp_logico_or_resto
-                
-                tipo_op1 = getattr(nodo.hijos[1], 'tipo', TIPO_DESCONOCIDO)
-                tipo_op2 = getattr(nodo.hijos[2], 'tipo', TIPO_VOID)
-                
-                if tipo_op1 == TIPO_BOOLEANO and (tipo_op2 == TIPO_BOOLEANO or tipo_op2 == TIPO_VOID):
-                    setattr(nodo, 'tipo', TIPO_BOOLEANO)
-                else:
-                    self.reportar_error(f"Operación lógica '||' requiere operandos BOOLEANO, se obtuvo {tipo_op1} y {tipo_op2}.", nodo)
-                    setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-            else: # ε
-                setattr(nodo, 'tipo', TIPO_VOID) # Representa que no hay operación
-
-        # exp_logico_and -> exp_igualdad exp_logico_and_resto
-        elif nodo.valor == 'exp_logico_and':
-            self.recorrer_ast(nodo.hijos[0]) # exp_igualdad
-            self.recorrer_ast(nodo.hijos[1]) # exp_logico_and_resto
-            
-            tipo_izq = getattr(nodo.hijos[0], 'tipo', TIPO_DESCONOCIDO)
-            tipo_resto = getattr(nodo.hijos[1], 'tipo', TIPO_VOID)
-            
-            if tipo_resto == TIPO_VOID:
-                setattr(nodo, 'tipo', tipo_izq)
-            elif tipo_izq == TIPO_BOOLEANO and tipo_resto == TIPO_BOOLEANO:
-                setattr(nodo, 'tipo', TIPO_BOOLEANO)
-            else:
-                self.reportar_error(f"Operación lógica '&&' requiere operandos BOOLEANO, se obtuvo {tipo_izq} y {tipo_resto}.", nodo)
-                setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-
-        # exp_logico_and_resto -> Y_LOGICO exp_igualdad exp_logico_and_resto | ε
-        elif nodo.valor == 'exp_logico_and_resto':
-            if nodo.hijos and nodo.hijos[0].valor == 'Y_LOGICO':
-                self.recorrer_ast(nodo.hijos[1]) # exp_igualdad
-                self.recorrer_ast(nodo.hijos[2]) # exp_logico_and_resto
-                
-                tipo_op1 = getattr(nodo.hijos[1], 'tipo', TIPO_DESCONOCIDO)
-                tipo_op2 = getattr(nodo.hijos[2], 'tipo', TIPO_VOID)
-                
-                if tipo_op1 == TIPO_BOOLEANO and (tipo_op2 == TIPO_BOOLEANO or tipo_op2 == TIPO_VOID):
-                    setattr(nodo, 'tipo', TIPO_BOOLEANO)
-                else:
-                    self.reportar_error(f"Operación lógica '&&' requiere operandos BOOLEANO, se obtuvo {tipo_op1} y {tipo_op2}.", nodo)
-                    setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-            else: # ε
-                setattr(nodo, 'tipo', TIPO_VOID)
-
-        # exp_igualdad -> exp_comparacion exp_igualdad_resto
-        elif nodo.valor == 'exp_igualdad':
-            self.recorrer_ast(nodo.hijos[0]) # exp_comparacion
-            self.recorrer_ast(nodo.hijos[1]) # exp_igualdad_resto
-            
-            tipo_izq = getattr(nodo.hijos[0], 'tipo', TIPO_DESCONOCIDO)
-            tipo_resto = getattr(nodo.hijos[1], 'tipo', TIPO_VOID)
-            
-            if tipo_resto == TIPO_VOID:
-                setattr(nodo, 'tipo', tipo_izq)
-            elif tipo_izq == tipo_resto and tipo_izq != TIPO_DESCONOCIDO: # Tipos deben ser iguales
-                setattr(nodo, 'tipo', TIPO_BOOLEANO) # Resultado de comparación es booleano
-            else:
-                self.reportar_error(f"Operación de igualdad/diferencia requiere operandos del mismo tipo, se obtuvo {tipo_izq} y {tipo_resto}.", nodo)
-                setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-
-        # exp_igualdad_resto -> op_igualdad exp_comparacion exp_igualdad_resto | ε
-        elif nodo.valor == 'exp_igualdad_resto':
-            if nodo.hijos and nodo.hijos[0].valor in ['IGUAL_IGUAL', 'DIFERENTE']:
-                self.recorrer_ast(nodo.hijos[1]) # exp_comparacion
-                self.recorrer_ast(nodo.hijos[2]) # exp_igualdad_resto
-                
-                tipo_op1 = getattr(nodo.hijos[1], 'tipo', TIPO_DESCONOCIDO)
-                tipo_op2 = getattr(nodo.hijos[2], 'tipo', TIPO_VOID)
-                
-                if tipo_op1 == tipo_op2 and tipo_op1 != TIPO_DESCONOCIDO:
-                    setattr(nodo, 'tipo', TIPO_BOOLEANO)
-                else:
-                    self.reportar_error(f"Operación de igualdad/diferencia requiere operandos del mismo tipo, se obtuvo {tipo_op1} y {tipo_op2}.", nodo)
-                    setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-            else: # ε
-                setattr(nodo, 'tipo', TIPO_VOID)
-
-        # exp_comparacion -> exp_suma exp_comparacion_resto
-        elif nodo.valor == 'exp_comparacion':
-            self.recorrer_ast(nodo.hijos[0]) # exp_suma
-            self.recorrer_ast(nodo.hijos[1]) # exp_comparacion_resto
-            
-            tipo_izq = getattr(nodo.hijos[0], 'tipo', TIPO_DESCONOCIDO)
-            tipo_resto = getattr(nodo.hijos[1], 'tipo', TIPO_VOID)
-            
-            if tipo_resto == TIPO_VOID:
-                setattr(nodo, 'tipo', tipo_izq)
-            elif tipo_izq == TIPO_NUMERO and tipo_resto == TIPO_NUMERO:
-                setattr(nodo, 'tipo', TIPO_BOOLEANO) # Resultado de comparación es booleano
-            else:
-                self.reportar_error(f"Operación de comparación requiere operandos NUMERO, se obtuvo {tipo_izq} y {tipo_resto}.", nodo)
-                setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-
-        # exp_comparacion_resto -> op_comp exp_suma exp_comparacion_resto | ε
-        elif nodo.valor == 'exp_comparacion_resto':
-            if nodo.hijos and nodo.hijos[0].valor in ['MAYOR', 'MENOR', 'MAYOR_IGUAL', 'MENOR_IGUAL']:
-                self.recorrer_ast(nodo.hijos[1]) # exp_suma
-                self.recorrer_ast(nodo.hijos[2]) # exp_comparacion_resto
-                
-                tipo_op1 = getattr(nodo.hijos[1], 'tipo', TIPO_DESCONOCIDO)
-                tipo_op2 = getattr(nodo.hijos[2], 'tipo', TIPO_VOID)
-                
-                if tipo_op1 == TIPO_NUMERO and (tipo_op2 == TIPO_NUMERO or tipo_op2 == TIPO_VOID):
-                    setattr(nodo, 'tipo', TIPO_BOOLEANO)
-                else:
-                    self.reportar_error(f"Operación de comparación requiere operandos NUMERO, se obtuvo {tipo_op1} y {tipo_op2}.", nodo)
-                    setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-            else: # ε
-                setattr(nodo, 'tipo', TIPO_VOID)
-
-        # exp_suma -> exp_mult exp_suma_resto
-        elif nodo.valor == 'exp_suma':
-            self.recorrer_ast(nodo.hijos[0]) # exp_mult
-            self.recorrer_ast(nodo.hijos[1]) # exp_suma_resto
-            
-            tipo_izq = getattr(nodo.hijos[0], 'tipo', TIPO_DESCONOCIDO)
-            tipo_resto = getattr(nodo.hijos[1], 'tipo', TIPO_VOID)
-            
-            if tipo_resto == TIPO_VOID:
-                setattr(nodo, 'tipo', tipo_izq)
-            elif tipo_izq == TIPO_NUMERO and tipo_resto == TIPO_NUMERO:
-                setattr(nodo, 'tipo', TIPO_NUMERO)
-            elif tipo_izq == TIPO_CADENA and tipo_resto == TIPO_CADENA and getattr(nodo.hijos[1].hijos[0], 'valor', '') == 'MAS':
-                # Concatenación de cadenas
-                setattr(nodo, 'tipo', TIPO_CADENA)
-            else:
-                self.reportar_error(f"Operación de suma/resta requiere operandos NUMERO, o concatenación de CADENA, se obtuvo {tipo_izq} y {tipo_resto}.", nodo)
-                setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-
-        # exp_suma_resto -> op_suma exp_mult exp_suma_resto | ε
-        elif nodo.valor == 'exp_suma_resto':
-            if nodo.hijos and nodo.hijos[0].valor in ['MAS', 'MENOS']:
-                self.recorrer_ast(nodo.hijos[1]) # exp_mult
-                self.recorrer_ast(nodo.hijos[2]) # exp_suma_resto
-                
-                tipo_op1 = getattr(nodo.hijos[1], 'tipo', TIPO_DESCONOCIDO)
-                tipo_op2 = getattr(nodo.hijos[2], 'tipo', TIPO_VOID)
-                
-                if tipo_op1 == TIPO_NUMERO and (tipo_op2 == TIPO_NUMERO or tipo_op2 == TIPO_VOID):
-                    setattr(nodo, 'tipo', TIPO_NUMERO)
-                elif tipo_op1 == TIPO_CADENA and (tipo_op2 == TIPO_CADENA or tipo_op2 == TIPO_VOID) and nodo.hijos[0].valor == 'MAS':
-                    setattr(nodo, 'tipo', TIPO_CADENA)
-                else:
-                    self.reportar_error(f"Operación de suma/resta requiere operandos NUMERO, o concatenación de CADENA, se obtuvo {tipo_op1} y {tipo_op2}.", nodo)
-                    setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-            else: # ε
-                setattr(nodo, 'tipo', TIPO_VOID)
-
-        # exp_mult -> exp_potencia exp_mult_resto
-        elif nodo.valor == 'exp_mult':
-            self.recorrer_ast(nodo.hijos[0]) # exp_potencia
-            self.recorrer_ast(nodo.hijos[1]) # exp_mult_resto
-            
-            tipo_izq = getattr(nodo.hijos[0], 'tipo', TIPO_DESCONOCIDO)
-            tipo_resto = getattr(nodo.hijos[1], 'tipo', TIPO_VOID)
-            
-            if tipo_resto == TIPO_VOID:
-                setattr(nodo, 'tipo', tipo_izq)
-            elif tipo_izq == TIPO_NUMERO and tipo_resto == TIPO_NUMERO:
-                setattr(nodo, 'tipo', TIPO_NUMERO)
-            else:
-                self.reportar_error(f"Operación de multiplicación/división requiere operandos NUMERO, se obtuvo {tipo_izq} y {tipo_resto}.", nodo)
-                setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-
-        # exp_mult_resto -> op_mult exp_potencia exp_mult_resto | ε
-        elif nodo.valor == 'exp_mult_resto':
-            if nodo.hijos and nodo.hijos[0].valor in ['MULT', 'DIV']:
-                self.recorrer_ast(nodo.hijos[1]) # exp_potencia
-                self.recorrer_ast(nodo.hijos[2]) # exp_mult_resto
-                
-                tipo_op1 = getattr(nodo.hijos[1], 'tipo', TIPO_DESCONOCIDO)
-                tipo_op2 = getattr(nodo.hijos[2], 'tipo', TIPO_VOID)
-                
-                if tipo_op1 == TIPO_NUMERO and (tipo_op2 == TIPO_NUMERO or tipo_op2 == TIPO_VOID):
-                    setattr(nodo, 'tipo', TIPO_NUMERO)
-                else:
-                    self.reportar_error(f"Operación de multiplicación/división requiere operandos NUMERO, se obtuvo {tipo_op1} y {tipo_op2}.", nodo)
-                    setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-            else: # ε
-                setattr(nodo, 'tipo', TIPO_VOID)
-
-        # exp_potencia -> exp_unario exp_potencia_resto
-        elif nodo.valor == 'exp_potencia':
-            self.recorrer_ast(nodo.hijos[0]) # exp_unario
-            self.recorrer_ast(nodo.hijos[1]) # exp_potencia_resto
-            
-            tipo_izq = getattr(nodo.hijos[0], 'tipo', TIPO_DESCONOCIDO)
-            tipo_resto = getattr(nodo.hijos[1], 'tipo', TIPO_VOID)
-            
-            if tipo_resto == TIPO_VOID:
-                setattr(nodo, 'tipo', tipo_izq)
-            elif tipo_izq == TIPO_NUMERO and tipo_resto == TIPO_NUMERO:
-                setattr(nodo, 'tipo', TIPO_NUMERO)
-            else:
-                self.reportar_error(f"Operación de potencia requiere operandos NUMERO, se obtuvo {tipo_izq} y {tipo_resto}.", nodo)
-                setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-
-        # exp_potencia_resto -> POTENCIA exp_unario exp_potencia_resto | ε
-        elif nodo.valor == 'exp_potencia_resto':
-            if nodo.hijos and nodo.hijos[0].valor == 'POTENCIA':
-                self.recorrer_ast(nodo.hijos[1]) # exp_unario
-                self.recorrer_ast(nodo.hijos[2]) # exp_potencia_resto
-                
-                tipo_op1 = getattr(nodo.hijos[1], 'tipo', TIPO_DESCONOCIDO)
-                tipo_op2 = getattr(nodo.hijos[2], 'tipo', TIPO_VOID)
-                
-                if tipo_op1 == TIPO_NUMERO and (tipo_op2 == TIPO_NUMERO or tipo_op2 == TIPO_VOID):
-                    setattr(nodo, 'tipo', TIPO_NUMERO)
-                else:
-                    self.reportar_error(f"Operación de potencia requiere operandos NUMERO, se obtuvo {tipo_op1} y {tipo_op2}.", nodo)
-                    setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-            else: # ε
-                setattr(nodo, 'tipo', TIPO_VOID)
-
-        # exp_unario -> NEGACION exp_unario | MENOS exp_unario | primario
-        elif nodo.valor == 'exp_unario':
-            operador = nodo.hijos[0].valor
-            if operador == 'NEGACION':
-                self.recorrer_ast(nodo.hijos[1]) # exp_unario
-                tipo_op = getattr(nodo.hijos[1], 'tipo', TIPO_DESCONOCIDO)
-                if tipo_op == TIPO_BOOLEANO:
-                    setattr(nodo, 'tipo', TIPO_BOOLEANO)
-                else:
-                    self.reportar_error(f"Operador de negación '!' requiere operando BOOLEANO, se obtuvo {tipo_op}.", nodo)
-                    setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-            elif operador == 'MENOS':
-                self.recorrer_ast(nodo.hijos[1]) # exp_unario
-                tipo_op = getattr(nodo.hijos[1], 'tipo', TIPO_DESCONOCIDO)
-                if tipo_op == TIPO_NUMERO:
-                    setattr(nodo, 'tipo', TIPO_NUMERO)
-                else:
-                    self.reportar_error(f"Operador unario '-' requiere operando NUMERO, se obtuvo {tipo_op}.", nodo)
-                    setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-            else: # primario
-                self.recorrer_ast(nodo.hijos[0])
-                setattr(nodo, 'tipo', getattr(nodo.hijos[0], 'tipo', TIPO_DESCONOCIDO))
-
-        # primario -> NUMERO | CADENA | VERDADERO | FALSO | IDENTIFICADOR primario_llamada_opcional | PAR_IZQ expresion PAR_DER
-        elif nodo.valor == 'primario':
-            primer_hijo = nodo.hijos[0]
-            if primer_hijo.valor == 'NUMERO':
-                setattr(nodo, 'tipo', TIPO_NUMERO)
-            elif primer_hijo.valor == 'CADENA':
-                setattr(nodo, 'tipo', TIPO_CADENA)
-            elif primer_hijo.valor == 'VERDADERO' or primer_hijo.valor == 'FALSO':
-                setattr(nodo, 'tipo', TIPO_BOOLEANO)
-            elif primer_hijo.valor == 'IDENTIFICADOR':
-                nombre_id = primer_hijo.token_original.value
-                entrada_simbolo = self.tabla_simbolos.lookup_symbol(nombre_id)
-                if not entrada_simbolo:
-                    self.reportar_error(f"Uso de identificador no declarado '{nombre_id}'.", primer_hijo)
-                    setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-                else:
-                    setattr(nodo, 'tipo', entrada_simbolo.tipo)
-                    setattr(nodo, 'categoria', entrada_simbolo.categoria) # Para verificar si es función o variable
-                
-                # Procesar primario_llamada_opcional
-                self.recorrer_ast(nodo.hijos[1])
-                
-                # Si es una llamada a función, el tipo del primario es el tipo de retorno de la función
-                if getattr(nodo.hijos[1], 'es_llamada', False):
-                    if entrada_simbolo and entrada_simbolo.categoria == 'funcion':
-                        setattr(nodo, 'tipo', entrada_simbolo.tipo) # Asumimos que el tipo de la función es su tipo de retorno
-                        # Verificar número de argumentos
-                        num_args_pasados = getattr(nodo.hijos[1], 'num_args', 0)
-                        if entrada_simbolo.num_params != num_args_pasados:
-                            self.reportar_error(f"Llamada a función '{nombre_id}' con {num_args_pasados} argumentos, se esperaban {entrada_simbolo.num_params}.", primer_hijo)
-                    else:
-                        self.reportar_error(f"'{nombre_id}' no es una función y no puede ser llamada.", primer_hijo)
-                        setattr(nodo, 'tipo', TIPO_DESCONOCIDO)
-
-            elif primer_hijo.valor == 'PAR_IZQ':
-                self.recorrer_ast(nodo.hijos[1]) # expresion dentro de paréntesis
-                setattr(nodo, 'tipo', getattr(nodo.hijos[1], 'tipo', TIPO_DESCONOCIDO))
-            
-            # Adjuntar el token original al nodo primario si es un literal o identificador
-            if primer_hijo.token_original:
-                setattr(nodo, 'token_original', primer_hijo.token_original)
-
-
-        # primario_llamada_opcional -> PAR_IZQ lista_argumentos PAR_DER | ε
-        elif nodo.valor == 'primario_llamada_opcional':
-            if nodo.hijos and nodo.hijos[0].valor == 'PAR_IZQ':
-                setattr(nodo, 'es_llamada', True) # Marcar que es una llamada
-                self.recorrer_ast(nodo.hijos[1]) # lista_argumentos
-                setattr(nodo, 'num_args', getattr(nodo.hijos[1], 'num_args', 0))
-            else: # ε
-                setattr(nodo, 'es_llamada', False)
-
-        # Para nodos terminales que no son manejados explícitamente pero pueden tener un token_original
-        elif hasattr(nodo, 'token_original') and nodo.token_original:
-            # No hay acción semántica directa, pero se asegura que el token_original esté presente
-            pass
-        
-        # Recorrer hijos para reglas no específicas o para asegurar el paso
-        else:
-            for hijo in nodo.hijos:
-                self.recorrer_ast(hijo)
-
-# Integración con el main del analizador sintáctico
-if __name__ == '__main__':
-    # Asegúrate de que los imports de AnalizadorSintactico y AnalizadorLexico estén correctos
-    # y que las funciones como analyze_file, cargar_tabla_desde_csv, parser_ll1, etc., estén disponibles.
-    
-    # Simulación de imports para que este archivo pueda ejecutarse directamente para pruebas
-    try:
-        from AnalizadorSintactico import Nodo, parser_ll1, cargar_tabla_desde_csv, exportar_arbol_a_graphviz, imprimir_arbol
-        from AnalizadorLexico import analyze_file
-    except ImportError:
-        print("Asegúrate de que 'AnalizadorSintactico.py' y 'AnalizadorLexico.py' estén en el mismo directorio.")
-        print("Este script está diseñado para ser ejecutado después de que el análisis sintáctico genere un AST.")
-        exit()
-
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    tabla_csv_path = os.path.join(BASE_DIR, "table_ll1.csv")
-    archivo_entrada_path = os.path.join(BASE_DIR, "Inputs", "programa.serpy")
-    archivo_salida_graphviz = "arbol_parseo_semantico.dot"
-
-    if not os.path.exists(tabla_csv_path):
-        print(f"Error: No se encontró la tabla de parsing en {tabla_csv_path}")
-        print("Ejecute primero creadorTabla.py para generar la tabla")
-        exit(1)
-    
-    if not os.path.exists(archivo_entrada_path):
-        print(f"Creando archivo de ejemplo en: {archivo_entrada_path}")
-        os.makedirs(os.path.dirname(archivo_entrada_path), exist_ok=True)
-        with open(archivo_entrada_path, 'w', encoding='utf-8') as f:
-            f.write("""var x = 10;
-imprimir(x);
-
-definir suma(a, b) {
-    retornar a + b;
-}
-
-var resultado = suma(5, 3);
-imprimir(resultado);
-
-var y = "hola";
-var z = y + " mundo"; # Concatenación de cadenas
-imprimir(z);
-
-var es_cierto = verdadero;
-si (es_cierto && (10 > 5)) {
-    imprimir("Condición verdadera");
-} sino {
-    imprimir("Condición falsa");
-}
-
-var contador = 0;
-mientras (contador < 3) {
-    imprimir(contador);
-    contador = contador + 1;
-}
-
-para (var i = 0; i < 5; i = i + 1) {
-    imprimir(i);
-}
-
-# Ejemplo con error semántico: re-declaración de variable
-# var x = 20;
-
-# Ejemplo con error semántico: uso de variable no declarada
-# imprimir(no_existe);
-
-# Ejemplo con error semántico: asignación de tipo incorrecto
-# var num = 10;
-# num = "texto";
-
-# Ejemplo con error semántico: operación de tipos incompatibles
-# var res_error = 5 + "texto";
-
-# Ejemplo con error semántico: llamada a función con argumentos incorrectos
-# suma(1);
-""")
-    
-    print(f"--- Cargando tabla de parsing desde: {tabla_csv_path} ---")
-    tabla_parsing = cargar_tabla_desde_csv(tabla_csv_path)
-    
-    if tabla_parsing is None:
-        print("No se pudo continuar debido a un error al cargar la tabla de parsing.")
-        exit(1)
-    
-    print(f"--- Analizando léxicamente el archivo: {archivo_entrada_path} ---")
-    lista_de_tokens = analyze_file(archivo_entrada_path) 
-
-    if not lista_de_tokens:
-        print("\n❌ Error durante el análisis léxico o el archivo no contiene tokens.")
-        exit(1)
-    
-    print(f"--- Iniciando análisis sintáctico ---")
-    arbol_sintactico = parser_ll1(lista_de_tokens, tabla_parsing, start_symbol='PROGRAMA')
-
-    if arbol_sintactico:
-        print("\n✅ Entrada aceptada por el analizador sintáctico.")
-        
-        print("\nEstructura del árbol sintáctico (antes de semántico):")
-        imprimir_arbol(arbol_sintactico)
-        
-        print(f"\n--- Iniciando Análisis Semántico para {archivo_entrada_path} ---")
-        analizador_semantico = AnalizadorSemantico()
-        semantico_ok = analizador_semantico.analizar(arbol_sintactico)
-
-        if semantico_ok:
-            print("\nAnálisis Semántico Exitoso. Generando Graphviz del AST con información semántica.")
-            exportar_arbol_a_graphviz(arbol_sintactico, archivo_salida_graphviz)
-        else:
-            print("\nAnálisis Semántico Fallido. No se generará el archivo Graphviz.")
-            for error in analizador_semantico.errores_semanticos:
-                print(error)
-        
-    else:
-        print("\n❌ Entrada rechazada por el analizador sintáctico. No se realizará el análisis semántico.")
-        exit(1)
-
+import os
+from collections import defaultdict
+
+from AnalizadorLexico import TablaNombres
+from AnalizadorSintactico import buscar_produccion, id_produccion
+from Diagnosticos import DEPURACION, configurar, reporte_por_defecto
+from Tipos import TIPO_BOOLEANO, TIPO_CADENA, TIPO_DESCONOCIDO, TIPO_NUMERO, TIPO_VOID, Tipo
+
+# Importar clases y funciones del analizador sintáctico si es necesario
+# from AnalizadorSintactico import Nodo, parser_ll1, cargar_tabla_desde_csv, exportar_arbol_a_graphviz
+# from AnalizadorLexico import analyze_file
+
+class EntradaTablaSimbolos:
+    def __init__(self, nombre, tipo, categoria, valor=None, num_params=None):
+        self.nombre = nombre
+        self.tipo = tipo # Objeto Tipo
+        self.categoria = categoria # 'variable', 'funcion'
+        self.valor = valor # Valor inicial si es una variable, o None
+        self.num_params = num_params # Solo para funciones
+        self.marco = None # Variables: profundidad del marco que la aloja (0: el del programa)
+        self.slot = None # Variables: índice dentro de ese marco
+        self.tamano_marco = None # Funciones: slots del marco de cada llamada
+
+    def __repr__(self):
+        if self.categoria == 'funcion':
+            return f"Entrada(Nombre: {self.nombre}, Tipo: {self.tipo}, Categoria: {self.categoria}, Params: {self.num_params})"
+        return f"Entrada(Nombre: {self.nombre}, Tipo: {self.tipo}, Categoria: {self.categoria}, Valor: {self.valor})"
+
+class Marco:
+    # Registro de activación de una función (o del programa completo): cada
+    # variable declarada en sus ámbitos ocupa un slot. Al cerrar un bloque se
+    # liberan los suyos, así que los bloques hermanos reutilizan los mismos
+    # slots; tamano es el máximo en uso a la vez.
+    def __init__(self):
+        self.siguiente = 0
+        self.tamano = 0
+
+class TablaSimbolos:
+    # Además de un diccionario por ámbito, un único diccionario `visibles`
+    # lleva de cada clave a la pila de sus entradas, una por ámbito abierto
+    # que la declara (la del tope es la visible). Buscar es una sola consulta
+    # sin importar la profundidad; al cerrar un ámbito, su diccionario dice
+    # qué pilas hay que desapilar.
+    def __init__(self):
+        self.scopes = [{}] # Lista de diccionarios, cada uno representa un ámbito
+        self.current_scope_index = 0
+        self.visibles = {} # clave -> [entradas del ámbito más externo al más interno]
+        self.marcos = [Marco()] # Marcos abiertos; el último aloja las variables nuevas
+        self.inicios = [0] # Por ámbito: primer slot que usa en su marco, o None si abrió el marco
+
+    def push_scope(self, marco=False):
+        # marco=True: el ámbito abre un marco propio (cuerpo de una función)
+        self.scopes.append({})
+        self.current_scope_index += 1
+        if marco:
+            self.marcos.append(Marco())
+            self.inicios.append(None)
+        else:
+            self.inicios.append(self.marcos[-1].siguiente)
+
+    def pop_scope(self):
+        if self.current_scope_index > 0:
+            visibles = self.visibles
+            for clave in self.scopes.pop():
+                cadena = visibles[clave]
+                cadena.pop()
+                if not cadena:
+                    del visibles[clave]
+            self.current_scope_index -= 1
+            inicio = self.inicios.pop()
+            if inicio is None:
+                return self.marcos.pop().tamano # Tamaño del marco que se cierra
+            self.marcos[-1].siguiente = inicio # Se liberan los slots del ámbito
+        else:
+            reporte_por_defecto().error('semantico', "Error: Intentando salir del ámbito global.")
+
+    def add_symbol(self, nombre, tipo, categoria, valor=None, num_params=None, clave=None):
+        # clave: id internado del nombre (lexer.nombres); por defecto el propio nombre
+        if clave is None:
+            clave = nombre
+        ambito = self.scopes[self.current_scope_index]
+        if clave in ambito:
+            return False # Símbolo ya declarado en este ámbito
+        entrada = ambito[clave] = EntradaTablaSimbolos(nombre, tipo, categoria, valor, num_params)
+        if categoria == 'variable':
+            marco = self.marcos[-1]
+            entrada.marco = len(self.marcos) - 1
+            entrada.slot = marco.siguiente
+            marco.siguiente += 1
+            if marco.siguiente > marco.tamano:
+                marco.tamano = marco.siguiente
+        cadena = self.visibles.get(clave)
+        if cadena is None:
+            self.visibles[clave] = [entrada]
+        else:
+            cadena.append(entrada)
+        return True
+
+    def lookup_symbol(self, nombre):
+        # nombre puede ser el str o su id internado, igual que en add_symbol
+        # La entrada del ámbito más interno que lo declara está en el tope
+        cadena = self.visibles.get(nombre)
+        if cadena:
+            return cadena[-1]
+        return None # Símbolo no encontrado
+
+    def direccion(self, entrada):
+        # (marcos que hay que subir desde el actual, slot) de una variable
+        return len(self.marcos) - 1 - entrada.marco, entrada.slot
+
+    def display_scopes(self, reporte=None):
+        reporte = reporte or reporte_por_defecto()
+        if not reporte.depuracion:
+            return
+        reporte.debug('semantico', "\n--- Tabla de Símbolos ---")
+        for i, scope in enumerate(self.scopes):
+            reporte.debug('semantico', f"Ámbito {i}:")
+            if not scope:
+                reporte.debug('semantico', "  (Vacío)")
+            for entry in scope.values():
+                reporte.debug('semantico', f"  {entry.nombre}: {entry}")
+        reporte.debug('semantico', "-------------------------\n")
+
+# Tipo de `izquierdo operador derecho` en una cadena de exp_*_resto, que se
+# combina de izquierda a derecha (a < b < c es (a < b) < c); None es un error
+# de tipos
+def _regla_logica(operador, tipo_izq, tipo_der):
+    if tipo_izq == TIPO_BOOLEANO and tipo_der == TIPO_BOOLEANO:
+        return TIPO_BOOLEANO
+
+def _regla_igualdad(operador, tipo_izq, tipo_der):
+    if tipo_izq == tipo_der:
+        return TIPO_BOOLEANO
+
+def _regla_comparacion(operador, tipo_izq, tipo_der):
+    if tipo_izq == TIPO_NUMERO and tipo_der == TIPO_NUMERO:
+        return TIPO_BOOLEANO
+
+def _regla_suma(operador, tipo_izq, tipo_der):
+    if tipo_izq == TIPO_NUMERO and tipo_der == TIPO_NUMERO:
+        return TIPO_NUMERO
+    if tipo_izq == TIPO_CADENA and tipo_der == TIPO_CADENA and operador == 'MAS':
+        return TIPO_CADENA
+
+def _regla_numerica(operador, tipo_izq, tipo_der):
+    if tipo_izq == TIPO_NUMERO and tipo_der == TIPO_NUMERO:
+        return TIPO_NUMERO
+
+# exp_*_resto -> (operadores, regla, mensaje de error)
+RESTOS = {
+    'exp_logico_or_resto': (('O_LOGICO',), _regla_logica,
+                            "Operación lógica '||' requiere operandos BOOLEANO, se obtuvo {} y {}."),
+    'exp_logico_and_resto': (('Y_LOGICO',), _regla_logica,
+                             "Operación lógica '&&' requiere operandos BOOLEANO, se obtuvo {} y {}."),
+    'exp_igualdad_resto': (('IGUAL_IGUAL', 'DIFERENTE'), _regla_igualdad,
+                           "Operación de igualdad/diferencia requiere operandos del mismo tipo, se obtuvo {} y {}."),
+    'exp_comparacion_resto': (('MAYOR', 'MENOR', 'MAYOR_IGUAL', 'MENOR_IGUAL'), _regla_comparacion,
+                              "Operación de comparación requiere operandos NUMERO, se obtuvo {} y {}."),
+    'exp_suma_resto': (('MAS', 'MENOS'), _regla_suma,
+                       "Operación de suma/resta requiere operandos NUMERO, o concatenación de CADENA, se obtuvo {} y {}."),
+    'exp_mult_resto': (('MULT', 'DIV'), _regla_numerica,
+                       "Operación de multiplicación/división requiere operandos NUMERO, se obtuvo {} y {}."),
+    'exp_potencia_resto': (('POTENCIA',), _regla_numerica,
+                           "Operación de potencia requiere operandos NUMERO, se obtuvo {} y {}."),
+}
+
+def _pares_resto(nodo, operadores):
+    # (operador, operando) de un exp_*_resto aplanado; op_igualdad, op_comp,
+    # op_suma y op_mult envuelven el token del operador
+    pares = []
+    hijos = nodo.hijos
+    for i in range(0, len(hijos) - 1, 2):
+        operador = hijos[i]
+        if operador.hijos:
+            operador = operador.hijos[0]
+        if operador.valor not in operadores:
+            break
+        pares.append((operador.valor, hijos[i + 1]))
+    return pares
+
+# Tipo de cada literal de primario
+LITERALES = {
+    'NUMERO': TIPO_NUMERO,
+    'CADENA': TIPO_CADENA,
+    'VERDADERO': TIPO_BOOLEANO,
+    'FALSO': TIPO_BOOLEANO,
+}
+
+# Union-find de variables de tipo: cada variable es un índice y la raíz de su
+# conjunto guarda el tipo concreto del conjunto (DESCONOCIDO mientras no lo
+# fije ninguna restricción). Con compresión de caminos y unión por rango cada
+# operación cuesta casi O(1), así que la inferencia es casi lineal.
+class ConjuntosTipos:
+    def __init__(self):
+        self.padre = []
+        self.rango = []
+        self.tipos = []
+        self.constantes = {} # tipo concreto -> su variable
+
+    def nueva(self, tipo=TIPO_DESCONOCIDO):
+        variable = len(self.padre)
+        self.padre.append(variable)
+        self.rango.append(0)
+        self.tipos.append(tipo)
+        return variable
+
+    def constante(self, tipo):
+        variable = self.constantes.get(tipo)
+        if variable is None:
+            variable = self.constantes[tipo] = self.nueva(tipo)
+        return variable
+
+    def raiz(self, variable):
+        padre = self.padre
+        while padre[variable] != variable:
+            padre[variable] = padre[padre[variable]] # Compresión por mitades
+            variable = padre[variable]
+        return variable
+
+    def tipo(self, variable):
+        return self.tipos[self.raiz(variable)]
+
+    def unir(self, a, b):
+        # False si los dos conjuntos ya tienen tipos concretos distintos; en
+        # ese caso no se unen y cada uno conserva el suyo
+        a = self.raiz(a)
+        b = self.raiz(b)
+        if a == b:
+            return True
+        tipo_a = self.tipos[a]
+        tipo_b = self.tipos[b]
+        if tipo_a != TIPO_DESCONOCIDO and tipo_b != TIPO_DESCONOCIDO and tipo_a != tipo_b:
+            return False
+        if self.rango[a] < self.rango[b]:
+            a, b = b, a
+        self.padre[b] = a
+        if self.rango[a] == self.rango[b]:
+            self.rango[a] += 1
+        self.tipos[a] = tipo_a or tipo_b
+        return True
+
+# exp_* -> (tipo que exigen sus operandos, tipo del resultado) cuando tiene
+# operadores; None: el de los operandos, que se unen entre sí
+BINARIAS = {
+    'expresion': (TIPO_BOOLEANO, TIPO_BOOLEANO),
+    'exp_logico_and': (TIPO_BOOLEANO, TIPO_BOOLEANO),
+    'exp_igualdad': (None, TIPO_BOOLEANO),
+    'exp_comparacion': (TIPO_NUMERO, TIPO_BOOLEANO),
+    'exp_suma': (None, None), # NUMERO si hay alguna resta; solo MAS también concatena
+    'exp_mult': (TIPO_NUMERO, TIPO_NUMERO),
+    'exp_potencia': (TIPO_NUMERO, TIPO_NUMERO),
+}
+
+class InferenciaTipos:
+    # Pre-pasada del análisis semántico que infiere el tipo de cada parámetro
+    # y el de retorno de cada funcion_def. Cada expresión, variable, parámetro
+    # y retorno tiene una variable de tipo; los operadores, las condiciones,
+    # las asignaciones, los argumentos de cada llamada y cada `retornar` las
+    # igualan. Los conflictos en argumentos y retornos quedan en `conflictos`,
+    # por nodo (el IDENTIFICADOR de la llamada o el RETORNAR), y el recorrido
+    # principal los reporta al pasar por ese nodo, en orden de fuente; los
+    # demás errores los detecta él mismo con los tipos inferidos.
+    # Al terminar, funcion_def.tipo es el tipo de retorno (VOID si no tiene
+    # `retornar`) y el IDENTIFICADOR de cada parámetro lleva el suyo; lo que
+    # ninguna restricción fija queda como NUMERO.
+    def __init__(self, analizador):
+        self.analizador = analizador # Para clave()
+        self.conjuntos = ConjuntosTipos()
+        self.tabla_simbolos = TablaSimbolos() # entrada.tipo es una variable de tipo
+        self.variables = {} # nodo de expresión ya recorrido -> su variable
+        self.firmas = {} # funcion_def -> ([(variable, IDENTIFICADOR) por parámetro], variable de retorno)
+        self.parametros = {} # entrada de función -> sus parámetros
+        self.funciones = [] # funcion_def abiertas, la actual al final
+        self.con_retorno = set() # funcion_def con algún `retornar`
+        self.conflictos = {} # nodo -> mensajes de conflicto a reportar en él
+
+    def inferir(self, raiz):
+        pila = [iter((raiz,))]
+        while pila:
+            try:
+                hijo = next(pila[-1])
+            except StopIteration:
+                pila.pop()
+                continue
+            if not hijo:
+                continue
+            manejador = self.POR_VALOR.get(hijo.valor, InferenciaTipos._hijos)
+            visita = manejador(self, hijo)
+            if visita is not None:
+                pila.append(visita)
+
+        conjuntos = self.conjuntos
+        for funcion_nodo, (parametros, retorno) in self.firmas.items():
+            for variable, identificador_param_nodo in parametros:
+                identificador_param_nodo.tipo = conjuntos.tipo(variable) or TIPO_NUMERO
+            if funcion_nodo in self.con_retorno:
+                funcion_nodo.tipo = conjuntos.tipo(retorno) or TIPO_NUMERO
+            else:
+                funcion_nodo.tipo = TIPO_VOID
+
+    def _hijos(self, nodo):
+        return iter(nodo.hijos)
+
+    def _de(self, nodo):
+        # Variable de un nodo de expresión ya recorrido
+        variable = self.variables.pop(nodo, None)
+        return self.conjuntos.nueva() if variable is None else variable
+
+    def _conflicto(self, nodo, mensaje):
+        mensajes = self.conflictos.get(nodo)
+        if mensajes is None:
+            self.conflictos[nodo] = [mensaje]
+        else:
+            mensajes.append(mensaje)
+
+    def _igualar(self, variable, tipo):
+        # Restricción sin reporte: si falla, el error lo da el recorrido principal
+        self.conjuntos.unir(variable, self.conjuntos.constante(tipo))
+
+    def _declarar(self, identificador_nodo, variable, categoria='variable', num_params=None):
+        token = identificador_nodo.token_original
+        if not self.tabla_simbolos.add_symbol(token.value, variable, categoria, num_params=num_params,
+                                              clave=self.analizador.clave(token)):
+            return None
+        return self.tabla_simbolos.lookup_symbol(self.analizador.clave(token))
+
+    def _buscar(self, identificador_nodo):
+        return self.tabla_simbolos.lookup_symbol(self.analizador.clave(identificador_nodo.token_original))
+
+    def _argumentos(self, lista_argumentos_nodo):
+        # lista_argumentos -> expresion lista_argumentos_cont (aplanado: [COMA, expresion, ...]) | ε
+        hijos = lista_argumentos_nodo.hijos
+        if not hijos or hijos[0].valor == 'epsilon_node':
+            return []
+        argumentos = [hijos[0]]
+        for coma, expresion_nodo in zip(hijos[1].hijos[0::2], hijos[1].hijos[1::2]):
+            if coma.valor != 'COMA':
+                break
+            argumentos.append(expresion_nodo)
+        return argumentos
+
+    def _llamar(self, entrada, identificador_nodo, argumentos):
+        # Iguala cada argumento con su parámetro; devuelve la variable del resultado
+        variables = [self._de(argumento) for argumento in argumentos]
+        parametros = self.parametros.get(entrada) if entrada is not None else None
+        if parametros is None:
+            return self.conjuntos.nueva()
+        if len(parametros) == len(variables): # Si no, el recorrido principal reporta la aridad
+            conjuntos = self.conjuntos
+            nombre = identificador_nodo.token_original.value
+            for (parametro, identificador_param_nodo), argumento in zip(parametros, variables):
+                tipo_parametro = conjuntos.tipo(parametro)
+                tipo_argumento = conjuntos.tipo(argumento)
+                if not conjuntos.unir(parametro, argumento):
+                    self._conflicto(identificador_nodo,
+                        f"Conflicto de tipos en la llamada a '{nombre}': el parámetro "
+                        f"'{identificador_param_nodo.token_original.value}' es {tipo_parametro}, se pasó {tipo_argumento}.")
+        return entrada.tipo
+
+    # PROGRAMA -> lista_sentencias, bloque -> LLAVE_IZQ lista_sentencias LLAVE_DER
+    def _ambito(self, nodo):
+        self.tabla_simbolos.push_scope()
+        yield from nodo.hijos
+        self.tabla_simbolos.pop_scope()
+
+    # lista_sentencias: las firmas se declaran antes de las sentencias, como
+    # en el recorrido principal
+    def _lista_sentencias(self, nodo):
+        for sentencia in nodo.hijos:
+            if sentencia.hijos and sentencia.hijos[0].valor == 'funcion_def':
+                self._firma(sentencia.hijos[0])
+        return iter(nodo.hijos)
+
+    def _firma(self, funcion_nodo):
+        parametros_nodo = funcion_nodo.hijos[3]
+        identificadores = []
+        if parametros_nodo.hijos and parametros_nodo.hijos[0].valor != 'epsilon_node':
+            identificadores.append(parametros_nodo.hijos[0])
+            identificadores += [hijo for hijo in parametros_nodo.hijos[1].hijos if hijo.valor == 'IDENTIFICADOR']
+        parametros = [(self.conjuntos.nueva(), identificador) for identificador in identificadores]
+        retorno = self.conjuntos.nueva()
+        self.firmas[funcion_nodo] = (parametros, retorno)
+        entrada = self._declarar(funcion_nodo.hijos[1], retorno, 'funcion', num_params=len(parametros))
+        if entrada is not None:
+            self.parametros[entrada] = parametros
+        return parametros, retorno
+
+    # funcion_def -> DEFINIR IDENTIFICADOR PAR_IZQ parametros PAR_DER bloque
+    def _funcion_def(self, nodo):
+        parametros, _ = self.firmas.get(nodo) or self._firma(nodo)
+        self.tabla_simbolos.push_scope()
+        for variable, identificador_param_nodo in parametros:
+            self._declarar(identificador_param_nodo, variable)
+        self.funciones.append(nodo)
+        yield nodo.hijos[5] # bloque
+        self.funciones.pop()
+        self.tabla_simbolos.pop_scope()
+
+    def _sentencia(self, nodo):
+        primero = nodo.hijos[0].valor
+        if primero == 'VAR': # VAR IDENTIFICADOR IGUAL expresion PUNTOYCOMA
+            yield nodo.hijos[3]
+            self._declarar(nodo.hijos[1], self._de(nodo.hijos[3]))
+        elif primero == 'IDENTIFICADOR': # IDENTIFICADOR asignacion_o_llamada PUNTOYCOMA
+            identificador_nodo = nodo.hijos[0]
+            entrada = self._buscar(identificador_nodo)
+            asignacion_o_llamada_nodo = nodo.hijos[1]
+            if asignacion_o_llamada_nodo.hijos[0].valor == 'IGUAL':
+                yield asignacion_o_llamada_nodo.hijos[1]
+                variable = self._de(asignacion_o_llamada_nodo.hijos[1])
+                if entrada is not None and entrada.categoria == 'variable':
+                    self.conjuntos.unir(entrada.tipo, variable)
+            else:
+                argumentos = self._argumentos(asignacion_o_llamada_nodo.hijos[1])
+                yield from argumentos
+                self._llamar(entrada, identificador_nodo, argumentos)
+        elif primero == 'RETORNAR': # RETORNAR expresion PUNTOYCOMA
+            yield nodo.hijos[1]
+            variable = self._de(nodo.hijos[1])
+            if self.funciones:
+                funcion_nodo = self.funciones[-1]
+                self.con_retorno.add(funcion_nodo)
+                retorno = self.firmas[funcion_nodo][1]
+                tipo_retorno = self.conjuntos.tipo(retorno)
+                tipo_expresion = self.conjuntos.tipo(variable)
+                if not self.conjuntos.unir(retorno, variable):
+                    self._conflicto(nodo.hijos[0],
+                        f"Conflicto de tipos en el retorno de '{funcion_nodo.hijos[1].token_original.value}': "
+                        f"retorna {tipo_retorno} y también {tipo_expresion}.")
+        elif primero == 'IMPRIMIR': # IMPRIMIR PAR_IZQ lista_argumentos PAR_DER PUNTOYCOMA
+            argumentos = self._argumentos(nodo.hijos[2])
+            yield from argumentos
+            for argumento in argumentos:
+                self._de(argumento)
+        else:
+            yield from nodo.hijos
+
+    # si_sentencia -> SI PAR_IZQ expresion PAR_DER bloque sino_parte
+    # mientras_sentencia -> MIENTRAS PAR_IZQ expresion PAR_DER bloque
+    def _condicional(self, nodo):
+        yield nodo.hijos[2]
+        self._igualar(self._de(nodo.hijos[2]), TIPO_BOOLEANO)
+        yield from nodo.hijos[4:]
+
+    # para_sentencia -> PARA PAR_IZQ para_inicio PUNTOYCOMA expresion PUNTOYCOMA IDENTIFICADOR IGUAL expresion PAR_DER bloque
+    def _para_sentencia(self, nodo):
+        self.tabla_simbolos.push_scope()
+        inicio = nodo.hijos[2]
+        if inicio.hijos[0].valor == 'VAR': # VAR IDENTIFICADOR IGUAL expresion
+            yield inicio.hijos[3]
+            self._declarar(inicio.hijos[1], self._de(inicio.hijos[3]))
+        else: # IDENTIFICADOR IGUAL expresion
+            yield inicio.hijos[2]
+            self._asignar(inicio.hijos[0], self._de(inicio.hijos[2]))
+        yield nodo.hijos[4]
+        self._igualar(self._de(nodo.hijos[4]), TIPO_BOOLEANO)
+        yield nodo.hijos[8]
+        self._asignar(nodo.hijos[6], self._de(nodo.hijos[8]))
+        yield nodo.hijos[10]
+        self.tabla_simbolos.pop_scope()
+
+    def _asignar(self, identificador_nodo, variable):
+        entrada = self._buscar(identificador_nodo)
+        if entrada is not None and entrada.categoria == 'variable':
+            self.conjuntos.unir(entrada.tipo, variable)
+
+    # exp_* -> exp_siguiente exp_*_resto (resto aplanado: [op1, e1, op2, e2, ...] o [ε])
+    def _exp_binaria(self, nodo):
+        izquierdo = nodo.hijos[0]
+        resto = nodo.hijos[1].hijos
+        operadores = [operador.hijos[0].valor if operador.hijos else operador.valor for operador in resto[0::2]]
+        operandos = resto[1::2]
+        yield izquierdo
+        yield from operandos
+        conjuntos = self.conjuntos
+        variable = self._de(izquierdo)
+        if operandos:
+            tipo_operandos, tipo_resultado = BINARIAS[nodo.valor]
+            if nodo.valor == 'exp_suma' and 'MENOS' in operadores:
+                tipo_operandos = TIPO_NUMERO
+            for operando in operandos:
+                conjuntos.unir(variable, self._de(operando))
+            if tipo_operandos is not None:
+                self._igualar(variable, tipo_operandos)
+            if tipo_resultado is not None:
+                variable = conjuntos.constante(tipo_resultado)
+        self.variables[nodo] = variable
+
+    # exp_unario -> NEGACION exp_unario | MENOS exp_unario | primario
+    def _exp_unario(self, nodo):
+        operador = nodo.hijos[0].valor
+        if operador in ('NEGACION', 'MENOS'):
+            tipo = TIPO_BOOLEANO if operador == 'NEGACION' else TIPO_NUMERO
+            yield nodo.hijos[1]
+            self._igualar(self._de(nodo.hijos[1]), tipo)
+            self.variables[nodo] = self.conjuntos.constante(tipo)
+        else:
+            yield nodo.hijos[0]
+            self.variables[nodo] = self._de(nodo.hijos[0])
+
+    # primario -> literal | IDENTIFICADOR primario_llamada_opcional | PAR_IZQ expresion PAR_DER
+    def _primario(self, nodo):
+        primer_hijo = nodo.hijos[0]
+        if primer_hijo.valor in LITERALES:
+            self.variables[nodo] = self.conjuntos.constante(LITERALES[primer_hijo.valor])
+        elif primer_hijo.valor == 'IDENTIFICADOR':
+            entrada = self._buscar(primer_hijo)
+            llamada_nodo = nodo.hijos[1]
+            if llamada_nodo.hijos and llamada_nodo.hijos[0].valor == 'PAR_IZQ':
+                argumentos = self._argumentos(llamada_nodo.hijos[1])
+                yield from argumentos
+                self.variables[nodo] = self._llamar(entrada, primer_hijo, argumentos)
+            elif entrada is not None and entrada.categoria == 'variable':
+                self.variables[nodo] = entrada.tipo
+            else:
+                self.variables[nodo] = self.conjuntos.nueva()
+        else:
+            yield nodo.hijos[1]
+            self.variables[nodo] = self._de(nodo.hijos[1])
+
+    POR_VALOR = {
+        'PROGRAMA': _ambito,
+        'bloque': _ambito,
+        'lista_sentencias': _lista_sentencias,
+        'sentencia': _sentencia,
+        'funcion_def': _funcion_def,
+        'si_sentencia': _condicional,
+        'mientras_sentencia': _condicional,
+        'para_sentencia': _para_sentencia,
+        'exp_unario': _exp_unario,
+        'primario': _primario,
+    }
+    POR_VALOR.update(dict.fromkeys(BINARIAS, _exp_binaria))
+
+class AnalizadorSemantico:
+    def __init__(self, source_map=None, nombres=None, reporte=None):
+        self.source_map = source_map # SourceMap del léxico para reportar columnas
+        self.nombres = nombres if nombres is not None else TablaNombres() # lexer.nombres
+        self.reporte = reporte or reporte_por_defecto()
+        self.tabla_simbolos = TablaSimbolos()
+        self.firmas = {} # funcion_def -> entrada declarada antes de recorrer su lista
+        self.conflictos = {} # Conflictos de InferenciaTipos por nodo, pendientes de reportar
+        self.errores_semanticos = []
+        self.ast = None # El AST que recibiremos del analizador sintáctico
+
+    def reportar_error(self, mensaje, nodo=None):
+        token = nodo.token_original if nodo else None
+        if token is not None and self.source_map is not None:
+            linea, columna = self.source_map.linea_columna(token.lexpos)
+            self.errores_semanticos.append(f"Error Semántico (Línea {linea}, Columna {columna}): {mensaje}")
+            return
+        linea = token.lineno if token else "Desconocida"
+        self.errores_semanticos.append(f"Error Semántico (Línea {linea}): {mensaje}")
+
+    def reportar_conflictos(self, nodo):
+        # Los conflictos que InferenciaTipos dejó en este nodo, en su lugar del recorrido
+        for mensaje in self.conflictos.pop(nodo, ()):
+            self.reportar_error(mensaje, nodo)
+
+    def anotar_direccion(self, identificador_nodo, entrada):
+        # Los usos y declaraciones de variables quedan resueltos a (distancia, slot)
+        if entrada is not None and entrada.slot is not None:
+            identificador_nodo.direccion = self.tabla_simbolos.direccion(entrada)
+
+    def clave(self, token):
+        # Los identificadores del léxico ya traen su id; los demás se internan aquí
+        id_nombre = getattr(token, 'id', None)
+        if id_nombre is None:
+            id_nombre = self.nombres.internar(token.value)
+        return id_nombre
+
+    def analizar(self, ast):
+        self.ast = ast
+        if not self.ast:
+            self.reportar_error("AST vacío, no se puede realizar el análisis semántico.")
+            return False
+
+        self.reporte.debug('semantico', "\n--- Iniciando Análisis Semántico ---")
+        self.recorrer_ast(self.ast)
+
+        if self.errores_semanticos:
+            self.reporte.error('semantico', "\n--- Errores Semánticos Encontrados ---")
+            for error in self.errores_semanticos:
+                self.reporte.error('semantico', error)
+            self.reporte.error('semantico', "-------------------------------------\n")
+            return False
+        else:
+            self.reporte.info('semantico', "\n✅ Análisis Semántico Completado sin errores.")
+            self.tabla_simbolos.display_scopes(self.reporte)
+            return True
+
+    def recorrer_ast(self, nodo):
+        # Visitante con tablas de despacho: cada nodo se resuelve con una
+        # búsqueda por el id de producción que anotó el parser
+        # (POR_PRODUCCION) o, si no hay regla para esa producción, por el
+        # tipo de nodo (POR_VALOR). Los manejadores que recorren hijos son
+        # generadores: cada `yield hijo` recorre ese subárbol antes de
+        # continuar. La pila es explícita, sin recursión de Python, así que
+        # ni los programas largos ni las expresiones muy anidadas la agotan.
+        if not nodo:
+            return
+        por_produccion = self.POR_PRODUCCION
+        por_valor = self.POR_VALOR
+        visitar_hijos = AnalizadorSemantico._visitar_hijos
+        pila = [iter((nodo,))]
+        while pila:
+            try:
+                hijo = next(pila[-1])
+            except StopIteration:
+                pila.pop()
+                continue
+            if not hijo:
+                continue
+            manejador = por_produccion.get(hijo.produccion) or por_valor.get(hijo.valor, visitar_hijos)
+            visita = manejador(self, hijo)
+            if visita is not None:
+                pila.append(visita)
+
+    def _visitar_hijos(self, nodo):
+        # Para nodos terminales que no son manejados explícitamente pero pueden tener un token_original
+        if nodo.token_original:
+            # No hay acción semántica directa, pero se asegura que el token_original esté presente
+            return None
+        # Recorrer hijos para reglas no específicas o para asegurar el paso
+        return iter(nodo.hijos)
+
+    def _por_cuerpo(self, nodo):
+        # Árbol sin ids de producción (armado a mano o con otra tabla): la
+        # producción se deduce de los hijos
+        if nodo.produccion is None:
+            cuerpo = ['ε' if hijo.valor == 'epsilon_node' else hijo.valor for hijo in nodo.hijos]
+            produccion = buscar_produccion(nodo.valor, cuerpo)
+            manejador = self.POR_PRODUCCION.get(produccion)
+            if manejador is not None:
+                return manejador(self, nodo)
+        return self._visitar_hijos(nodo)
+
+    # Reglas semánticas basadas en la gramática
+    # PROGRAMA -> lista_sentencias
+    def _programa(self, nodo):
+        # Tipos de parámetros y de retorno, antes de declarar ninguna función
+        inferencia = InferenciaTipos(self)
+        inferencia.inferir(nodo)
+        self.conflictos = inferencia.conflictos
+        self.tabla_simbolos.push_scope(marco=True) # Ámbito global
+        for hijo in nodo.hijos:
+            yield hijo
+        nodo.tamano_marco = self.tabla_simbolos.pop_scope()
+        for conflicto_nodo in list(self.conflictos): # Los de nodos que no se visitaron
+            self.reportar_conflictos(conflicto_nodo)
+
+    # lista_sentencias -> sentencia lista_sentencias | ε (aplanado: [sentencia, ...] o [ε])
+    def _lista_sentencias(self, nodo):
+        # Pre-pasada por las sentencias de la lista: las firmas de sus
+        # funciones se declaran antes de recorrerlas, así que una función se
+        # puede llamar antes de su definición. Cada sentencia se mira una vez
+        # más, el recorrido sigue siendo lineal. Aquí no se reporta nada: el
+        # nombre repetido se informa al visitar su funcion_def, en orden de
+        # fuente.
+        for sentencia in nodo.hijos:
+            if sentencia.hijos and sentencia.hijos[0].valor == 'funcion_def':
+                funcion_nodo = sentencia.hijos[0]
+                self.firmas[funcion_nodo] = self._declarar_funcion(funcion_nodo)
+        return iter(nodo.hijos)
+
+    # sentencia -> VAR IDENTIFICADOR IGUAL expresion PUNTOYCOMA
+    def _sentencia_var(self, nodo):
+        # Declaración de variable
+        identificador_nodo = nodo.hijos[1] # IDENTIFICADOR
+        expresion_nodo = nodo.hijos[3] # expresion
+
+        yield expresion_nodo # Evaluar el tipo de la expresión
+        tipo_expresion = expresion_nodo.tipo
+
+        nombre_var = identificador_nodo.token_original.value
+        clave = self.clave(identificador_nodo.token_original)
+        if not self.tabla_simbolos.add_symbol(nombre_var, tipo_expresion, 'variable', clave=clave):
+            self.reportar_error(f"Variable '{nombre_var}' ya declarada en este ámbito.", identificador_nodo)
+        else:
+            self.anotar_direccion(identificador_nodo, self.tabla_simbolos.lookup_symbol(clave))
+            if self.reporte.depuracion:
+                self.reporte.debug('semantico', f"Declarada variable '{nombre_var}' de tipo {tipo_expresion}")
+
+    # sentencia -> IDENTIFICADOR asignacion_o_llamada PUNTOYCOMA
+    def _sentencia_identificador(self, nodo):
+        identificador_nodo = nodo.hijos[0]
+        nombre_id = identificador_nodo.token_original.value
+        entrada_simbolo = self.tabla_simbolos.lookup_symbol(self.clave(identificador_nodo.token_original))
+
+        if not entrada_simbolo:
+            self.reportar_error(f"Uso de identificador no declarado '{nombre_id}'.", identificador_nodo)
+            # Asignar un tipo desconocido para evitar cascada de errores
+            identificador_nodo.tipo = TIPO_DESCONOCIDO
+        else:
+            identificador_nodo.tipo = entrada_simbolo.tipo
+            identificador_nodo.categoria = entrada_simbolo.categoria
+            self.anotar_direccion(identificador_nodo, entrada_simbolo)
+
+        asignacion_o_llamada_nodo = nodo.hijos[1]
+        yield asignacion_o_llamada_nodo # Esto manejará la asignación o la llamada
+
+        # Después de recorrer asignacion_o_llamada, verificar si es una asignación
+        if asignacion_o_llamada_nodo.hijos and asignacion_o_llamada_nodo.hijos[0].valor == 'IGUAL':
+            # Es una asignación
+            if entrada_simbolo and entrada_simbolo.categoria != 'variable':
+                self.reportar_error(f"No se puede asignar a '{nombre_id}' porque no es una variable.", identificador_nodo)
+            else:
+                tipo_expresion_asignada = asignacion_o_llamada_nodo.hijos[1].tipo
+                if entrada_simbolo and entrada_simbolo.tipo != tipo_expresion_asignada and tipo_expresion_asignada != TIPO_DESCONOCIDO:
+                    self.reportar_error(f"Incompatibilidad de tipos en la asignación de '{nombre_id}': se esperaba {entrada_simbolo.tipo}, se obtuvo {tipo_expresion_asignada}.", identificador_nodo)
+                if self.reporte.depuracion:
+                    self.reporte.debug('semantico', f"Asignación a '{nombre_id}' (tipo {entrada_simbolo.tipo if entrada_simbolo else 'Desconocido'})")
+        elif asignacion_o_llamada_nodo.hijos and asignacion_o_llamada_nodo.hijos[0].valor == 'PAR_IZQ':
+            # Es una llamada a función
+            if entrada_simbolo and entrada_simbolo.categoria != 'funcion':
+                self.reportar_error(f"'{nombre_id}' no es una función y no puede ser llamada.", identificador_nodo)
+            elif entrada_simbolo:
+                # _llamada dejó en el nodo la cantidad de argumentos
+                num_args_pasados = asignacion_o_llamada_nodo.num_args
+                if entrada_simbolo.num_params != num_args_pasados:
+                    self.reportar_error(f"Llamada a función '{nombre_id}' con {num_args_pasados} argumentos, se esperaban {entrada_simbolo.num_params}.", identificador_nodo)
+            self.reportar_conflictos(identificador_nodo)
+
+    # sentencia -> RETORNAR expresion PUNTOYCOMA
+    def _sentencia_retornar(self, nodo):
+        expresion_nodo = nodo.hijos[1]
+        yield expresion_nodo
+        tipo_retorno = expresion_nodo.tipo
+        # Los retornos de tipos distintos en una misma función los detectó
+        # InferenciaTipos al inferir su tipo de retorno
+        self.reportar_conflictos(nodo.hijos[0])
+        if self.reporte.depuracion:
+            self.reporte.debug('semantico', f"Sentencia 'retornar' con tipo {tipo_retorno}")
+
+    # sentencia -> IMPRIMIR PAR_IZQ lista_argumentos PAR_DER PUNTOYCOMA
+    def _sentencia_imprimir(self, nodo):
+        lista_argumentos_nodo = nodo.hijos[2]
+        yield lista_argumentos_nodo
+        # No hay verificación de tipo estricta para imprimir, puede tomar cualquier tipo.
+        if self.reporte.depuracion:
+            self.reporte.debug('semantico', "Sentencia 'imprimir'")
+
+    # si_sentencia -> SI PAR_IZQ expresion PAR_DER bloque sino_parte
+    def _si_sentencia(self, nodo):
+        condicion_nodo = nodo.hijos[2]
+        yield condicion_nodo
+        tipo_condicion = condicion_nodo.tipo
+        if tipo_condicion != TIPO_BOOLEANO and tipo_condicion != TIPO_DESCONOCIDO:
+            self.reportar_error(f"La condición de la sentencia 'si' debe ser de tipo BOOLEANO, se obtuvo {tipo_condicion}.", condicion_nodo)
+
+        yield nodo.hijos[4] # bloque
+        yield nodo.hijos[5] # sino_parte
+        if self.reporte.depuracion:
+            self.reporte.debug('semantico', "Sentencia 'si'")
+
+    # mientras_sentencia -> MIENTRAS PAR_IZQ expresion PAR_DER bloque
+    def _mientras_sentencia(self, nodo):
+        condicion_nodo = nodo.hijos[2]
+        yield condicion_nodo
+        tipo_condicion = condicion_nodo.tipo
+        if tipo_condicion != TIPO_BOOLEANO and tipo_condicion != TIPO_DESCONOCIDO:
+            self.reportar_error(f"La condición de la sentencia 'mientras' debe ser de tipo BOOLEANO, se obtuvo {tipo_condicion}.", condicion_nodo)
+
+        yield nodo.hijos[4] # bloque
+        if self.reporte.depuracion:
+            self.reporte.debug('semantico', "Sentencia 'mientras'")
+
+    # para_sentencia -> PARA PAR_IZQ para_inicio PUNTOYCOMA expresion PUNTOYCOMA IDENTIFICADOR IGUAL expresion PAR_DER bloque
+    def _para_sentencia(self, nodo):
+        self.tabla_simbolos.push_scope() # Nuevo ámbito para el bucle for
+        yield nodo.hijos[2] # para_inicio
+
+        condicion_nodo = nodo.hijos[4] # expresion (condición)
+        yield condicion_nodo
+        tipo_condicion = condicion_nodo.tipo
+        if tipo_condicion != TIPO_BOOLEANO and tipo_condicion != TIPO_DESCONOCIDO:
+            self.reportar_error(f"La condición del bucle 'para' debe ser de tipo BOOLEANO, se obtuvo {tipo_condicion}.", condicion_nodo)
+
+        # Actualización (IDENTIFICADOR IGUAL expresion)
+        identificador_actualizacion_nodo = nodo.hijos[6]
+        expresion_actualizacion_nodo = nodo.hijos[8]
+
+        nombre_id_actualizacion = identificador_actualizacion_nodo.token_original.value
+        entrada_simbolo_actualizacion = self.tabla_simbolos.lookup_symbol(self.clave(identificador_actualizacion_nodo.token_original))
+        if not entrada_simbolo_actualizacion:
+            self.reportar_error(f"Variable de actualización '{nombre_id_actualizacion}' no declarada en el bucle 'para'.", identificador_actualizacion_nodo)
+        elif entrada_simbolo_actualizacion.categoria != 'variable':
+            self.reportar_error(f"'{nombre_id_actualizacion}' no es una variable y no puede ser actualizada en el bucle 'para'.", identificador_actualizacion_nodo)
+        else:
+            self.anotar_direccion(identificador_actualizacion_nodo, entrada_simbolo_actualizacion)
+
+        yield expresion_actualizacion_nodo
+        tipo_expresion_actualizacion = expresion_actualizacion_nodo.tipo
+        if entrada_simbolo_actualizacion and entrada_simbolo_actualizacion.tipo != tipo_expresion_actualizacion and tipo_expresion_actualizacion != TIPO_DESCONOCIDO:
+            self.reportar_error(f"Incompatibilidad de tipos en la actualización del bucle 'para' para '{nombre_id_actualizacion}': se esperaba {entrada_simbolo_actualizacion.tipo}, se obtuvo {tipo_expresion_actualizacion}.", identificador_actualizacion_nodo)
+
+        yield nodo.hijos[10] # bloque
+        self.tabla_simbolos.pop_scope()
+        if self.reporte.depuracion:
+            self.reporte.debug('semantico', "Sentencia 'para'")
+
+    # para_inicio -> VAR IDENTIFICADOR IGUAL expresion
+    def _para_inicio_var(self, nodo):
+        identificador_nodo = nodo.hijos[1]
+        expresion_nodo = nodo.hijos[3]
+        yield expresion_nodo
+        tipo_expresion = expresion_nodo.tipo
+        nombre_var = identificador_nodo.token_original.value
+        clave = self.clave(identificador_nodo.token_original)
+        if not self.tabla_simbolos.add_symbol(nombre_var, tipo_expresion, 'variable', clave=clave):
+            self.reportar_error(f"Variable '{nombre_var}' ya declarada en este ámbito del bucle 'para'.", identificador_nodo)
+        else:
+            self.anotar_direccion(identificador_nodo, self.tabla_simbolos.lookup_symbol(clave))
+        if self.reporte.depuracion:
+            self.reporte.debug('semantico', f"Declarada variable de inicio de 'para' '{nombre_var}' de tipo {tipo_expresion}")
+
+    # para_inicio -> IDENTIFICADOR IGUAL expresion
+    def _para_inicio_identificador(self, nodo):
+        identificador_nodo = nodo.hijos[0]
+        expresion_nodo = nodo.hijos[2]
+        nombre_id = identificador_nodo.token_original.value
+        entrada_simbolo = self.tabla_simbolos.lookup_symbol(self.clave(identificador_nodo.token_original))
+        if not entrada_simbolo:
+            self.reportar_error(f"Variable '{nombre_id}' no declarada para la inicialización del bucle 'para'.", identificador_nodo)
+        elif entrada_simbolo.categoria != 'variable':
+            self.reportar_error(f"'{nombre_id}' no es una variable y no puede ser inicializada en el bucle 'para'.", identificador_nodo)
+        else:
+            self.anotar_direccion(identificador_nodo, entrada_simbolo)
+
+        yield expresion_nodo
+        tipo_expresion = expresion_nodo.tipo
+        if entrada_simbolo and entrada_simbolo.tipo != tipo_expresion and tipo_expresion != TIPO_DESCONOCIDO:
+            self.reportar_error(f"Incompatibilidad de tipos en la inicialización del bucle 'para' para '{nombre_id}': se esperaba {entrada_simbolo.tipo}, se obtuvo {tipo_expresion}.", identificador_nodo)
+        if self.reporte.depuracion:
+            self.reporte.debug('semantico', f"Inicialización de variable de 'para' '{nombre_id}' (tipo {entrada_simbolo.tipo if entrada_simbolo else 'Desconocido'})")
+
+    # funcion_def -> DEFINIR IDENTIFICADOR PAR_IZQ parametros PAR_DER bloque
+    def _funcion_def(self, nodo):
+        parametros_nodo = nodo.hijos[3]
+        bloque_nodo = nodo.hijos[5]
+
+        # La firma ya quedó declarada en la pre-pasada de la lista que la
+        # contiene; si el nodo llega sin ella, se declara aquí
+        if nodo in self.firmas:
+            entrada_funcion = self.firmas.pop(nodo)
+        else:
+            entrada_funcion = self._declarar_funcion(nodo)
+        identificador_nodo = nodo.hijos[1]
+        nombre_funcion = identificador_nodo.token_original.value
+        if entrada_funcion is None:
+            self.reportar_error(f"Función '{nombre_funcion}' ya declarada en este ámbito.", identificador_nodo)
+        elif self.reporte.depuracion:
+            self.reporte.debug('semantico', f"Declarada función '{nombre_funcion}' con {entrada_funcion.num_params} parámetros.")
+
+        self.tabla_simbolos.push_scope(marco=True) # Nuevo ámbito (y marco) para la función
+        yield parametros_nodo # Declarar parámetros en el nuevo ámbito
+        yield bloque_nodo # Recorrer el cuerpo de la función
+        nodo.tamano_marco = self.tabla_simbolos.pop_scope()
+        if entrada_funcion is not None:
+            entrada_funcion.tamano_marco = nodo.tamano_marco
+
+    def _declarar_funcion(self, nodo):
+        # Declara la firma (nombre y cantidad de parámetros) de un funcion_def
+        # en el ámbito actual; devuelve su entrada o None si el nombre ya
+        # existe (el error lo reporta _funcion_def)
+        identificador_nodo = nodo.hijos[1]
+        nombre_funcion = identificador_nodo.token_original.value
+        parametros_nodo = nodo.hijos[3]
+
+        # Contar parámetros para la tabla de símbolos
+        num_params = 0
+        if parametros_nodo.hijos and parametros_nodo.hijos[0].valor != 'epsilon_node':
+            num_params = 1 # Al menos un parámetro
+            # parametros_cont aplanado: [COMA, IDENTIFICADOR, COMA, IDENTIFICADOR, ...]
+            num_params += sum(1 for hijo in parametros_nodo.hijos[1].hijos if hijo.valor == 'COMA')
+
+        clave = self.clave(identificador_nodo.token_original)
+        tipo_retorno = nodo.tipo or TIPO_VOID # Inferido por InferenciaTipos; sin inferencia, VOID
+        if not self.tabla_simbolos.add_symbol(nombre_funcion, tipo_retorno, 'funcion', num_params=num_params, clave=clave):
+            return None
+        return self.tabla_simbolos.lookup_symbol(clave)
+
+    # parametros -> IDENTIFICADOR parametros_cont
+    def _parametros(self, nodo):
+        identificador_param_nodo = nodo.hijos[0]
+        nombre_param = identificador_param_nodo.token_original.value
+        # El tipo del parámetro lo infirió InferenciaTipos de sus usos y llamadas
+        self._declarar_parametro(identificador_param_nodo)
+        if self.reporte.depuracion:
+            self.reporte.debug('semantico', f"Declarado parámetro '{nombre_param}' de tipo {identificador_param_nodo.tipo}")
+        yield nodo.hijos[1] # parametros_cont
+
+    # parametros_cont -> COMA IDENTIFICADOR parametros_cont | ε (aplanado: [COMA, IDENTIFICADOR, ...] o [ε])
+    def _parametros_cont(self, nodo):
+        for coma, identificador_param_nodo in zip(nodo.hijos[0::2], nodo.hijos[1::2]):
+            if coma.valor != 'COMA':
+                break
+            nombre_param = identificador_param_nodo.token_original.value
+            self._declarar_parametro(identificador_param_nodo)
+            if self.reporte.depuracion:
+                self.reporte.debug('semantico', f"Declarado parámetro '{nombre_param}' de tipo {identificador_param_nodo.tipo}")
+
+    def _declarar_parametro(self, identificador_param_nodo):
+        # Los parámetros ocupan los primeros slots del marco de la función. Sin
+        # tipo inferido (árbol sin PROGRAMA) se asume NUMERO
+        nombre_param = identificador_param_nodo.token_original.value
+        clave = self.clave(identificador_param_nodo.token_original)
+        tipo_param = identificador_param_nodo.tipo or TIPO_NUMERO
+        if not self.tabla_simbolos.add_symbol(nombre_param, tipo_param, 'variable', clave=clave):
+            self.reportar_error(f"Parámetro '{nombre_param}' ya declarado en esta función.", identificador_param_nodo)
+        else:
+            self.anotar_direccion(identificador_param_nodo, self.tabla_simbolos.lookup_symbol(clave))
+
+    # bloque -> LLAVE_IZQ lista_sentencias LLAVE_DER
+    def _bloque(self, nodo):
+        self.tabla_simbolos.push_scope() # Nuevo ámbito para el bloque
+        yield nodo.hijos[1] # lista_sentencias
+        self.tabla_simbolos.pop_scope()
+
+    # asignacion_o_llamada -> IGUAL expresion
+    def _asignacion(self, nodo):
+        yield nodo.hijos[1] # expresion
+        # El tipo de la expresión se adjuntará al nodo de la expresión
+        nodo.tipo = nodo.hijos[1].tipo
+
+    # asignacion_o_llamada -> PAR_IZQ lista_argumentos PAR_DER
+    def _llamada(self, nodo):
+        yield nodo.hijos[1] # lista_argumentos
+        # La cantidad queda en el nodo: _sentencia_identificador, que tiene la
+        # entrada de la función llamada, la compara con num_params
+        nodo.num_args = nodo.hijos[1].num_args
+        if self.reporte.depuracion:
+            self.reporte.debug('semantico', f"Llamada a función con {nodo.num_args} argumentos.")
+
+    # lista_argumentos -> expresion lista_argumentos_cont
+    def _lista_argumentos(self, nodo):
+        num_args = 0
+        yield nodo.hijos[0] # expresion
+        num_args += 1
+
+        # Recorrer lista_argumentos_cont (aplanado: [COMA, expresion, ...]) para contar más argumentos
+        for coma, expresion_nodo in zip(nodo.hijos[1].hijos[0::2], nodo.hijos[1].hijos[1::2]):
+            if coma.valor != 'COMA':
+                break
+            yield expresion_nodo
+            num_args += 1
+        self._contar_argumentos(nodo, num_args)
+
+    # lista_argumentos -> ε
+    def _lista_argumentos_vacia(self, nodo):
+        self._contar_argumentos(nodo, 0)
+
+    def _contar_argumentos(self, nodo, num_args):
+        nodo.num_args = num_args # Adjuntar el número de argumentos al nodo
+        if self.reporte.depuracion:
+            self.reporte.debug('semantico', f"Evaluando lista de argumentos: {num_args} argumentos.")
+
+    # lista_argumentos_cont -> COMA expresion lista_argumentos_cont | ε
+    def _lista_argumentos_cont(self, nodo):
+        # Los argumentos ya se procesan en lista_argumentos para el conteo
+        pass
+
+    # sino_parte -> SINO bloque
+    def _sino_parte(self, nodo):
+        return iter((nodo.hijos[1],)) # bloque
+
+    # sino_parte -> ε, parametros -> ε
+    def _vacia(self, nodo):
+        pass
+
+    # Expresiones (orden de precedencia de menor a mayor)
+    # expresion -> exp_logico_and exp_logico_or_resto
+    def _expresion(self, nodo):
+        yield nodo.hijos[0] # exp_logico_and
+        yield nodo.hijos[1] # exp_logico_or_resto
+        self._combinar(nodo)
+
+    # exp_logico_and -> exp_igualdad exp_logico_and_resto
+    def _exp_logico_and(self, nodo):
+        yield nodo.hijos[0] # exp_igualdad
+        yield nodo.hijos[1] # exp_logico_and_resto
+        self._combinar(nodo)
+
+    # exp_igualdad -> exp_comparacion exp_igualdad_resto
+    def _exp_igualdad(self, nodo):
+        yield nodo.hijos[0] # exp_comparacion
+        yield nodo.hijos[1] # exp_igualdad_resto
+        self._combinar(nodo)
+
+    # exp_comparacion -> exp_suma exp_comparacion_resto
+    def _exp_comparacion(self, nodo):
+        yield nodo.hijos[0] # exp_suma
+        yield nodo.hijos[1] # exp_comparacion_resto
+        self._combinar(nodo)
+
+    # exp_suma -> exp_mult exp_suma_resto
+    def _exp_suma(self, nodo):
+        yield nodo.hijos[0] # exp_mult
+        yield nodo.hijos[1] # exp_suma_resto
+        self._combinar(nodo)
+
+    # exp_mult -> exp_potencia exp_mult_resto
+    def _exp_mult(self, nodo):
+        yield nodo.hijos[0] # exp_potencia
+        yield nodo.hijos[1] # exp_mult_resto
+        self._combinar(nodo)
+
+    # exp_potencia -> exp_unario exp_potencia_resto
+    def _exp_potencia(self, nodo):
+        yield nodo.hijos[0] # exp_unario
+        yield nodo.hijos[1] # exp_potencia_resto
+        self._combinar(nodo)
+
+    def _combinar(self, nodo):
+        # El tipo de la cadena se combina de izquierda a derecha con los
+        # operandos del resto aplanado. Un operando DESCONOCIDO ya tuvo su
+        # error: la cadena queda DESCONOCIDO sin volver a reportarlo
+        operadores, regla, mensaje = RESTOS[nodo.hijos[1].valor]
+        tipo = nodo.hijos[0].tipo
+        for operador, operando in _pares_resto(nodo.hijos[1], operadores):
+            tipo_der = operando.tipo
+            if tipo == TIPO_DESCONOCIDO or tipo_der == TIPO_DESCONOCIDO:
+                tipo = TIPO_DESCONOCIDO
+                continue
+            resultado = regla(operador, tipo, tipo_der)
+            if resultado is None:
+                self.reportar_error(mensaje.format(tipo, tipo_der), nodo)
+                resultado = TIPO_DESCONOCIDO
+            tipo = resultado
+        nodo.tipo = tipo
+
+    # exp_*_resto -> op exp_* exp_*_resto | ε (aplanado: [op1, e1, op2, e2, ...] o [ε])
+    def _resto(self, nodo):
+        # Solo recorre los operandos; el tipo lo combina el exp_* padre
+        for _, operando in _pares_resto(nodo, RESTOS[nodo.valor][0]):
+            yield operando
+
+    # exp_unario -> NEGACION exp_unario
+    def _negacion(self, nodo):
+        yield nodo.hijos[1] # exp_unario
+        tipo_op = nodo.hijos[1].tipo
+        if tipo_op == TIPO_BOOLEANO:
+            nodo.tipo = TIPO_BOOLEANO
+        else:
+            self.reportar_error(f"Operador de negación '!' requiere operando BOOLEANO, se obtuvo {tipo_op}.", nodo)
+            nodo.tipo = TIPO_DESCONOCIDO
+
+    # exp_unario -> MENOS exp_unario
+    def _menos_unario(self, nodo):
+        yield nodo.hijos[1] # exp_unario
+        tipo_op = nodo.hijos[1].tipo
+        if tipo_op == TIPO_NUMERO:
+            nodo.tipo = TIPO_NUMERO
+        else:
+            self.reportar_error(f"Operador unario '-' requiere operando NUMERO, se obtuvo {tipo_op}.", nodo)
+            nodo.tipo = TIPO_DESCONOCIDO
+
+    # exp_unario -> primario
+    def _exp_unario_primario(self, nodo):
+        yield nodo.hijos[0]
+        nodo.tipo = nodo.hijos[0].tipo
+
+    # primario -> NUMERO | CADENA | VERDADERO | FALSO (el tipo de cada literal en LITERALES)
+    def _primario_literal(self, nodo):
+        primer_hijo = nodo.hijos[0]
+        nodo.tipo = LITERALES[primer_hijo.valor]
+        self._token_primario(nodo, primer_hijo)
+
+    # primario -> IDENTIFICADOR primario_llamada_opcional
+    def _primario_identificador(self, nodo):
+        primer_hijo = nodo.hijos[0]
+        nombre_id = primer_hijo.token_original.value
+        entrada_simbolo = self.tabla_simbolos.lookup_symbol(self.clave(primer_hijo.token_original))
+        if not entrada_simbolo:
+            self.reportar_error(f"Uso de identificador no declarado '{nombre_id}'.", primer_hijo)
+            nodo.tipo = TIPO_DESCONOCIDO
+        else:
+            nodo.tipo = entrada_simbolo.tipo
+            nodo.categoria = entrada_simbolo.categoria # Para verificar si es función o variable
+            self.anotar_direccion(primer_hijo, entrada_simbolo)
+
+        # Procesar primario_llamada_opcional
+        yield nodo.hijos[1]
+
+        # Si es una llamada a función, el tipo del primario es el tipo de retorno de la función
+        if nodo.hijos[1].es_llamada:
+            if entrada_simbolo and entrada_simbolo.categoria == 'funcion':
+                nodo.tipo = entrada_simbolo.tipo # Asumimos que el tipo de la función es su tipo de retorno
+                # Verificar número de argumentos
+                num_args_pasados = nodo.hijos[1].num_args
+                if entrada_simbolo.num_params != num_args_pasados:
+                    self.reportar_error(f"Llamada a función '{nombre_id}' con {num_args_pasados} argumentos, se esperaban {entrada_simbolo.num_params}.", primer_hijo)
+            else:
+                self.reportar_error(f"'{nombre_id}' no es una función y no puede ser llamada.", primer_hijo)
+                nodo.tipo = TIPO_DESCONOCIDO
+            self.reportar_conflictos(primer_hijo)
+        self._token_primario(nodo, primer_hijo)
+
+    # primario -> PAR_IZQ expresion PAR_DER
+    def _primario_parentesis(self, nodo):
+        yield nodo.hijos[1] # expresion dentro de paréntesis
+        nodo.tipo = nodo.hijos[1].tipo
+        self._token_primario(nodo, nodo.hijos[0])
+
+    def _token_primario(self, nodo, primer_hijo):
+        # Adjuntar el token original al nodo primario si es un literal o identificador
+        if primer_hijo.token_original:
+            nodo.token_original = primer_hijo.token_original
+
+    # primario_llamada_opcional -> PAR_IZQ lista_argumentos PAR_DER
+    def _llamada_opcional(self, nodo):
+        nodo.es_llamada = True # Marcar que es una llamada
+        yield nodo.hijos[1] # lista_argumentos
+        nodo.num_args = nodo.hijos[1].num_args
+
+    # primario_llamada_opcional -> ε
+    def _sin_llamada(self, nodo):
+        nodo.es_llamada = False
+
+    # Tipo de nodo -> manejador. Los tipos con reglas por producción van a
+    # _por_cuerpo, que solo se usa si el parser no anotó la producción
+    POR_VALOR = {
+        'PROGRAMA': _programa,
+        'lista_sentencias': _lista_sentencias,
+        'sentencia': _por_cuerpo,
+        'si_sentencia': _si_sentencia,
+        'mientras_sentencia': _mientras_sentencia,
+        'para_sentencia': _para_sentencia,
+        'para_inicio': _por_cuerpo,
+        'funcion_def': _funcion_def,
+        'parametros': _por_cuerpo,
+        'parametros_cont': _parametros_cont,
+        'bloque': _bloque,
+        'asignacion_o_llamada': _por_cuerpo,
+        'lista_argumentos': _por_cuerpo,
+        'lista_argumentos_cont': _lista_argumentos_cont,
+        'sino_parte': _por_cuerpo,
+        'expresion': _expresion,
+        'exp_logico_and': _exp_logico_and,
+        'exp_igualdad': _exp_igualdad,
+        'exp_comparacion': _exp_comparacion,
+        'exp_suma': _exp_suma,
+        'exp_mult': _exp_mult,
+        'exp_potencia': _exp_potencia,
+        'exp_unario': _por_cuerpo,
+        'primario': _por_cuerpo,
+        'primario_llamada_opcional': _por_cuerpo,
+    }
+    POR_VALOR.update(dict.fromkeys(RESTOS, _resto))
+
+    # id de producción (Nodo.produccion) -> manejador
+    POR_PRODUCCION = {id_produccion(cabeza, cuerpo.split()): manejador for cabeza, cuerpo, manejador in (
+        ('sentencia', 'VAR IDENTIFICADOR IGUAL expresion PUNTOYCOMA', _sentencia_var),
+        ('sentencia', 'IDENTIFICADOR asignacion_o_llamada PUNTOYCOMA', _sentencia_identificador),
+        ('sentencia', 'RETORNAR expresion PUNTOYCOMA', _sentencia_retornar),
+        ('sentencia', 'IMPRIMIR PAR_IZQ lista_argumentos PAR_DER PUNTOYCOMA', _sentencia_imprimir),
+        ('para_inicio', 'VAR IDENTIFICADOR IGUAL expresion', _para_inicio_var),
+        ('para_inicio', 'IDENTIFICADOR IGUAL expresion', _para_inicio_identificador),
+        ('parametros', 'IDENTIFICADOR parametros_cont', _parametros),
+        ('parametros', 'ε', _vacia),
+        ('asignacion_o_llamada', 'IGUAL expresion', _asignacion),
+        ('asignacion_o_llamada', 'PAR_IZQ lista_argumentos PAR_DER', _llamada),
+        ('lista_argumentos', 'expresion lista_argumentos_cont', _lista_argumentos),
+        ('lista_argumentos', 'ε', _lista_argumentos_vacia),
+        ('sino_parte', 'SINO bloque', _sino_parte),
+        ('sino_parte', 'ε', _vacia),
+        ('exp_unario', 'NEGACION exp_unario', _negacion),
+        ('exp_unario', 'MENOS exp_unario', _menos_unario),
+        ('exp_unario', 'primario', _exp_unario_primario),
+        ('primario', 'NUMERO', _primario_literal),
+        ('primario', 'CADENA', _primario_literal),
+        ('primario', 'VERDADERO', _primario_literal),
+        ('primario', 'FALSO', _primario_literal),
+        ('primario', 'IDENTIFICADOR primario_llamada_opcional', _primario_identificador),
+        ('primario', 'PAR_IZQ expresion PAR_DER', _primario_parentesis),
+        ('primario_llamada_opcional', 'PAR_IZQ lista_argumentos PAR_DER', _llamada_opcional),
+        ('primario_llamada_opcional', 'ε', _sin_llamada),
+    )}
+
+# Integración con el main del analizador sintáctico
+if __name__ == '__main__':
+    configurar(DEPURACION)
+    # Asegúrate de que los imports de AnalizadorSintactico y AnalizadorLexico estén correctos
+    # y que las funciones como analyze_file, cargar_tabla_desde_csv, parser_ll1, etc., estén disponibles.
+    
+    # Simulación de imports para que este archivo pueda ejecutarse directamente para pruebas
+    try:
+        from AnalizadorSintactico import Nodo, parser_ll1, cargar_tabla_desde_csv, exportar_arbol_a_graphviz, imprimir_arbol
+        from AnalizadorLexico import analyze_file, lexer
+    except ImportError:
+        print("Asegúrate de que 'AnalizadorSintactico.py' y 'AnalizadorLexico.py' estén en el mismo directorio.")
+        print("Este script está diseñado para ser ejecutado después de que el análisis sintáctico genere un AST.")
+        exit()
+
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    tabla_csv_path = os.path.join(BASE_DIR, "table_ll1.csv")
+    archivo_entrada_path = os.path.join(BASE_DIR, "Inputs", "programa.serpy")
+    archivo_salida_graphviz = "arbol_parseo_semantico.dot"
+
+    if not os.path.exists(tabla_csv_path):
+        print(f"Error: No se encontró la tabla de parsing en {tabla_csv_path}")
+        print("Ejecute primero creadorTabla.py para generar la tabla")
+        exit(1)
+    
+    if not os.path.exists(archivo_entrada_path):
+        print(f"Creando archivo de ejemplo en: {archivo_entrada_path}")
+        os.makedirs(os.path.dirname(archivo_entrada_path), exist_ok=True)
+        with open(archivo_entrada_path, 'w', encoding='utf-8') as f:
+            f.write("""var x = 10;
+imprimir(x);
+
+definir suma(a, b) {
+    retornar a + b;
+}
+
+var resultado = suma(5, 3);
+imprimir(resultado);
+
+var y = "hola";
+var z = y + " mundo"; # Concatenación de cadenas
+imprimir(z);
+
+var es_cierto = verdadero;
+si (es_cierto && (10 > 5)) {
+    imprimir("Condición verdadera");
+} sino {
+    imprimir("Condición falsa");
+}
+
+var contador = 0;
+mientras (contador < 3) {
+    imprimir(contador);
+    contador = contador + 1;
+}
+
+para (var i = 0; i < 5; i = i + 1) {
+    imprimir(i);
+}
+
+# Ejemplo con error semántico: re-declaración de variable
+# var x = 20;
+
+# Ejemplo con error semántico: uso de variable no declarada
+# imprimir(no_existe);
+
+# Ejemplo con error semántico: asignación de tipo incorrecto
+# var num = 10;
+# num = "texto";
+
+# Ejemplo con error semántico: operación de tipos incompatibles
+# var res_error = 5 + "texto";
+
+# Ejemplo con error semántico: llamada a función con argumentos incorrectos
+# suma(1);
+""")
+    
+    print(f"--- Cargando tabla de parsing desde: {tabla_csv_path} ---")
+    tabla_parsing = cargar_tabla_desde_csv(tabla_csv_path)
+    
+    if tabla_parsing is None:
+        print("No se pudo continuar debido a un error al cargar la tabla de parsing.")
+        exit(1)
+    
+    print(f"--- Analizando léxicamente el archivo: {archivo_entrada_path} ---")
+    lista_de_tokens = analyze_file(archivo_entrada_path) 
+
+    if not lista_de_tokens:
+        print("\n❌ Error durante el análisis léxico o el archivo no contiene tokens.")
+        exit(1)
+    
+    print(f"--- Iniciando análisis sintáctico ---")
+    arbol_sintactico = parser_ll1(lista_de_tokens, tabla_parsing, start_symbol='PROGRAMA', source_map=lexer.source_map)
+
+    if arbol_sintactico:
+        print("\n✅ Entrada aceptada por el analizador sintáctico.")
+        
+        print("\nEstructura del árbol sintáctico (antes de semántico):")
+        imprimir_arbol(arbol_sintactico)
+        
+        print(f"\n--- Iniciando Análisis Semántico para {archivo_entrada_path} ---")
+        analizador_semantico = AnalizadorSemantico(source_map=lexer.source_map, nombres=lexer.nombres)
+        semantico_ok = analizador_semantico.analizar(arbol_sintactico)
+
+        if semantico_ok:
+            print("\nAnálisis Semántico Exitoso. Generando Graphviz del AST con información semántica.")
+            exportar_arbol_a_graphviz(arbol_sintactico, archivo_salida_graphviz)
+        else:
+            print("\nAnálisis Semántico Fallido. No se generará el archivo Graphviz.")
+            for error in analizador_semantico.errores_semanticos:
+                print(error)
+        
+    else:
+        print("\n❌ Entrada rechazada por el analizador sintáctico. No se realizará el análisis semántico.")
+        exit(1)
+
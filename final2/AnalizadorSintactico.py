@@ -1,67 +1,110 @@
 import csv
 import ply.lex as lex
-from AnalizadorLexico import analyze_file
+from AnalizadorLexico import analyze_file, lexer
+from creadorTabla import TABLAS_GENERADAS, asegurar_tabla, construir_tabla
+from Gramatica import cargar_gramatica
+from Diagnosticos import DEPURACION, configurar, reporte_por_defecto
+from Tipos import TIPO_DESCONOCIDO
 import os
 import sys
+import threading
+from types import MappingProxyType
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # Solo la carpeta actual
 
 
 class Nodo:
+    # Campos declarados (sin __dict__ por nodo), incluidos los atributos que
+    # anota el análisis semántico
+    __slots__ = ('valor', 'hijos', 'token_original', 'produccion',
+                 'tipo', 'categoria', 'num_args', 'es_llamada', 'direccion', 'tamano_marco')
+
     def __init__(self, valor, token_original=None):  
         self.valor = valor
         self.hijos = []
         self.token_original = token_original 
+        self.produccion = None # id_produccion con que el parser expandió el nodo
+        self.tipo = TIPO_DESCONOCIDO # código de tipo del semántico
+        self.categoria = None # 'variable' o 'funcion' en identificadores
+        self.num_args = 0 # argumentos de una lista_argumentos o llamada
+        self.es_llamada = False # primario_llamada_opcional con paréntesis
+        self.direccion = None # (marcos hacia arriba, slot) de una variable
+        self.tamano_marco = None # slots del marco de funcion_def y PROGRAMA
 
     def agregar_hijo(self, hijo):
         self.hijos.append(hijo)
 
     def imprimir_preorden(self):
-        print(self.valor, end='')
-        if self.hijos:
-            print(" (", end='')
-            for i, hijo in enumerate(self.hijos):
-                hijo.imprimir_preorden()
-                if i < len(self.hijos) - 1:
-                    print(", ", end='')
-            print(")", end='')
+        # Pila explícita con los nodos y los separadores pendientes
+        pila = [self]
+        while pila:
+            nodo = pila.pop()
+            if isinstance(nodo, str):
+                print(nodo, end='')
+                continue
+            print(nodo.valor, end='')
+            if nodo.hijos:
+                print(" (", end='')
+                pila.append(")")
+                for i in range(len(nodo.hijos) - 1, -1, -1):
+                    pila.append(nodo.hijos[i])
+                    if i:
+                        pila.append(", ")
 
 def imprimir_arbol(nodo, nivel=0, prefijo='', es_ultimo=True):
     espacio = '    '
     rama = '│   '
     rama_esquina = '└── '
     rama_t = '├── '
-    
-    conector = rama_esquina if es_ultimo else rama_t
-    
-    valor_display = nodo.valor
-    if nodo.valor == 'epsilon_node': 
-        valor_display = "ε"
-    elif isinstance(nodo.valor, str) and nodo.valor.startswith("'") and nodo.valor.endswith("'"):
-        valor_display = f"{nodo.valor}"
-    elif not nodo.hijos and not (isinstance(nodo.valor, str) and nodo.valor.isupper() and nodo.valor.endswith("_TOKEN")) and nodo.valor != "ε":
-        if not (isinstance(nodo.valor, str) and nodo.valor.startswith("'")):
-             valor_display = f"'{nodo.valor}'"
-
-    if nivel > 0:
-        print(f"{prefijo}{conector}{valor_display}")
-    else:
-        print(f"{espacio}{valor_display}") 
-
-    nuevo_prefijo = prefijo + (espacio if es_ultimo else rama)
-    
-    num_hijos = len(nodo.hijos)
-    for i, hijo in enumerate(nodo.hijos):
-        imprimir_arbol(hijo, nivel + 1, nuevo_prefijo, i == num_hijos - 1)
 
-def cargar_tabla_desde_csv(nombre_archivo):
+    # Pila explícita: la profundidad del árbol no depende del límite de recursión
+    pila = [(nodo, nivel, prefijo, es_ultimo)]
+    while pila:
+        nodo, nivel, prefijo, es_ultimo = pila.pop()
+        conector = rama_esquina if es_ultimo else rama_t
+
+        valor_display = nodo.valor
+        if nodo.valor == 'epsilon_node': 
+            valor_display = "ε"
+        elif isinstance(nodo.valor, str) and nodo.valor.startswith("'") and nodo.valor.endswith("'"):
+            valor_display = f"{nodo.valor}"
+        elif not nodo.hijos and not (isinstance(nodo.valor, str) and nodo.valor.isupper() and nodo.valor.endswith("_TOKEN")) and nodo.valor != "ε":
+            if not (isinstance(nodo.valor, str) and nodo.valor.startswith("'")):
+                 valor_display = f"'{nodo.valor}'"
+
+        if nivel > 0:
+            print(f"{prefijo}{conector}{valor_display}")
+        else:
+            print(f"{espacio}{valor_display}") 
+
+        nuevo_prefijo = prefijo + (espacio if es_ultimo else rama)
+        num_hijos = len(nodo.hijos)
+        for i in range(num_hijos - 1, -1, -1):
+            pila.append((nodo.hijos[i], nivel + 1, nuevo_prefijo, i == num_hijos - 1))
+
+def cargar_tabla_desde_csv(nombre_archivo, reporte=None):
+    reporte = reporte or reporte_por_defecto()
+    # Las tablas generadas desde una gramática se regeneran si esta cambió y
+    # se arman directamente desde la gramática compilada, sin leer el CSV
+    gramatica = TABLAS_GENERADAS.get(os.path.abspath(nombre_archivo))
+    if gramatica is not None and os.path.exists(gramatica):
+        try:
+            asegurar_tabla(gramatica, nombre_archivo, reporte)
+        except OSError as e:
+            # Copia de solo lectura: el CSV queda viejo, la tabla se arma igual
+            reporte.info('sintactico', f"No se pudo actualizar '{nombre_archivo}' ({e}); se usa la tabla en memoria")
+        compilada = cargar_gramatica(gramatica)
+        tabla, _ = construir_tabla(compilada)
+        # Mismo orden de columnas que el CSV
+        return {a: {t: list(fila[t]) for t in compilada.terminales if t in fila}
+                for a, fila in tabla.items()}
     tabla = {}
     try:
         with open(nombre_archivo, newline='', encoding='utf-8') as csvfile:
             reader = csv.reader(csvfile)
             encabezado_completo = next(reader)
             if not encabezado_completo:
-                print(f"Error: El archivo CSV '{nombre_archivo}' tiene una cabecera vacía.")
+                reporte.error('sintactico', f"Error: El archivo CSV '{nombre_archivo}' tiene una cabecera vacía.")
                 return None
             encabezado = encabezado_completo[1:]
 
@@ -80,13 +123,69 @@ def cargar_tabla_desde_csv(nombre_archivo):
                             else:
                                 tabla[no_terminal][terminal_header.strip()] = celda.split()
     except FileNotFoundError:
-        print(f"Error: No se encontró el archivo CSV '{nombre_archivo}'.")
+        reporte.error('sintactico', f"Error: No se encontró el archivo CSV '{nombre_archivo}'.")
         return None
     except Exception as e:
-        print(f"Error al cargar la tabla desde CSV '{nombre_archivo}': {e}")
+        reporte.error('sintactico', f"Error al cargar la tabla desde CSV '{nombre_archivo}': {e}")
         return None
     return tabla
 
+def congelar_tabla(tabla):
+    """Copia de solo lectura de una tabla LL(1) (producciones como tuplas)
+    que se puede compartir entre hilos sin copiarla por compilación"""
+    return MappingProxyType({
+        no_terminal: MappingProxyType({terminal: tuple(cuerpo) for terminal, cuerpo in fila.items()})
+        for no_terminal, fila in tabla.items()
+    })
+
+_tablas_compartidas = {}
+_candado_tablas = threading.Lock()
+
+def tabla_compartida(nombre_archivo, reporte=None):
+    """Carga y congela la tabla del CSV una sola vez por proceso"""
+    ruta = os.path.abspath(nombre_archivo)
+    with _candado_tablas:
+        tabla = _tablas_compartidas.get(ruta)
+        if tabla is None:
+            tabla = cargar_tabla_desde_csv(ruta, reporte)
+            if tabla is None:
+                return None
+            tabla = _tablas_compartidas[ruta] = congelar_tabla(tabla)
+    return tabla
+
+def no_terminales_lista(parsing_table):
+    """No terminales de lista: los que tienen una producción A -> α A y la
+    vacía (lista_sentencias, lista_argumentos_cont, parametros_cont y los
+    exp_*_resto). Los parsers los aplanan: la cola A continúa en el mismo
+    nodo, así que los elementos quedan como hermanos ([sentencia, sentencia,
+    ...] o [op, operando, op, operando, ...]) en lugar de un árbol tan
+    profundo como la lista; el ε final solo queda si la lista está vacía."""
+    listas = set()
+    for no_terminal, fila in parsing_table.items():
+        cuerpos = {tuple(cuerpo) for cuerpo in fila.values()}
+        if ('ε',) in cuerpos and any(len(c) > 1 and c[-1] == no_terminal for c in cuerpos):
+            listas.add(no_terminal)
+    return frozenset(listas)
+
+# Cada producción distinta (cabeza, cuerpo) recibe un id entero denso, el
+# mismo para todo el proceso; los parsers lo anotan en Nodo.produccion al
+# expandir un no terminal y el analizador semántico elige su regla por él
+_ids_producciones = {}
+_candado_producciones = threading.Lock()
+
+def id_produccion(cabeza, cuerpo):
+    """Id de la producción cabeza -> cuerpo (se registra la primera vez)"""
+    clave = (cabeza, tuple(cuerpo))
+    id_p = _ids_producciones.get(clave)
+    if id_p is None:
+        with _candado_producciones:
+            id_p = _ids_producciones.setdefault(clave, len(_ids_producciones))
+    return id_p
+
+def buscar_produccion(cabeza, cuerpo):
+    """Id de la producción si ya está registrada, o None"""
+    return _ids_producciones.get((cabeza, tuple(cuerpo)))
+
 # Tokens que llevan lexema para construir el árbol
 TOKENS_CON_LEXEMA = {
     'IDENTIFICADOR',
@@ -96,12 +195,19 @@ TOKENS_CON_LEXEMA = {
     'FALSO'
 }
 
-def parser_ll1(token_objects_list, parsing_table, start_symbol='PROGRAMA'): 
+def ubicacion_token(token, source_map=None):
+    # Con el SourceMap del léxico la columna se calcula solo al reportar
+    if source_map is not None:
+        return source_map.ubicacion(token.lexpos)
+    return f"línea {token.lineno}"
+
+def parser_ll1(token_objects_list, parsing_table, start_symbol='PROGRAMA', source_map=None, reporte=None): 
+    reporte = reporte or reporte_por_defecto()
     if not token_objects_list:
-        print("Error: La lista de tokens está vacía.")
+        reporte.error('sintactico', "Error: La lista de tokens está vacía.")
         return None
     if not parsing_table:
-        print("Error: La tabla de parsing no se cargó correctamente.")
+        reporte.error('sintactico', "Error: La tabla de parsing no se cargó correctamente.")
         return None
 
     eof_token = lex.LexToken()
@@ -115,20 +221,26 @@ def parser_ll1(token_objects_list, parsing_table, start_symbol='PROGRAMA'):
 
     raiz = Nodo(start_symbol) 
     stack = [('$', None), (start_symbol, raiz)]
+    listas = no_terminales_lista(parsing_table)
+    ids = {} # (no terminal, token) -> id_produccion de la celda
 
     ancho_stack = 50
     ancho_input = 65
     ancho_action = 50
+    separador = "="*(ancho_stack + ancho_input + ancho_action + 6)
 
-    print("\n" + "="*(ancho_stack + ancho_input + ancho_action + 6))
-    print(f"{'Stack':<{ancho_stack}} | {'Input Token (Type, Value, Line)':<{ancho_input}} | {'Action':<{ancho_action}}")
-    print("-"*(ancho_stack + ancho_input + ancho_action + 6))
+    # La traza paso a paso solo se formatea en modo depuración
+    depurar = reporte.depuracion
+    if depurar:
+        reporte.debug('sintactico', "\n" + separador)
+        reporte.debug('sintactico', f"{'Stack':<{ancho_stack}} | {'Input Token (Type, Value, Line)':<{ancho_input}} | {'Action':<{ancho_action}}")
+        reporte.debug('sintactico', "-"*(ancho_stack + ancho_input + ancho_action + 6))
 
     while stack:
         if index >= len(tokens_for_parsing):
-            print("\n❌ Error Sintáctico: Se alcanzó el final de los tokens inesperadamente pero la pila no está vacía.")
-            print(f"Pila restante: {[s[0] for s in stack]}")
-            print("="*(ancho_stack + ancho_input + ancho_action + 6))
+            reporte.error('sintactico', "\n❌ Error Sintáctico: Se alcanzó el final de los tokens inesperadamente pero la pila no está vacía.")
+            reporte.error('sintactico', f"Pila restante: {[s[0] for s in stack]}")
+            reporte.debug('sintactico', separador)
             return None
 
         top_grammar_symbol, current_node_in_tree = stack[-1]
@@ -137,19 +249,22 @@ def parser_ll1(token_objects_list, parsing_table, start_symbol='PROGRAMA'):
         current_token_object = tokens_for_parsing[index]
         current_token_type_from_lexer = current_token_object.type
 
-        stack_display_list = [s[0] for s in reversed(stack + [(top_grammar_symbol, current_node_in_tree)])]
-        stack_str_print = ' '.join(stack_display_list)
-        
-        input_token_display = f"{current_token_type_from_lexer} ('{current_token_object.value}', L{current_token_object.lineno})"
-        input_token_display = input_token_display[:ancho_input-3] + '...' if len(input_token_display) > ancho_input-3 else input_token_display
-        
-        print(f"{stack_str_print:<{ancho_stack}} | {input_token_display:<{ancho_input}} | ", end='')
+        if depurar:
+            stack_display_list = [s[0] for s in reversed(stack + [(top_grammar_symbol, current_node_in_tree)])]
+            stack_str_print = ' '.join(stack_display_list)
+
+            input_token_display = f"{current_token_type_from_lexer} ('{current_token_object.value}', L{current_token_object.lineno})"
+            input_token_display = input_token_display[:ancho_input-3] + '...' if len(input_token_display) > ancho_input-3 else input_token_display
+
+            paso = f"{stack_str_print:<{ancho_stack}} | {input_token_display:<{ancho_input}} | "
 
         if top_grammar_symbol == 'epsilon_node': 
-            print("ε (Nodo Epsilon en Árbol)")
+            if depurar:
+                reporte.debug('sintactico', paso + "ε (Nodo Epsilon en Árbol)")
             continue
         elif top_grammar_symbol == current_token_type_from_lexer: 
-            print(f"Match: {current_token_type_from_lexer}")
+            if depurar:
+                reporte.debug('sintactico', paso + f"Match: {current_token_type_from_lexer}")
             if current_node_in_tree: 
                 current_node_in_tree.token_original = current_token_object
 
@@ -160,24 +275,44 @@ def parser_ll1(token_objects_list, parsing_table, start_symbol='PROGRAMA'):
             index += 1
         elif top_grammar_symbol in parsing_table:
             if current_token_type_from_lexer not in parsing_table[top_grammar_symbol]:
-                print(f"\n❌ Error Sintáctico: No hay regla para ({top_grammar_symbol}, {current_token_type_from_lexer}) en la línea {current_token_object.lineno}")
-                print(f"Token problemático: valor='{current_token_object.value}', tipo='{current_token_object.type}'")
-                print(f"Posibles tokens para '{top_grammar_symbol}': {list(parsing_table[top_grammar_symbol].keys())}")
-                print("="*(ancho_stack + ancho_input + ancho_action + 6))
+                if depurar:
+                    reporte.debug('sintactico', paso)
+                if reporte.resumen:
+                    reporte.error('sintactico', f"\n❌ Error Sintáctico: No hay regla para ({top_grammar_symbol}, {current_token_type_from_lexer}) en la {ubicacion_token(current_token_object, source_map)}",
+                                  no_terminal=top_grammar_symbol, token=current_token_type_from_lexer,
+                                  linea=current_token_object.lineno, posicion=current_token_object.lexpos)
+                    reporte.error('sintactico', f"Token problemático: valor='{current_token_object.value}', tipo='{current_token_object.type}'")
+                    reporte.error('sintactico', f"Posibles tokens para '{top_grammar_symbol}': {list(parsing_table[top_grammar_symbol].keys())}")
+                reporte.debug('sintactico', separador)
                 return None
 
             rule_body = parsing_table[top_grammar_symbol].get(current_token_type_from_lexer)
             
             if rule_body:
-                production_str = ' '.join(rule_body)
-                print(f"{top_grammar_symbol} → {production_str}")
+                if depurar:
+                    production_str = ' '.join(rule_body)
+                    reporte.debug('sintactico', paso + f"{top_grammar_symbol} → {production_str}")
 
                 nodes_for_stack_addition = []
+                es_lista = top_grammar_symbol in listas
+                # Una lista aplanada conserva el id de su primera expansión
+                if current_node_in_tree and current_node_in_tree.produccion is None:
+                    celda = (top_grammar_symbol, current_token_type_from_lexer)
+                    id_p = ids.get(celda)
+                    if id_p is None:
+                        id_p = ids[celda] = id_produccion(top_grammar_symbol, rule_body)
+                    current_node_in_tree.produccion = id_p
                 
-                if rule_body == ['ε']: 
-                    epsilon_tree_node = Nodo('epsilon_node')
-                    nodes_for_stack_addition.append(('epsilon_node', epsilon_tree_node))
+                if len(rule_body) == 1 and rule_body[0] == 'ε': 
+                    # Fin de una lista aplanada: el ε solo si quedó vacía
+                    if not (es_lista and current_node_in_tree.hijos):
+                        epsilon_tree_node = Nodo('epsilon_node')
+                        nodes_for_stack_addition.append(('epsilon_node', epsilon_tree_node))
                 else:
+                    if es_lista and rule_body[-1] == top_grammar_symbol:
+                        # La cola de la lista sigue en el mismo nodo
+                        stack.append((top_grammar_symbol, current_node_in_tree))
+                        rule_body = rule_body[:-1]
                     for grammar_symbol_in_rule in reversed(rule_body):
                         # Saltar símbolos epsilon en la regla
                         if grammar_symbol_in_rule == 'ε':
@@ -194,8 +329,13 @@ def parser_ll1(token_objects_list, parsing_table, start_symbol='PROGRAMA'):
                 for symbol_for_stack, node_for_stack in nodes_for_stack_addition:
                     stack.append((symbol_for_stack, node_for_stack))
         else:
-            print(f"\n❌ Error Sintáctico: Se esperaba '{top_grammar_symbol}' pero se encontró '{current_token_type_from_lexer}' (valor: '{current_token_object.value}') en la línea {current_token_object.lineno}")
-            print("="*(ancho_stack + ancho_input + ancho_action + 6))
+            if depurar:
+                reporte.debug('sintactico', paso)
+            if reporte.resumen:
+                reporte.error('sintactico', f"\n❌ Error Sintáctico: Se esperaba '{top_grammar_symbol}' pero se encontró '{current_token_type_from_lexer}' (valor: '{current_token_object.value}') en la {ubicacion_token(current_token_object, source_map)}",
+                              esperado=top_grammar_symbol, token=current_token_type_from_lexer,
+                              linea=current_token_object.lineno, posicion=current_token_object.lexpos)
+            reporte.debug('sintactico', separador)
             return None
 
         if len(stack) == 1 and stack[0][0] == '$' and current_token_type_from_lexer == '$':
@@ -205,49 +345,63 @@ def parser_ll1(token_objects_list, parsing_table, start_symbol='PROGRAMA'):
                 pass 
 
             if top_grammar_symbol == '$': 
-                print("="*(ancho_stack + ancho_input + ancho_action + 6))
-                print(f"{'$':<{ancho_stack}} | {'$':<{ancho_input}} | ACEPTADO") 
-                print("="*(ancho_stack + ancho_input + ancho_action + 6))
+                if depurar:
+                    reporte.debug('sintactico', separador)
+                    reporte.debug('sintactico', f"{'$':<{ancho_stack}} | {'$':<{ancho_input}} | ACEPTADO")
+                    reporte.debug('sintactico', separador)
+                reporte.info('sintactico', "Análisis sintáctico: entrada aceptada")
                 return raiz
         elif not stack and current_token_type_from_lexer != '$':
-            print(f"\n❌ Error Sintáctico: Pila vacía pero aún quedan tokens de entrada. Token actual: {current_token_type_from_lexer}")
-            print("="*(ancho_stack + ancho_input + ancho_action + 6))
+            reporte.error('sintactico', f"\n❌ Error Sintáctico: Pila vacía pero aún quedan tokens de entrada. Token actual: {current_token_type_from_lexer}")
+            reporte.debug('sintactico', separador)
             return None
 
     if index < len(tokens_for_parsing) -1 :
-        print(f"\n❌ Error Sintáctico: Entrada no consumida completamente. Próximo token: {tokens_for_parsing[index].type}")
+        reporte.error('sintactico', f"\n❌ Error Sintáctico: Entrada no consumida completamente. Próximo token: {tokens_for_parsing[index].type}")
     elif stack:
-         print(f"\n❌ Error Sintáctico: Pila no vacía al final de la entrada. Pila: {[s[0] for s in stack]}")
+         reporte.error('sintactico', f"\n❌ Error Sintáctico: Pila no vacía al final de la entrada. Pila: {[s[0] for s in stack]}")
     else: 
         if current_token_type_from_lexer == '$':
-             print("="*(ancho_stack + ancho_input + ancho_action + 6))
-             print(f"{'$':<{ancho_stack}} | {'$':<{ancho_input}} | ACEPTADO (Condición final)")
-             print("="*(ancho_stack + ancho_input + ancho_action + 6))
+             if depurar:
+                 reporte.debug('sintactico', separador)
+                 reporte.debug('sintactico', f"{'$':<{ancho_stack}} | {'$':<{ancho_input}} | ACEPTADO (Condición final)")
+                 reporte.debug('sintactico', separador)
+             reporte.info('sintactico', "Análisis sintáctico: entrada aceptada")
              return raiz
 
-    print("="*(ancho_stack + ancho_input + ancho_action + 6))
+    reporte.debug('sintactico', separador)
     return None
 
 
 def generar_graphviz(nodo, archivo, contador=[0], conexiones=None):
     if conexiones is None:
         conexiones = []
-    
-    id_actual = contador[0]
-    label_valor = str(nodo.valor).replace('"', '\\"')
-    if nodo.valor == 'epsilon_node':
-        label_valor = "ε"
-    archivo.write(f'  node{id_actual} [label="{label_valor}"];\n')
-    nodo_id = id_actual
-    contador[0] += 1
-    
-    for hijo in nodo.hijos:
-        hijo_id = generar_graphviz(hijo, archivo, contador, conexiones)
-        conexiones.append((nodo_id, hijo_id))
-    return nodo_id
 
-
-def exportar_arbol_a_graphviz(raiz, nombre_archivo="arbol_parseo.dot"):
+    # Pila explícita: (nodo, id del padre, None) para escribir un nodo y
+    # (None, id del padre, id del hijo) para anotar la arista cuando termina
+    # el subárbol del hijo, en el mismo orden que el recorrido recursivo
+    raiz_id = contador[0]
+    pila = [(nodo, None, None)]
+    while pila:
+        nodo, padre_id, hijo_id = pila.pop()
+        if nodo is None:
+            conexiones.append((padre_id, hijo_id))
+            continue
+        id_actual = contador[0]
+        label_valor = str(nodo.valor).replace('"', '\\"')
+        if nodo.valor == 'epsilon_node':
+            label_valor = "ε"
+        archivo.write(f'  node{id_actual} [label="{label_valor}"];\n')
+        contador[0] += 1
+        if padre_id is not None:
+            pila.append((None, padre_id, id_actual))
+        for hijo in reversed(nodo.hijos):
+            pila.append((hijo, id_actual, None))
+    return raiz_id
+
+
+def exportar_arbol_a_graphviz(raiz, nombre_archivo="arbol_parseo.dot", reporte=None):
+    reporte = reporte or reporte_por_defecto()
     output_dir = os.path.join(BASE_DIR, "Salida Graphviz")
     os.makedirs(output_dir, exist_ok=True)
     full_path = os.path.join(output_dir, nombre_archivo)
@@ -261,10 +415,11 @@ def exportar_arbol_a_graphviz(raiz, nombre_archivo="arbol_parseo.dot"):
         for origen, destino in conexiones:
             archivo.write(f"  node{origen} -> node{destino};\n")
         archivo.write("}\n")
-    print(f"Árbol exportado a '{full_path}'")
-    print("Para visualizar: dot -Tpng " + full_path + " -o arbol.png")
+    reporte.info('sintactico', f"Árbol exportado a '{full_path}'")
+    reporte.info('sintactico', "Para visualizar: dot -Tpng " + full_path + " -o arbol.png")
 
 if __name__ == '__main__':
+    configurar(DEPURACION)
     tabla_csv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "table_ll1.csv")
 
     archivo_entrada_path = os.path.join(BASE_DIR, "Inputs", "programa.serpy")
@@ -305,7 +460,7 @@ imprimir(resultado);
         sys.exit(1)
     
     print(f"--- Iniciando análisis sintáctico ---")
-    arbol_sintactico = parser_ll1(lista_de_tokens, tabla_parsing, start_symbol='PROGRAMA')
+    arbol_sintactico = parser_ll1(lista_de_tokens, tabla_parsing, start_symbol='PROGRAMA', source_map=lexer.source_map)
 
     if arbol_sintactico:
         print("\n✅ Entrada aceptada por el analizador sintáctico.")
@@ -0,0 +1,129 @@
+import json
+import os
+import sys
+
+# Reporte de diagnósticos compartido por todas las fases.
+#
+# Las fases (léxico, sintáctico, semántico) no llaman a print(): escriben en
+# un Reporte, que según su nivel decide si el mensaje se descarta o se envía a
+# sus salidas (consola, archivo de texto con buffer, JSON lines). Antes de
+# armar un mensaje caro las fases consultan reporte.resumen o
+# reporte.depuracion, así que con el nivel desactivado no se formatea nada.
+#
+# El reporte por defecto es silencioso para el uso como biblioteca; los
+# scripts (main.py y los __main__ de cada analizador) lo configuran.
+
+SILENCIO = 0
+RESUMEN = 1      # errores y resultado de cada fase
+DEPURACION = 2   # tabla de tokens, pasos del parser, declaraciones, ...
+
+NIVELES = {
+    'silent': SILENCIO, 'silencio': SILENCIO,
+    'summary': RESUMEN, 'resumen': RESUMEN,
+    'debug': DEPURACION, 'depuracion': DEPURACION,
+}
+
+
+class Registro:
+    """Un mensaje ya aceptado por el nivel del reporte"""
+
+    __slots__ = ('clase', 'fase', 'mensaje', 'datos')
+
+    def __init__(self, clase, fase, mensaje, datos):
+        self.clase = clase      # 'error', 'info' o 'debug'
+        self.fase = fase        # 'lexico', 'sintactico', 'semantico', ...
+        self.mensaje = mensaje
+        self.datos = datos      # campos estructurados para JSON lines
+
+
+class SalidaConsola:
+    """Imprime cada mensaje (en sys.stdout por defecto)"""
+
+    def __init__(self, flujo=None):
+        self.flujo = flujo
+
+    def escribir(self, registro):
+        print(registro.mensaje, file=self.flujo or sys.stdout)
+
+    def cerrar(self):
+        pass
+
+
+class SalidaArchivo:
+    """Texto plano en un archivo con buffer grande; se vuelca al cerrar"""
+
+    def __init__(self, ruta, buffer=1 << 16):
+        directorio = os.path.dirname(ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        self.archivo = open(ruta, 'w', encoding='utf-8', buffering=buffer)
+
+    def escribir(self, registro):
+        self.archivo.write(registro.mensaje)
+        self.archivo.write('\n')
+
+    def cerrar(self):
+        self.archivo.close()
+
+
+class SalidaJSONL(SalidaArchivo):
+    """Un objeto JSON por línea con la clase, la fase, el mensaje y los datos"""
+
+    def escribir(self, registro):
+        objeto = {'clase': registro.clase, 'fase': registro.fase, 'mensaje': registro.mensaje}
+        objeto.update(registro.datos)
+        self.archivo.write(json.dumps(objeto, ensure_ascii=False, default=str))
+        self.archivo.write('\n')
+
+
+class Reporte:
+    def __init__(self, nivel=SILENCIO, salidas=None):
+        if isinstance(nivel, str):
+            nivel = NIVELES[nivel.lower()]
+        self.nivel = nivel
+        self.salidas = list(salidas) if salidas is not None else [SalidaConsola()]
+        # Banderas que las fases consultan antes de formatear
+        self.resumen = nivel >= RESUMEN and bool(self.salidas)
+        self.depuracion = nivel >= DEPURACION and bool(self.salidas)
+
+    def _emitir(self, clase, fase, mensaje, datos):
+        registro = Registro(clase, fase, mensaje, datos)
+        for salida in self.salidas:
+            salida.escribir(registro)
+
+    def error(self, fase, mensaje, **datos):
+        if self.resumen:
+            self._emitir('error', fase, mensaje, datos)
+
+    def info(self, fase, mensaje, **datos):
+        if self.resumen:
+            self._emitir('info', fase, mensaje, datos)
+
+    def debug(self, fase, mensaje, **datos):
+        if self.depuracion:
+            self._emitir('debug', fase, mensaje, datos)
+
+    def cerrar(self):
+        for salida in self.salidas:
+            salida.cerrar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+_por_defecto = Reporte(SILENCIO, [])
+
+
+def reporte_por_defecto():
+    """Reporte que usan las fases cuando no reciben uno"""
+    return _por_defecto
+
+
+def configurar(nivel, salidas=None):
+    """Reemplaza el reporte por defecto y lo devuelve"""
+    global _por_defecto
+    _por_defecto = Reporte(nivel, salidas)
+    return _por_defecto
@@ -0,0 +1,382 @@
+import hashlib
+import os
+import pickle
+import re
+from collections import Counter
+
+# Representación compilada de una gramática, compartida por el generador de
+# la tabla LL(1) (creadorTabla) y los analizadores que la usan.
+#
+# Los símbolos se numeran de forma densa: terminales 0..T-1 (ordenados, con
+# '$') y no terminales 0..N-1. En los cuerpos un terminal t es t y un no
+# terminal n es ~n (negativo); ε no aporta nada y se omite. anulable, FIRST y
+# FOLLOW se calculan una vez, con FIRST/FOLLOW como enteros usados como
+# conjuntos de bits sobre los terminales.
+#
+# cargar_gramatica guarda la gramática compilada en __pycache__ junto al
+# archivo, con la huella sha256 de su contenido; mientras el archivo no
+# cambie, las siguientes cargas no vuelven a leerla ni a calcular nada. Si
+# cambió, la gramática guardada se actualiza con Gramatica.actualizar, que
+# solo recalcula FIRST/FOLLOW donde llegan las producciones editadas.
+
+EPSILON = 'ε'
+EOF = '$'
+VERSION = 1  # cambia si cambia la representación guardada en caché
+
+
+def parsear_gramatica(texto):
+    """Devuelve (símbolo inicial, [(no terminal, cuerpo)]) con las reglas de
+    tsll1: 'A -> x y | z', y '' o 'ε' como producción vacía"""
+    producciones = []
+    for linea in texto.splitlines():
+        linea = linea.strip()
+        if not linea:
+            continue
+        partes = re.split(r'\s*->\s*', linea)
+        if len(partes) != 2:
+            continue
+        no_terminal = partes[0].strip()
+        for cuerpo in partes[1].strip().split('|'):
+            cuerpo = cuerpo.strip()
+            if cuerpo == "''":
+                cuerpo = EPSILON
+            producciones.append((no_terminal, tuple(cuerpo.split())))
+    inicial = producciones[0][0] if producciones else None
+    return inicial, producciones
+
+
+def leer_gramatica(ruta):
+    with open(ruta, 'r', encoding='utf-8') as f:
+        return parsear_gramatica(f.read())
+
+
+def bits(conjunto):
+    """Índices de los bits encendidos de un entero"""
+    while conjunto:
+        bajo = conjunto & -conjunto
+        yield bajo.bit_length() - 1
+        conjunto ^= bajo
+
+
+class Gramatica:
+    """Gramática con ids densos, cuerpos como tuplas de enteros y
+    anulable/FIRST/FOLLOW precalculados"""
+
+    def __init__(self, inicial, producciones):
+        self._indexar(inicial, producciones)
+        self.first = [0] * len(self.no_terminales)
+        self.anulable = [False] * len(self.no_terminales)
+        self.follow = [0] * len(self.no_terminales)
+        self._calcular_first(range(len(self.cuerpos)))
+        self._calcular_follow(range(len(self.no_terminales)))
+
+    def _indexar(self, inicial, producciones):
+        self.inicial = inicial
+        self.producciones = [(a, tuple(cuerpo)) for a, cuerpo in producciones]
+        self.no_terminales = sorted({a for a, _ in self.producciones})
+        id_nt = {a: i for i, a in enumerate(self.no_terminales)}
+        terminales = {s for _, cuerpo in self.producciones for s in cuerpo
+                      if s not in id_nt and s != EPSILON}
+        self.terminales = sorted(terminales | {EOF})
+        id_t = {t: i for i, t in enumerate(self.terminales)}
+        self.id_nt = id_nt
+        self.id_t = id_t
+
+        self.cuerpos = [
+            (id_nt[a], tuple(~id_nt[s] if s in id_nt else id_t[s] for s in cuerpo if s != EPSILON))
+            for a, cuerpo in self.producciones
+        ]
+        # Producciones de cada no terminal, producciones que usan cada no
+        # terminal en su cuerpo y apariciones (producción, posición)
+        self.producciones_de = [[] for _ in self.no_terminales]
+        self.usuarios = [[] for _ in self.no_terminales]
+        self.apariciones = [[] for _ in self.no_terminales]
+        for p, (a, cuerpo) in enumerate(self.cuerpos):
+            self.producciones_de[a].append(p)
+            for i, s in enumerate(cuerpo):
+                if s < 0:
+                    self.apariciones[~s].append((p, i))
+            for s in set(cuerpo):
+                if s < 0:
+                    self.usuarios[~s].append(p)
+
+    def first_de(self, simbolos, desde=0):
+        """(FIRST, anulable) de simbolos[desde:] como bits"""
+        first, anulable = self.first, self.anulable
+        resultado = 0
+        for s in simbolos[desde:]:
+            if s >= 0:
+                return resultado | (1 << s), False
+            resultado |= first[~s]
+            if not anulable[~s]:
+                return resultado, False
+        return resultado, True
+
+    def _calcular_first(self, pendientes):
+        """Lleva FIRST/anulable al punto fijo revisando las producciones
+        `pendientes` (índices) y, cuando FIRST(A) crece, las que usan A.
+        Partiendo de valores menores o iguales al resultado (p. ej. en cero)
+        da el mínimo punto fijo. Devuelve los no terminales que crecieron."""
+        first, anulable = self.first, self.anulable
+        pendientes = list(pendientes)
+        en_cola = [False] * len(self.cuerpos)
+        for p in pendientes:
+            en_cola[p] = True
+        crecieron = set()
+        while pendientes:
+            p = pendientes.pop()
+            en_cola[p] = False
+            a, cuerpo = self.cuerpos[p]
+            nuevo, es_anulable = self.first_de(cuerpo)
+            nuevo |= first[a]
+            if nuevo != first[a] or (es_anulable and not anulable[a]):
+                first[a] = nuevo
+                anulable[a] = anulable[a] or es_anulable
+                crecieron.add(a)
+                for q in self.usuarios[a]:
+                    if not en_cola[q]:
+                        en_cola[q] = True
+                        pendientes.append(q)
+        return crecieron
+
+    def _calcular_follow(self, no_terminales):
+        """Punto fijo de FOLLOW para `no_terminales` (en cero), con los
+        demás ya calculados. FOLLOW se propaga por las aristas A → B
+        ("FOLLOW(A) ⊆ FOLLOW(B)") solo desde los no terminales que cambiaron."""
+        follow = self.follow
+        recalcular = set(no_terminales)
+        sucesores = {a: set() for a in recalcular}
+        for b in recalcular:
+            for p, i in self.apariciones[b]:
+                a, cuerpo = self.cuerpos[p]
+                resto, anulable = self.first_de(cuerpo, i + 1)
+                follow[b] |= resto
+                if anulable and a != b:
+                    if a in recalcular:
+                        sucesores[a].add(b)
+                    else:
+                        follow[b] |= follow[a]
+        if self.inicial is not None and self.id_nt[self.inicial] in recalcular:
+            follow[self.id_nt[self.inicial]] |= 1 << self.id_t[EOF]
+
+        pendientes = list(recalcular)
+        en_cola = dict.fromkeys(recalcular, True)
+        while pendientes:
+            a = pendientes.pop()
+            en_cola[a] = False
+            for b in sucesores[a]:
+                nuevo = follow[b] | follow[a]
+                if nuevo != follow[b]:
+                    follow[b] = nuevo
+                    if not en_cola[b]:
+                        en_cola[b] = True
+                        pendientes.append(b)
+
+    def _extender_follow(self, producciones):
+        """Agrega a FOLLOW lo que aportan las producciones `producciones`
+        (nuevas, o con algún FIRST/anulable que creció) y lo propaga; solo
+        vale cuando los conjuntos únicamente pueden crecer. Devuelve los no
+        terminales cuyo FOLLOW creció."""
+        follow = self.follow
+        crecieron = set()
+        pendientes = []
+
+        def sumar(b, bits_nuevos):
+            if bits_nuevos & ~follow[b]:
+                follow[b] |= bits_nuevos
+                crecieron.add(b)
+                pendientes.append(b)
+
+        for p in producciones:
+            a, cuerpo = self.cuerpos[p]
+            for i, s in enumerate(cuerpo):
+                if s < 0:
+                    resto, anulable = self.first_de(cuerpo, i + 1)
+                    sumar(~s, resto | follow[a] if anulable else resto)
+        while pendientes:
+            a = pendientes.pop()
+            for p in self.producciones_de[a]:
+                cuerpo = self.cuerpos[p][1]
+                # Desde el final mientras el resto sea anulable
+                for s in reversed(cuerpo):
+                    if s >= 0:
+                        break
+                    if ~s != a:
+                        sumar(~s, follow[a])
+                    if not self.anulable[~s]:
+                        break
+        return crecieron
+
+    def actualizar(self, inicial, producciones):
+        """Pasa a la gramática `producciones` (la lista completa, p. ej. tras
+        editar una línea) recalculando FIRST/FOLLOW solo en los no terminales
+        a los que llegan los cambios. Devuelve los nombres de los no
+        terminales cuyas producciones, FIRST, anulable o FOLLOW cambiaron."""
+        producciones = [(a, tuple(cuerpo)) for a, cuerpo in producciones]
+        viejas, nuevas = Counter(self.producciones), Counter(producciones)
+        quitadas = list(viejas - nuevas)
+        agregadas = list(nuevas - viejas)
+        if inicial != self.inicial:
+            self.__init__(inicial, producciones)
+            return set(self.no_terminales)
+
+        # Estado anterior por nombre, con los bits pasados a los nuevos ids
+        # de los terminales
+        terminales_viejos = self.terminales
+        anterior = {a: (self.first[i], self.anulable[i], self.follow[i])
+                    for i, a in enumerate(self.no_terminales)}
+        orden_anterior = self._cuerpos_por_cabeza()
+        self._indexar(inicial, producciones)
+        perdieron = set()  # conjuntos que tenían un terminal que ya no existe
+        if self.terminales != terminales_viejos:
+            id_t = self.id_t
+            posiciones = [id_t.get(t) for t in terminales_viejos]
+            quitados = sum(1 << t for t, posicion in enumerate(posiciones) if posicion is None)
+            perdieron = {a for a, (first, _, follow) in anterior.items() if (first | follow) & quitados}
+
+            def traducir(conjunto):
+                nuevo = 0
+                for t in bits(conjunto):
+                    if posiciones[t] is not None:
+                        nuevo |= 1 << posiciones[t]
+                return nuevo
+
+            anterior = {a: (traducir(first), anulable, traducir(follow))
+                        for a, (first, anulable, follow) in anterior.items()}
+
+        n = len(self.no_terminales)
+        self.first, self.anulable, self.follow = [0] * n, [False] * n, [0] * n
+        for i, a in enumerate(self.no_terminales):
+            if a in anterior:
+                self.first[i], self.anulable[i], self.follow[i] = anterior[a]
+
+        # Un símbolo que pasó de no terminal a terminal (o al revés) cambia
+        # también las producciones que lo mencionan
+        id_nt = self.id_nt
+        reclasificados = (set(anterior) - id_nt.keys()) | (id_nt.keys() & set(terminales_viejos))
+        if reclasificados:
+            quitadas += [(a, cuerpo) for a, cuerpo in self.producciones
+                         if not reclasificados.isdisjoint(cuerpo)]
+
+        if quitadas:
+            tocados = self._recalcular(quitadas + agregadas, anterior)
+        else:
+            # Solo se agregaron producciones: los conjuntos únicamente crecen
+            # y basta propagar lo nuevo desde el punto fijo anterior
+            nuevas = set(agregadas)
+            indices = [p for p, produccion in enumerate(self.producciones) if produccion in nuevas]
+            crecieron = self._calcular_first(indices)
+            usuarios = {q for a in crecieron for q in self.usuarios[a]}
+            tocados = crecieron | self._extender_follow(set(indices) | usuarios)
+
+        # Las cabezas con producciones cambiadas o solo reordenadas
+        orden = self._cuerpos_por_cabeza()
+        cambiados = {a for a in orden if orden[a] != orden_anterior.get(a)}
+        cambiados |= perdieron & set(id_nt)
+        for i in tocados:
+            a = self.no_terminales[i]
+            if anterior.get(a) != (self.first[i], self.anulable[i], self.follow[i]):
+                cambiados.add(a)
+        return cambiados
+
+    def _recalcular(self, cambiadas, anterior):
+        """Con producciones quitadas los conjuntos pueden achicarse: se ponen
+        en cero y se recalculan los no terminales a los que puede llegar el
+        cambio. Devuelve los índices recalculados."""
+        id_nt = self.id_nt
+        n = len(self.no_terminales)
+        # FIRST: las cabezas cambiadas (o nuevas) y todo lo que las usa
+        afectados = {id_nt[a] for a, _ in cambiadas if a in id_nt}
+        afectados |= {i for i, a in enumerate(self.no_terminales) if a not in anterior}
+        pila = list(afectados)
+        while pila:
+            a = pila.pop()
+            for p in self.usuarios[a]:
+                b = self.cuerpos[p][0]
+                if b not in afectados:
+                    afectados.add(b)
+                    pila.append(b)
+        for a in afectados:
+            self.first[a], self.anulable[a] = 0, False
+        self._calcular_first([p for a in afectados for p in self.producciones_de[a]])
+        cambio_first = {a for a in afectados
+                        if anterior.get(self.no_terminales[a], (None, None))[:2] != (self.first[a], self.anulable[a])}
+
+        # FOLLOW: los no terminales de los cuerpos cambiados, los que están
+        # en una producción junto a un FIRST cambiado, los nuevos y todo lo
+        # que reciben de ellos por las aristas de FOLLOW
+        siguientes = {a for a in range(n) if self.no_terminales[a] not in anterior}
+        for _, cuerpo in cambiadas:
+            siguientes |= {id_nt[s] for s in cuerpo if s in id_nt}
+        for a in cambio_first:
+            for p in self.usuarios[a]:
+                siguientes |= {~s for s in self.cuerpos[p][1] if s < 0}
+        pila = list(siguientes)
+        while pila:
+            a = pila.pop()
+            for p in self.producciones_de[a]:
+                cuerpo = self.cuerpos[p][1]
+                for i, s in enumerate(cuerpo):
+                    if s < 0 and ~s not in siguientes and self.first_de(cuerpo, i + 1)[1]:
+                        siguientes.add(~s)
+                        pila.append(~s)
+        for a in siguientes:
+            self.follow[a] = 0
+        self._calcular_follow(siguientes)
+        return afectados | siguientes
+
+    def _cuerpos_por_cabeza(self):
+        cuerpos = {}
+        for a, cuerpo in self.producciones:
+            cuerpos.setdefault(a, []).append(cuerpo)
+        return cuerpos
+
+    def conjunto(self, bits_terminales):
+        return {self.terminales[t] for t in bits(bits_terminales)}
+
+
+_en_memoria = {}  # clave -> Gramatica ya cargada en este proceso
+
+
+def _ruta_cache(ruta):
+    carpeta, nombre = os.path.split(os.path.abspath(ruta))
+    return os.path.join(carpeta, '__pycache__', nombre + '.gramatica')
+
+
+def cargar_gramatica(ruta):
+    """Gramatica del archivo `ruta`, desde la caché en disco si el contenido
+    no cambió; si la caché es de otra versión del archivo se actualiza de
+    forma incremental, y si falta o es ilegible se compila de nuevo"""
+    with open(ruta, 'rb') as f:
+        datos = f.read()
+    clave = hashlib.sha256(f"{VERSION}\n".encode('utf-8') + datos).hexdigest()
+    gramatica = _en_memoria.get(clave)
+    if gramatica is not None:
+        return gramatica
+    ruta_cache = _ruta_cache(ruta)
+    guardada = None
+    try:
+        with open(ruta_cache, 'rb') as f:
+            version, guardada, gramatica = pickle.load(f)
+        if version != VERSION or not isinstance(gramatica, Gramatica):
+            guardada = None
+    except (OSError, EOFError, ValueError, TypeError, AttributeError, pickle.UnpicklingError):
+        pass
+    if guardada == clave:
+        _en_memoria[clave] = gramatica
+        return gramatica
+
+    if guardada is None:
+        gramatica = Gramatica(*parsear_gramatica(datos.decode('utf-8')))
+    else:
+        gramatica.actualizar(*parsear_gramatica(datos.decode('utf-8')))
+    _en_memoria[clave] = gramatica
+    try:
+        os.makedirs(os.path.dirname(ruta_cache), exist_ok=True)
+        temporal = ruta_cache + f'.{os.getpid()}.tmp'
+        with open(temporal, 'wb') as f:
+            pickle.dump((VERSION, clave, gramatica), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, ruta_cache)
+    except OSError:
+        pass
+    return gramatica
@@ -0,0 +1,21 @@
+# Definición de tipos de datos básicos para SERPY
+# Cada tipo es un código entero pequeño (Nodo.tipo guarda el código, y
+# compararlos es comparar enteros) que en los mensajes se muestra por nombre.
+# Vive aparte para que el sintáctico (valor inicial de Nodo.tipo) y el
+# semántico usen las mismas constantes.
+class Tipo(int):
+    def __new__(cls, codigo, nombre):
+        tipo = super().__new__(cls, codigo)
+        tipo.nombre = nombre
+        return tipo
+
+    def __repr__(self):
+        return self.nombre
+
+    __str__ = __repr__
+
+TIPO_DESCONOCIDO = Tipo(0, "DESCONOCIDO") # Para errores o tipos no inferidos (valor inicial de Nodo.tipo)
+TIPO_NUMERO = Tipo(1, "NUMERO")
+TIPO_CADENA = Tipo(2, "CADENA")
+TIPO_BOOLEANO = Tipo(3, "BOOLEANO")
+TIPO_VOID = Tipo(4, "VOID") # Para funciones que no retornan valor
@@ -0,0 +1,96 @@
+import argparse
+import sys
+import time
+import tracemalloc
+
+from AnalizadorFusionado import analizar_fusionado
+from AnalizadorLexico import analizar_texto
+from AnalizadorSintactico import parser_ll1, tabla_compartida
+from benchmark_lexico import FRAGMENTO
+
+# Benchmark del front-end fusionado (AnalizadorFusionado) contra las fases
+# separadas (analizar_texto + parser_ll1) sobre el mismo corpus sintético.
+#
+#   python benchmark_fusionado.py                 # 2000 fragmentos
+#   python benchmark_fusionado.py --fragmentos 20000 --repeticiones 5
+#   python benchmark_fusionado.py --verificar     # compara los árboles
+
+
+def generar_corpus(fragmentos):
+    return ''.join(FRAGMENTO.format(n=i) for i in range(fragmentos))
+
+
+def separado(texto, tabla):
+    resultado = analizar_texto(texto)
+    return parser_ll1(resultado.tokens, tabla, source_map=resultado.source_map)
+
+
+def fusionado(texto, tabla):
+    return analizar_fusionado(texto, tabla)[0]
+
+
+MODOS = {
+    'separado': separado,
+    'fusionado': fusionado,
+}
+
+
+def firma(raiz):
+    """Recorrido en preorden con el valor de cada nodo, su id de producción
+    y su token_original"""
+    nodos = []
+    pila = [raiz]
+    while pila:
+        nodo = pila.pop()
+        tok = nodo.token_original
+        nodos.append((nodo.valor, len(nodo.hijos), nodo.produccion, None if tok is None else
+                      (tok.type, tok.value, tok.lineno, tok.lexpos, getattr(tok, 'id', None))))
+        pila.extend(reversed(nodo.hijos))
+    return nodos
+
+
+def verificar(texto, tabla):
+    iguales = firma(separado(texto, tabla)) == firma(fusionado(texto, tabla))
+    print("Árboles idénticos" if iguales else "❌ Los árboles difieren")
+    return iguales
+
+
+def medir(modo, texto, tabla, repeticiones):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        raiz = MODOS[modo](texto, tabla)
+        mejor = min(mejor, time.perf_counter() - inicio)
+        if raiz is None:
+            raise RuntimeError(f"El modo {modo} no aceptó el corpus")
+        del raiz
+    # Pico de memoria en una corrida aparte: tracemalloc la hace más lenta
+    tracemalloc.start()
+    raiz = MODOS[modo](texto, tabla)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return mejor, pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del front-end fusionado de SERPY")
+    parser.add_argument('--fragmentos', type=int, default=2000, help="cantidad de fragmentos del corpus")
+    parser.add_argument('--repeticiones', type=int, default=3, help="se informa la mejor corrida")
+    parser.add_argument('--verificar', action='store_true', help="comparar los árboles de ambos modos")
+    args = parser.parse_args()
+
+    tabla = tabla_compartida('table_ll1.csv')
+    texto = generar_corpus(args.fragmentos)
+    if args.verificar:
+        sys.exit(0 if verificar(texto, tabla) else 1)
+
+    tamano_mb = len(texto) / (1024 * 1024)
+    print(f"Corpus: {args.fragmentos} fragmentos, {tamano_mb:.2f} MB")
+    print(f"{'Modo':<10} {'Segundos':>10} {'MB/s':>8} {'Pico (MB)':>10}")
+    for modo in MODOS:
+        segundos, pico = medir(modo, texto, tabla, args.repeticiones)
+        print(f"{modo:<10} {segundos:>10.3f} {tamano_mb / segundos:>8.2f} {pico / (1024 * 1024):>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
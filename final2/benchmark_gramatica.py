@@ -0,0 +1,122 @@
+import argparse
+import random
+import sys
+import time
+
+from creadorTabla import GRAMATICA_SERPY, construir_filas, parchear_filas
+from Gramatica import EPSILON, Gramatica, leer_gramatica
+
+# Actualización incremental de la gramática (Gramatica.actualizar +
+# parchear_filas) contra recompilarla entera después de cada edición.
+#
+#   python benchmark_gramatica.py                  # tiempos sobre gramatica_SERPY.txt
+#   python benchmark_gramatica.py --verificar      # ediciones al azar, compara con la recompilación
+#   python benchmark_gramatica.py --verificar --ediciones 5000 --semilla 7
+
+
+def editar(producciones, rng):
+    """Una edición al azar: quitar, agregar, duplicar o mover una producción
+    (las agregadas pueden traer terminales y no terminales nuevos)"""
+    producciones = list(producciones)
+    cabezas = sorted({a for a, _ in producciones})
+    simbolos = sorted({s for _, cuerpo in producciones for s in cuerpo if s != EPSILON} | set(cabezas))
+    tipo = rng.choice(('quitar', 'agregar', 'agregar', 'duplicar', 'mover'))
+    if tipo == 'quitar' and len(producciones) > 2:
+        # Nunca la primera, que fija el símbolo inicial
+        del producciones[rng.randrange(1, len(producciones))]
+    elif tipo == 'agregar':
+        cabeza = rng.choice(cabezas + [f"nuevo_{rng.randrange(5)}"])
+        largo = rng.choice((0, 1, 1, 2, 3))
+        cuerpo = tuple(rng.choice(simbolos + [f"NUEVO_{rng.randrange(3)}", f"nuevo_{rng.randrange(5)}"])
+                       for _ in range(largo)) or (EPSILON,)
+        producciones.insert(rng.randrange(1, len(producciones) + 1), (cabeza, cuerpo))
+    elif tipo == 'duplicar':
+        producciones.append(rng.choice(producciones[1:]))
+    else:
+        produccion = producciones.pop(rng.randrange(1, len(producciones)))
+        producciones.insert(rng.randrange(1, len(producciones) + 1), produccion)
+    return producciones
+
+
+def estado(gramatica):
+    return (gramatica.terminales, gramatica.no_terminales, gramatica.first,
+            gramatica.anulable, gramatica.follow)
+
+
+def verificar(inicial, producciones, ediciones, semilla):
+    rng = random.Random(semilla)
+    incremental = Gramatica(inicial, producciones)
+    filas = construir_filas(incremental)
+    for n in range(ediciones):
+        producciones = editar(producciones, rng)
+        cambiados = incremental.actualizar(inicial, producciones)
+        filas, _ = parchear_filas(incremental, filas, cambiados)
+        completa = Gramatica(inicial, producciones)
+        if estado(incremental) != estado(completa):
+            print(f"❌ FIRST/FOLLOW difieren tras la edición {n + 1}")
+            return False
+        if filas != construir_filas(completa):
+            print(f"❌ La tabla difiere tras la edición {n + 1}")
+            return False
+    print(f"{ediciones} ediciones: FIRST/FOLLOW y tabla idénticos a la recompilación")
+    return True
+
+
+def medir(funcion, repeticiones):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Actualización incremental de la gramática de SERPY")
+    parser.add_argument('--gramatica', default=GRAMATICA_SERPY)
+    parser.add_argument('--verificar', action='store_true', help="comparar con la recompilación completa")
+    parser.add_argument('--ediciones', type=int, default=1000, help="ediciones al azar para --verificar")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--repeticiones', type=int, default=20, help="se informa la mejor corrida")
+    args = parser.parse_args()
+
+    inicial, producciones = leer_gramatica(args.gramatica)
+    if args.verificar:
+        sys.exit(0 if verificar(inicial, producciones, args.ediciones, args.semilla) else 1)
+
+    # La edición: una alternativa más para el no terminal de la producción
+    # del medio, con un terminal que ya existe
+    medio = len(producciones) // 2
+    cabeza = producciones[medio][0]
+    terminal = next(s for _, cuerpo in producciones for s in cuerpo
+                    if s != EPSILON and s not in {a for a, _ in producciones})
+    editada = producciones[:medio + 1] + [(cabeza, (terminal,))] + producciones[medio + 1:]
+    gramatica = Gramatica(inicial, producciones)
+    filas = construir_filas(gramatica)
+    rehechas = []
+
+    def completa():
+        construir_filas(Gramatica(inicial, editada))
+
+    def pasar_a(destino):
+        def actualizar():
+            nonlocal filas
+            filas, cantidad = parchear_filas(gramatica, filas, gramatica.actualizar(inicial, destino))
+            rehechas.append(cantidad)
+        return actualizar
+
+    print(f"Gramática: {len(producciones)} producciones, {len(gramatica.no_terminales)} no terminales")
+    print(f"Edición: {cabeza} -> {terminal}")
+    print(f"{'Modo':<12} {'ms':>10} {'Filas':>8}")
+    print(f"{'completa':<12} {medir(completa, args.repeticiones) * 1000:>10.3f} {len(filas):>8}")
+    # Agregar y quitar se alternan para que cada medición parta del mismo estado
+    tiempos = {'agregar': float('inf'), 'quitar': float('inf')}
+    for _ in range(args.repeticiones):
+        for modo, destino in (('agregar', editada), ('quitar', producciones)):
+            tiempos[modo] = min(tiempos[modo], medir(pasar_a(destino), 1))
+    print(f"{'agregar':<12} {tiempos['agregar'] * 1000:>10.3f} {rehechas[0]:>8}")
+    print(f"{'quitar':<12} {tiempos['quitar'] * 1000:>10.3f} {rehechas[1]:>8}")
+
+
+if __name__ == '__main__':
+    main()
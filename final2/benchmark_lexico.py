@@ -0,0 +1,190 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Benchmark del análisis léxico sobre archivos SERPY sintéticos.
+# Cada modo se ejecuta en un subproceso propio para que el pico de memoria
+# (ru_maxrss) corresponda solo a ese modo.
+#
+#   python benchmark_lexico.py               # 16 MB
+#   python benchmark_lexico.py --mb 1024     # 1 GB
+#   python benchmark_lexico.py --escalado 8  # lexer paralelo con 1..8 procesos
+#   python benchmark_lexico.py --verificar   # comprueba que 'numpy' da los mismos tokens
+
+FRAGMENTO = """var x{n} = {n} + 3.5 * (y - 2);
+/* comentario
+   de bloque */
+definir f{n}(a, b) {{
+    si (a >= b && !falso) {{ retornar a ^ 2; }} sino {{ retornar "cadena {n}"; }}
+}}
+imprimir(f{n}(x{n}, 10)); # comentario de línea
+"""
+
+
+def generar_archivo(ruta, megabytes):
+    objetivo = megabytes * 1024 * 1024
+    escritos = 0
+    n = 0
+    with open(ruta, 'w', encoding='utf-8', newline='\n') as f:
+        while escritos < objetivo:
+            bloque = ''.join(FRAGMENTO.format(n=n + i) for i in range(1000))
+            f.write(bloque)
+            escritos += len(bloque)
+            n += 1000
+
+
+def modo_str(ruta):
+    """Camino actual: leer y decodificar a str y lexear con PLY"""
+    from AnalizadorLexico import lexer
+    with open(ruta, 'r', encoding='utf-8') as f:
+        data = f.read()
+    lexer.input(data)
+    cantidad = 0
+    for _ in iter(lexer.token, None):
+        cantidad += 1
+    return cantidad
+
+
+def modo_mmap(ruta):
+    """Lexer sobre bytes con el archivo mapeado en memoria"""
+    from AnalizadorLexicoBytes import abrir_mmap, cerrar_mmap, tokens_bytes
+    cantidad = 0
+    buffer = abrir_mmap(ruta)
+    try:
+        for _ in tokens_bytes(buffer):
+            cantidad += 1
+    finally:
+        cerrar_mmap(buffer)
+    return cantidad
+
+
+def modo_paralelo(ruta, procesos=None):
+    """Lexer paralelo por trozos (todos los núcleos por defecto)"""
+    from AnalizadorLexicoParalelo import analyze_file_paralelo
+    tokens, _ = analyze_file_paralelo(ruta, procesos, errores=[])
+    return len(tokens)
+
+
+def modo_texto(ruta):
+    """analizar_archivo, el camino de analyze_file (guarda todos los tokens)"""
+    from AnalizadorLexico import analizar_archivo
+    return len(analizar_archivo(ruta).tokens)
+
+
+def modo_numpy(ruta):
+    """Pre-escaneo de clases de caracteres con NumPy (o escalar si no está)"""
+    from AnalizadorLexicoNumpy import analizar_archivo_numpy
+    return len(analizar_archivo_numpy(ruta).tokens)
+
+
+MODOS = {
+    'str': modo_str,
+    'mmap': modo_mmap,
+    'paralelo': modo_paralelo,
+    'texto': modo_texto,
+    'numpy': modo_numpy,
+}
+
+
+def verificar_numpy(ruta):
+    """El lexer con pre-escaneo debe dar exactamente los mismos tokens, ids
+    internados y errores que analizar_archivo (el camino de analyze_file)"""
+    from AnalizadorLexico import analizar_archivo
+    from AnalizadorLexicoNumpy import NUMPY_DISPONIBLE, analizar_archivo_numpy
+
+    def firma(resultado):
+        return ([(t.type, t.value, t.lineno, t.lexpos, getattr(t, 'id', None)) for t in resultado.tokens],
+                [(e.tipo, e.texto, e.lineno, e.lexpos) for e in resultado.errores])
+
+    if not NUMPY_DISPONIBLE:
+        print("NumPy no está instalado: analizar_archivo_numpy usa el lexer escalar")
+    iguales = firma(analizar_archivo(ruta)) == firma(analizar_archivo_numpy(ruta))
+    print("Tokens idénticos" if iguales else "❌ Los tokens difieren")
+    return iguales
+
+
+def medir_escalado(ruta, maximo):
+    """Tiempo del lexer paralelo con 1, 2, 4, ... hasta `maximo` procesos"""
+    tamano_mb = os.path.getsize(ruta) / (1024 * 1024)
+    cantidades = sorted({1, maximo} | {2 ** k for k in range(maximo.bit_length()) if 2 ** k <= maximo})
+    print(f"{'Procesos':>8} {'Segundos':>10} {'MB/s':>10} {'Aceleración':>12}")
+    base = None
+    for procesos in cantidades:
+        inicio = time.perf_counter()
+        modo_paralelo(ruta, procesos)
+        segundos = time.perf_counter() - inicio
+        base = base or segundos
+        print(f"{procesos:>8} {segundos:>10.2f} {tamano_mb / segundos:>10.2f} {base / segundos:>11.2f}x")
+
+
+def ejecutar_modo(modo, ruta):
+    inicio = time.perf_counter()
+    cantidad = MODOS[modo](ruta)
+    segundos = time.perf_counter() - inicio
+    print(json.dumps({
+        'modo': modo,
+        'tokens': cantidad,
+        'segundos': segundos,
+        'rss_max_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del analizador léxico de SERPY")
+    parser.add_argument('--mb', type=int, default=16, help="tamaño del archivo sintético en MB")
+    parser.add_argument('--archivo', help="usar un archivo existente en lugar de generarlo")
+    parser.add_argument('--modos', default=','.join(MODOS), help="modos separados por coma")
+    parser.add_argument('--escalado', type=int, metavar='N', help="medir el lexer paralelo de 1 a N procesos")
+    parser.add_argument('--verificar', action='store_true', help="comparar el modo numpy con analyze_file")
+    parser.add_argument('--modo', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.modo:
+        ejecutar_modo(args.modo, args.archivo)
+        return
+
+    temporal = None
+    ruta = args.archivo
+    if ruta is None:
+        temporal = tempfile.NamedTemporaryFile(suffix='.serpy', delete=False)
+        temporal.close()
+        ruta = temporal.name
+        print(f"Generando archivo sintético de {args.mb} MB en {ruta}")
+        generar_archivo(ruta, args.mb)
+
+    if args.escalado or args.verificar:
+        try:
+            if args.escalado:
+                medir_escalado(ruta, args.escalado)
+            else:
+                sys.exit(0 if verificar_numpy(ruta) else 1)
+        finally:
+            if temporal is not None:
+                os.remove(ruta)
+        return
+
+    tamano_mb = os.path.getsize(ruta) / (1024 * 1024)
+    print(f"{'Modo':<10} {'Tokens':>12} {'Segundos':>10} {'MB/s':>10} {'RSS máx (MB)':>14}")
+    try:
+        for modo in args.modos.split(','):
+            salida = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--modo', modo, '--archivo', ruta],
+                cwd=BASE_DIR, capture_output=True, text=True, check=True,
+            ).stdout
+            r = json.loads(salida.strip().splitlines()[-1])
+            print(f"{r['modo']:<10} {r['tokens']:>12} {r['segundos']:>10.2f} "
+                  f"{tamano_mb / r['segundos']:>10.2f} {r['rss_max_mb']:>14.1f}")
+    finally:
+        if temporal is not None:
+            os.remove(ruta)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+import argparse
+import contextlib
+import io
+import time
+import types
+
+import ply.lex as lex
+
+import AnalizadorLexico as definiciones
+
+# Benchmark del léxico con entradas patológicas para comentarios de bloque y
+# cadenas. Compara las reglas anteriores (expresiones regulares perezosas con
+# alternancia, que vuelven a recorrer el resto del archivo o de la línea en
+# cada apertura sin cerrar) con los escáneres basados en str.find.
+#
+#   python benchmark_patologico.py
+#   python benchmark_patologico.py --tamanos 1000,10000,100000
+
+
+def t_COMENTARIO_BLOQUE(t):
+    r'/\*(.|\n)*?\*/'
+    t.lexer.lineno += t.value.count('\n')
+
+
+def t_CADENA(t):
+    r'\"([^\\\n]|(\\.))*?\"|\'([^\\\n]|(\\.))*?\''
+    t.value = t.value[1:-1]
+    return t
+
+
+def t_error(t):
+    print(f"Carácter ilegal '{t.value[0]}' en la línea {t.lineno}, posición {t.lexpos}")
+    t.lexer.skip(1)
+
+
+def lexer_anterior():
+    """El lexer de AnalizadorLexico con las reglas de comentarios y cadenas
+    y el manejo de errores tal como eran antes de los escáneres"""
+    modulo = types.SimpleNamespace(**{
+        nombre: valor for nombre, valor in vars(definiciones).items()
+        if nombre == 'tokens' or nombre.startswith('t_')
+    })
+    modulo.__file__ = __file__
+    modulo.t_COMENTARIO_BLOQUE = t_COMENTARIO_BLOQUE
+    modulo.t_CADENA = t_CADENA
+    modulo.t_error = t_error
+    return lex.lex(module=modulo)
+
+
+def preparar(lexer):
+    lexer.source_map = None
+    lexer.nombres = definiciones.TablaNombres()
+    lexer.constantes = definiciones.TablaNombres()
+    lexer.errores = []
+    lexer.max_errores = None
+    return lexer
+
+
+# Cada caso recibe n y devuelve un texto de unos n caracteres
+CASOS = {
+    # Muchas aperturas sin cierre: cada una recorría el resto del archivo
+    'aperturas_sin_cierre': lambda n: 'x = 1;\n' + '/*\n' * (n // 3),
+    # Un solo comentario muy largo y bien cerrado
+    'comentario_largo': lambda n: '/*' + 'texto\n' * (n // 6) + '*/ x',
+    # Un comentario sin cerrar al principio del archivo
+    'comentario_sin_cerrar': lambda n: '/* ' + 'var x = 1;\n' * (n // 11),
+    # Una cadena larga llena de comillas escapadas
+    'cadena_escapada': lambda n: '"' + '\\"' * (n // 2) + '";',
+    # Una línea con muchas comillas sin cerrar
+    'cadenas_sin_cerrar': lambda n: '"\\' * (n // 2) + '\n',
+    # Basura binaria o mal codificada: un error por carácter antes
+    'caracteres_ilegales': lambda n: '@$¿ñ€' * (n // 5),
+}
+
+
+def medir(lexer, texto):
+    """Devuelve (segundos, tokens, errores) de lexear `texto`; el lexer
+    anterior imprime cada error y el actual los acumula en lexer.errores"""
+    lexer.errores = []
+    salida = io.StringIO()
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(salida):
+        lexer.input(texto)
+        lexer.lineno = 1
+        cantidad = sum(1 for _ in iter(lexer.token, None))
+    segundos = time.perf_counter() - inicio
+    return segundos, cantidad, salida.getvalue().count('\n') + len(lexer.errores)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del léxico con entradas patológicas")
+    parser.add_argument('--tamanos', default='1000,4000,16000', help="tamaños de entrada separados por coma")
+    parser.add_argument('--casos', default=','.join(CASOS), help="casos separados por coma")
+    args = parser.parse_args()
+
+    anterior = preparar(lexer_anterior())
+    actual = preparar(definiciones.lexer.clone())
+    print(f"{'Caso':<22} {'Tamaño':>8} {'Anterior (s)':>13} {'Actual (s)':>11} "
+          f"{'Errores ant.':>13} {'Errores act.':>13}")
+    for caso in args.casos.split(','):
+        for n in (int(t) for t in args.tamanos.split(',')):
+            texto = CASOS[caso](n)
+            seg_ant, _, err_ant = medir(anterior, texto)
+            seg_act, _, err_act = medir(actual, texto)
+            print(f"{caso:<22} {len(texto):>8} {seg_ant:>13.4f} {seg_act:>11.4f} "
+                  f"{err_ant:>13} {err_act:>13}")
+
+
+if __name__ == '__main__':
+    main()
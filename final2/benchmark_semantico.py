@@ -0,0 +1,223 @@
+import argparse
+import sys
+import time
+
+from AnalizadorLexico import analizar_texto
+from AnalizadorSemantico import AnalizadorSemantico
+from AnalizadorSintactico import parser_ll1, tabla_compartida
+from benchmark_lexico import FRAGMENTO
+
+# Benchmark del análisis semántico: el visitante con tablas de despacho
+# (AnalizadorSemantico.recorrer_ast) contra la cadena if/elif que elegía la
+# regla de cada nodo comparando su valor y el de su primer hijo. El árbol se
+# construye una vez; solo se mide el recorrido semántico.
+#
+#   python benchmark_semantico.py                 # 2000 fragmentos
+#   python benchmark_semantico.py --fragmentos 20000 --repeticiones 5
+#   python benchmark_semantico.py --verificar     # compara tipos y errores
+
+
+class AnalizadorEncadenado(AnalizadorSemantico):
+    """Las mismas reglas, elegidas con la cadena if/elif anterior"""
+
+    def recorrer_ast(self, nodo):
+        if not nodo:
+            return
+        pila = [iter((nodo,))]
+        while pila:
+            try:
+                hijo = next(pila[-1])
+            except StopIteration:
+                pila.pop()
+                continue
+            if hijo:
+                visita = self._elegir(hijo)(self, hijo)
+                if visita is not None:
+                    pila.append(visita)
+
+    def _elegir(self, nodo):
+        valor = nodo.valor
+        if valor == 'PROGRAMA':
+            return AnalizadorSemantico._programa
+        elif valor == 'lista_sentencias':
+            return AnalizadorSemantico._lista_sentencias
+        elif valor == 'sentencia' and len(nodo.hijos) > 0 and nodo.hijos[0].valor == 'VAR':
+            return AnalizadorSemantico._sentencia_var
+        elif valor == 'sentencia' and len(nodo.hijos) > 0 and nodo.hijos[0].valor == 'IDENTIFICADOR':
+            return AnalizadorSemantico._sentencia_identificador
+        elif valor == 'sentencia' and len(nodo.hijos) > 0 and nodo.hijos[0].valor == 'RETORNAR':
+            return AnalizadorSemantico._sentencia_retornar
+        elif valor == 'sentencia' and len(nodo.hijos) > 0 and nodo.hijos[0].valor == 'IMPRIMIR':
+            return AnalizadorSemantico._sentencia_imprimir
+        elif valor == 'si_sentencia':
+            return AnalizadorSemantico._si_sentencia
+        elif valor == 'mientras_sentencia':
+            return AnalizadorSemantico._mientras_sentencia
+        elif valor == 'para_sentencia':
+            return AnalizadorSemantico._para_sentencia
+        elif valor == 'para_inicio' and nodo.hijos[0].valor == 'VAR':
+            return AnalizadorSemantico._para_inicio_var
+        elif valor == 'para_inicio' and nodo.hijos[0].valor == 'IDENTIFICADOR':
+            return AnalizadorSemantico._para_inicio_identificador
+        elif valor == 'funcion_def':
+            return AnalizadorSemantico._funcion_def
+        elif valor == 'parametros':
+            if nodo.hijos and nodo.hijos[0].valor != 'epsilon_node':
+                return AnalizadorSemantico._parametros
+            return AnalizadorSemantico._vacia
+        elif valor == 'parametros_cont':
+            return AnalizadorSemantico._parametros_cont
+        elif valor == 'bloque':
+            return AnalizadorSemantico._bloque
+        elif valor == 'asignacion_o_llamada' and nodo.hijos[0].valor == 'IGUAL':
+            return AnalizadorSemantico._asignacion
+        elif valor == 'asignacion_o_llamada' and nodo.hijos[0].valor == 'PAR_IZQ':
+            return AnalizadorSemantico._llamada
+        elif valor == 'lista_argumentos':
+            if nodo.hijos and nodo.hijos[0].valor != 'epsilon_node':
+                return AnalizadorSemantico._lista_argumentos
+            return AnalizadorSemantico._lista_argumentos_vacia
+        elif valor == 'lista_argumentos_cont':
+            return AnalizadorSemantico._lista_argumentos_cont
+        elif valor == 'sino_parte':
+            if nodo.hijos and nodo.hijos[0].valor == 'SINO':
+                return AnalizadorSemantico._sino_parte
+            return AnalizadorSemantico._vacia
+        elif valor == 'expresion':
+            return AnalizadorSemantico._expresion
+        elif valor == 'exp_logico_or_resto':
+            return AnalizadorSemantico._resto
+        elif valor == 'exp_logico_and':
+            return AnalizadorSemantico._exp_logico_and
+        elif valor == 'exp_logico_and_resto':
+            return AnalizadorSemantico._resto
+        elif valor == 'exp_igualdad':
+            return AnalizadorSemantico._exp_igualdad
+        elif valor == 'exp_igualdad_resto':
+            return AnalizadorSemantico._resto
+        elif valor == 'exp_comparacion':
+            return AnalizadorSemantico._exp_comparacion
+        elif valor == 'exp_comparacion_resto':
+            return AnalizadorSemantico._resto
+        elif valor == 'exp_suma':
+            return AnalizadorSemantico._exp_suma
+        elif valor == 'exp_suma_resto':
+            return AnalizadorSemantico._resto
+        elif valor == 'exp_mult':
+            return AnalizadorSemantico._exp_mult
+        elif valor == 'exp_mult_resto':
+            return AnalizadorSemantico._resto
+        elif valor == 'exp_potencia':
+            return AnalizadorSemantico._exp_potencia
+        elif valor == 'exp_potencia_resto':
+            return AnalizadorSemantico._resto
+        elif valor == 'exp_unario':
+            operador = nodo.hijos[0].valor
+            if operador == 'NEGACION':
+                return AnalizadorSemantico._negacion
+            elif operador == 'MENOS':
+                return AnalizadorSemantico._menos_unario
+            return AnalizadorSemantico._exp_unario_primario
+        elif valor == 'primario':
+            primer_hijo = nodo.hijos[0].valor
+            if primer_hijo in ('NUMERO', 'CADENA', 'VERDADERO', 'FALSO'):
+                return AnalizadorSemantico._primario_literal
+            elif primer_hijo == 'IDENTIFICADOR':
+                return AnalizadorSemantico._primario_identificador
+            return AnalizadorSemantico._primario_parentesis
+        elif valor == 'primario_llamada_opcional':
+            if nodo.hijos and nodo.hijos[0].valor == 'PAR_IZQ':
+                return AnalizadorSemantico._llamada_opcional
+            return AnalizadorSemantico._sin_llamada
+        return AnalizadorSemantico._visitar_hijos
+
+
+MODOS = {
+    'if/elif': AnalizadorEncadenado,
+    'despacho': AnalizadorSemantico,
+}
+
+
+def generar_corpus(fragmentos):
+    return ''.join(FRAGMENTO.format(n=i) for i in range(fragmentos))
+
+
+def construir(texto, tabla):
+    resultado = analizar_texto(texto)
+    raiz = parser_ll1(resultado.tokens, tabla, source_map=resultado.source_map)
+    if raiz is None:
+        raise RuntimeError("El parser no aceptó el corpus")
+    return raiz, resultado
+
+
+def analizar(clase, raiz, resultado):
+    # recorrer_ast directamente: analizar() imprimiría cada error del corpus
+    analizador = clase(source_map=resultado.source_map, nombres=resultado.nombres)
+    analizador.recorrer_ast(raiz)
+    return analizador
+
+
+def nodos(raiz):
+    pila = [raiz]
+    while pila:
+        nodo = pila.pop()
+        yield nodo
+        pila.extend(nodo.hijos)
+
+
+def firma(analizador, raiz):
+    """Errores en orden y los atributos semánticos de cada nodo"""
+    return (analizador.errores_semanticos,
+            [(nodo.valor, str(nodo.tipo), nodo.num_args, nodo.es_llamada) for nodo in nodos(raiz)])
+
+
+def verificar(texto, tabla):
+    raiz, resultado = construir(texto, tabla)
+    referencia = firma(analizar(AnalizadorEncadenado, raiz, resultado), raiz)
+    iguales = True
+    for nombre, sin_ids in (('despacho', False), ('despacho sin ids de producción', True)):
+        raiz, resultado = construir(texto, tabla)
+        if sin_ids:
+            # Árbol sin Nodo.produccion: la regla se deduce de los hijos
+            for nodo in nodos(raiz):
+                nodo.produccion = None
+        if firma(analizar(AnalizadorSemantico, raiz, resultado), raiz) != referencia:
+            print(f"❌ {nombre}: los tipos o los errores difieren")
+            iguales = False
+    if iguales:
+        print(f"Tipos y errores idénticos ({len(referencia[0])} errores)")
+    return iguales
+
+
+def medir(clase, raiz, resultado, repeticiones):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        analizar(clase, raiz, resultado)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del análisis semántico de SERPY")
+    parser.add_argument('--fragmentos', type=int, default=2000, help="cantidad de fragmentos del corpus")
+    parser.add_argument('--repeticiones', type=int, default=5, help="se informa la mejor corrida")
+    parser.add_argument('--verificar', action='store_true', help="comparar tipos y errores de ambos modos")
+    args = parser.parse_args()
+
+    tabla = tabla_compartida('table_ll1.csv')
+    texto = generar_corpus(args.fragmentos)
+    if args.verificar:
+        sys.exit(0 if verificar(texto, tabla) else 1)
+
+    raiz, resultado = construir(texto, tabla)
+    cantidad = sum(1 for _ in nodos(raiz))
+    print(f"Corpus: {args.fragmentos} fragmentos, {cantidad} nodos")
+    print(f"{'Modo':<10} {'Segundos':>10} {'Mnodos/s':>10}")
+    for modo, clase in MODOS.items():
+        segundos = medir(clase, raiz, resultado, args.repeticiones)
+        print(f"{modo:<10} {segundos:>10.3f} {cantidad / segundos / 1e6:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+import csv
+import hashlib
+import os
+import pickle
+import sys
+import threading
+
+from Diagnosticos import DEPURACION, configurar, reporte_por_defecto
+from Gramatica import bits, cargar_gramatica
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Generador de la tabla LL(1) de SERPY a partir de gramatica_SERPY.txt. La
+# gramática llega ya compilada (ids densos, FIRST/FOLLOW como bits) desde
+# Gramatica.cargar_gramatica, así que aquí solo se llenan las celdas.
+#
+# La tabla se guarda en el mismo formato que el CSV de tsll1 (EVIDENCIA_3)
+# junto a un archivo .sha256 con la huella de la gramática; asegurar_tabla
+# la regenera cuando la huella no coincide, informando los conflictos. Si en
+# __pycache__ está la gramática y las filas con las que se generó el CSV
+# actual, la gramática se actualiza de forma incremental y solo se rehacen
+# las filas afectadas por las producciones editadas.
+#
+#   python creadorTabla.py            # regenera las tablas si hace falta
+#   python creadorTabla.py --forzar   # siempre
+
+VERSION = 1  # cambia si cambia el formato del CSV generado
+
+GRAMATICA_SERPY = os.path.join(BASE_DIR, 'gramatica_SERPY.txt')
+# CSV generados a partir de cada gramática
+TABLAS_GENERADAS = {
+    os.path.join(BASE_DIR, 'table_ll1.csv'): GRAMATICA_SERPY,
+    os.path.join(BASE_DIR, 'tabla_ll1.csv'): GRAMATICA_SERPY,
+}
+
+
+def huella(producciones):
+    """sha256 de la gramática normalizada (y de la versión del generador)"""
+    texto = '\n'.join(f"{a} -> {' '.join(cuerpo)}" for a, cuerpo in producciones)
+    return hashlib.sha256(f"{VERSION}\n{texto}".encode('utf-8')).hexdigest()
+
+
+def construir_filas(gramatica, no_terminales=None):
+    """{no terminal: (fila, conflictos)} para `no_terminales` (todos si es
+    None): fila[terminal] es el cuerpo como tupla de nombres (('ε',) para la
+    producción vacía); ante un conflicto se conserva la primera producción y
+    se anota (no terminal, terminal, existente, nueva) con los cuerpos como
+    texto"""
+    if no_terminales is None:
+        no_terminales = gramatica.no_terminales
+    filas = {}
+    for a in no_terminales:
+        id_a = gramatica.id_nt[a]
+        fila, conflictos = {}, []
+        for p in gramatica.producciones_de[id_a]:
+            cuerpo = gramatica.producciones[p][1]
+            seleccion, anulable = gramatica.first_de(gramatica.cuerpos[p][1])
+            if anulable:
+                seleccion |= gramatica.follow[id_a]
+            for t in bits(seleccion):
+                terminal = gramatica.terminales[t]
+                existente = fila.get(terminal)
+                if existente is None:
+                    fila[terminal] = cuerpo
+                else:
+                    conflictos.append((a, terminal, ' '.join(existente), ' '.join(cuerpo)))
+        filas[a] = (fila, conflictos)
+    return filas
+
+
+def construir_tabla(gramatica):
+    """Devuelve (tabla, conflictos): tabla[no terminal][terminal] es el
+    cuerpo como tupla de nombres (ver construir_filas)"""
+    filas = construir_filas(gramatica)
+    return ({a: fila for a, (fila, _) in filas.items()},
+            [conflicto for _, conflictos in filas.values() for conflicto in conflictos])
+
+
+def parchear_filas(gramatica, filas, cambiados):
+    """Actualiza `filas` (de construir_filas) tras Gramatica.actualizar:
+    solo se rehacen las filas de los no terminales de `cambiados` y las de
+    los que los usan en algún cuerpo. Devuelve (filas, cantidad rehecha)."""
+    rehacer = set(cambiados)
+    for a in cambiados:
+        id_a = gramatica.id_nt.get(a)
+        if id_a is not None:
+            rehacer |= {gramatica.producciones[p][0] for p in gramatica.usuarios[id_a]}
+    rehacer = [a for a in gramatica.no_terminales if a in rehacer or a not in filas]
+    nuevas = construir_filas(gramatica, rehacer)
+    return {a: nuevas.get(a) or filas[a] for a in gramatica.no_terminales}, len(rehacer)
+
+
+def escribir_csv(gramatica, tabla, ruta):
+    """Mismo formato que tsll1.guardar_tabla_csv (con saltos '\\n', como
+    los CSV del repositorio); se escribe en un archivo temporal y se
+    reemplaza para no dejar nunca un CSV a medias"""
+    def escribir(f):
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow([''] + gramatica.terminales)
+        for a in gramatica.no_terminales:
+            writer.writerow([a] + [' '.join(tabla[a].get(t, ())) for t in gramatica.terminales])
+    _reemplazar(ruta, escribir)
+
+
+def _reemplazar(ruta, escribir):
+    # El temporal es propio de cada proceso e hilo: dos que regeneran la
+    # misma tabla a la vez no se pisan, y el último os.replace gana
+    temporal = f'{ruta}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(temporal, 'w', newline='', encoding='utf-8') as f:
+            escribir(f)
+        os.replace(temporal, ruta)
+    except BaseException:
+        try:
+            os.remove(temporal)
+        except OSError:
+            pass
+        raise
+
+
+def reportar_conflictos(conflictos, reporte=None):
+    reporte = reporte or reporte_por_defecto()
+    for a, terminal, existente, nueva in conflictos:
+        reporte.error('sintactico', f"¡Conflicto! La gramática no es LL(1). Celda: [{a}, {terminal}]: "
+                      f"{existente} / {nueva}",
+                      no_terminal=a, terminal=terminal, producciones=[existente, nueva])
+
+
+def _ruta_previa(ruta_csv):
+    carpeta, nombre = os.path.split(os.path.abspath(ruta_csv))
+    return os.path.join(carpeta, '__pycache__', nombre + '.ll1')
+
+
+def _cargar_previa(ruta_csv, huella_csv):
+    """(gramatica, filas) con los que se generó el CSV de huella
+    `huella_csv`, o None"""
+    try:
+        with open(_ruta_previa(ruta_csv), 'rb') as f:
+            version, guardada, gramatica, filas = pickle.load(f)
+    except (OSError, EOFError, ValueError, TypeError, AttributeError, pickle.UnpicklingError):
+        return None
+    if version != VERSION or guardada != huella_csv:
+        return None
+    return gramatica, filas
+
+
+def _guardar_previa(ruta_csv, actual, gramatica, filas):
+    ruta = _ruta_previa(ruta_csv)
+    try:
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        temporal = ruta + f'.{os.getpid()}.tmp'
+        with open(temporal, 'wb') as f:
+            pickle.dump((VERSION, actual, gramatica, filas), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, ruta)
+    except OSError:
+        pass
+
+
+def asegurar_tabla(ruta_gramatica, ruta_csv, reporte=None, forzar=False):
+    """Regenera `ruta_csv` si la huella de la gramática cambió (o falta el
+    CSV). Devuelve la lista de conflictos, o None si la tabla estaba al día.
+    Si no se puede escribir el CSV o su huella se propaga el OSError."""
+    reporte = reporte or reporte_por_defecto()
+    gramatica = cargar_gramatica(ruta_gramatica)
+    actual = huella(gramatica.producciones)
+    ruta_huella = ruta_csv + '.sha256'
+    huella_csv = None
+    if os.path.exists(ruta_csv):
+        try:
+            with open(ruta_huella, encoding='utf-8') as f:
+                huella_csv = f.read().strip()
+        except FileNotFoundError:
+            pass
+        if not forzar and huella_csv == actual:
+            return None
+
+    previa = None if forzar or huella_csv is None else _cargar_previa(ruta_csv, huella_csv)
+    if previa is None:
+        filas = construir_filas(gramatica)
+        rehechas = len(filas)
+    else:
+        nueva = gramatica
+        gramatica, filas = previa
+        cambiados = gramatica.actualizar(nueva.inicial, nueva.producciones)
+        filas, rehechas = parchear_filas(gramatica, filas, cambiados)
+    tabla = {a: fila for a, (fila, _) in filas.items()}
+    conflictos = [conflicto for _, lista in filas.values() for conflicto in lista]
+
+    reportar_conflictos(conflictos, reporte)
+    escribir_csv(gramatica, tabla, ruta_csv)
+    _reemplazar(ruta_huella, lambda f: f.write(actual + '\n'))
+    _guardar_previa(ruta_csv, actual, gramatica, filas)
+    reporte.info('sintactico', f"Tabla LL(1) regenerada en '{ruta_csv}' ({len(conflictos)} conflictos, "
+                 f"{rehechas} de {len(filas)} filas)",
+                 tabla=ruta_csv, conflictos=len(conflictos), filas=rehechas)
+    return conflictos
+
+
+if __name__ == '__main__':
+    configurar(DEPURACION)
+    forzar = '--forzar' in sys.argv
+    for ruta_csv, ruta_gramatica in TABLAS_GENERADAS.items():
+        if asegurar_tabla(ruta_gramatica, ruta_csv, forzar=forzar) is None:
+            print(f"'{os.path.basename(ruta_csv)}' ya corresponde a la gramática")
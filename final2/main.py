@@ -1,21 +1,46 @@
 import os
-from AnalizadorLexico import analyze_file
+from AnalizadorFusionado import analizar_fusionado
+from AnalizadorLexico import analizar_texto, analyze_file, lexer
 from AnalizadorSintactico import parser_ll1, cargar_tabla_desde_csv, imprimir_arbol
 from AnalizadorSemantico import AnalizadorSemantico
+from Diagnosticos import DEPURACION, configurar
+
+def compilar(texto, tabla_ll1, reporte=None, fusionado=False):
+    """Léxico, sintáctico y semántico de `texto` sin tocar estado global: se
+    puede llamar desde varios hilos a la vez compartiendo la tabla de
+    tabla_compartida(). Devuelve (ast, analizador_semantico); ambos son None
+    si falló el léxico o el sintáctico. Con fusionado=True el léxico y el
+    sintáctico se hacen en un solo recorrido (AnalizadorFusionado)."""
+    if fusionado:
+        ast, resultado = analizar_fusionado(texto, tabla_ll1, start_symbol="PROGRAMA", reporte=reporte)
+    else:
+        resultado = analizar_texto(texto, reporte)
+        if resultado is None:
+            return None, None
+        ast = parser_ll1(resultado.tokens, tabla_ll1, start_symbol="PROGRAMA",
+                         source_map=resultado.source_map, reporte=reporte)
+    if not ast:
+        return None, None
+    analizador_sem = AnalizadorSemantico(source_map=resultado.source_map, nombres=resultado.nombres, reporte=reporte)
+    analizador_sem.analizar(ast)
+    return ast, analizador_sem
 
 def main():
+    # Como script se muestra todo; como biblioteca el reporte es silencioso
+    configurar(DEPURACION)
+
     # 1. Análisis Léxico
     ruta_archivo = os.path.join("input", "programa.serpy")
     tokens = analyze_file(ruta_archivo)
     
     # 2. Análisis Sintáctico
     tabla_ll1 = cargar_tabla_desde_csv("table_ll1.csv")
-    ast = parser_ll1(tokens, tabla_ll1, start_symbol="PROGRAMA")
+    ast = parser_ll1(tokens, tabla_ll1, start_symbol="PROGRAMA", source_map=lexer.source_map)
     
     if ast:
         print("✅ Análisis Sintáctico Exitoso")
         # 3. Análisis Semántico
-        analizador_sem = AnalizadorSemantico()
+        analizador_sem = AnalizadorSemantico(source_map=lexer.source_map, nombres=lexer.nombres)
         if analizador_sem.analizar(ast):
             print("✅ Análisis Semántico Exitoso")
             # Exportar el AST final (con tipos)
@@ -0,0 +1,54 @@
+import os
+
+from AnalizadorLexico import analizar_texto
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Programas de ejemplo y casos borde compartidos por las pruebas
+# diferenciales: cada variante del léxico debe dar lo mismo que
+# analizar_texto sobre el texto completo.
+
+with open(os.path.join(BASE_DIR, 'programa.serpy'), encoding='utf-8') as f:
+    PROGRAMA = f.read()
+
+FRAGMENTO = """var x{n} = {n} + 3.5 * (y - 2);
+/* comentario
+   de bloque */
+definir f{n}(a, b) {{
+    si (a >= b && !falso) {{ retornar a ^ 2; }} sino {{ retornar "cadena {n}"; }}
+}}
+imprimir(f{n}(x{n}, 10)); # comentario de línea
+"""
+
+CORPUS = ''.join(FRAGMENTO.format(n=n) for n in range(40))
+
+CASOS = {
+    'programa': PROGRAMA,
+    'corpus': CORPUS,
+    'vacio': '',
+    'cadena_sin_cerrar': 'var s = "sin cerrar;\nvar y = 2;\n',
+    'comentario_sin_cerrar': 'var x = 1;\n/* sin cerrar\nvar y = 2;\n',
+    'ilegales': 'var a = 1 @@@ 2; $\nimprimir(a ? b);\n',
+    'escapes': 'var c = "es \\" cape"; var d = \'x\\\\\'; var e = "";\n',
+    'comentario_multilinea': '/* multi\nlinea */ var z = 3.25; # fin\n',
+    'sin_salto_final': 'var w = w2 + 007',
+}
+
+
+def firma_tokens(tokens):
+    return [(t.type, t.value, t.lineno, t.lexpos) for t in tokens]
+
+
+def firma_ids(tokens):
+    return [(t.type, getattr(t, 'id', None)) for t in tokens]
+
+
+def firma_errores(errores):
+    return [(e.tipo, e.texto, e.lineno, e.lexpos, e.fin) for e in errores]
+
+
+def referencia(texto):
+    """ResultadoLexico de analizar_texto, sin límite de errores alcanzado"""
+    resultado = analizar_texto(texto)
+    assert resultado is not None
+    return resultado
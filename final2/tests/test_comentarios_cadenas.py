@@ -0,0 +1,75 @@
+import os
+import time
+
+import pytest
+
+from AnalizadorFusionado import analizar_fusionado
+from AnalizadorLexico import ErrorLexico, fin_cadena, fin_comentario_bloque
+from AnalizadorLexicoBytes import tokens_bytes
+from AnalizadorLexicoFlujo import LexerFlujo
+from AnalizadorLexicoNumpy import analizar_texto_numpy
+from AnalizadorSintactico import tabla_compartida
+from casos import BASE_DIR, firma_errores, firma_tokens, referencia
+
+# Cadenas y comentarios de bloque se cierran con str.find: un solo error por
+# cadena o comentario sin cerrar, igual en todas las variantes del léxico
+
+CASOS = {
+    'cadena_sin_cerrar': 'var s = "abc\nvar t = 1;\n',
+    'cadena_sin_cerrar_al_final': "imprimir('abc",
+    'comentario_sin_cerrar': 'var x = 1; /* abierto\n\nvar y = "dentro";\n',
+    'comentario_vacio': 'var x = /**/ 1;',
+    'comentario_con_estrellas': 'var x = 1; /*** a * / b ***/ var y = 2;\n',
+    'escape_final': 'var s = "a\\\\"; var t = "b\\"";\n',
+    'comilla_escapada_sin_cerrar': 'var s = "a\\";\nvar t = 2;\n',
+    'comillas_mezcladas': 'var s = "it\'s"; var t = \'"q"\';\n',
+}
+
+
+def variantes(texto):
+    """(tokens, errores) de cada variante; las de bytes solo si el texto es ASCII"""
+    flujo = LexerFlujo()
+    tokens = []
+    for i in range(0, len(texto), 3):
+        tokens += flujo.feed(texto[i:i + 3].encode('utf-8'))
+    tokens += flujo.close()
+    yield 'flujo', tokens, flujo.errores
+    numpy = analizar_texto_numpy(texto)
+    yield 'numpy', numpy.tokens, numpy.errores
+    errores = []
+    yield 'bytes', list(tokens_bytes(texto.encode('ascii'), errores)), errores
+
+
+@pytest.mark.parametrize('nombre', sorted(CASOS))
+def test_un_diagnostico_igual_en_cada_variante(nombre):
+    texto = CASOS[nombre]
+    esperado = referencia(texto)
+    sin_cerrar = [e for e in esperado.errores if e.tipo != ErrorLexico.CARACTER_ILEGAL]
+    assert len(sin_cerrar) == ('sin_cerrar' in nombre)
+    for variante, tokens, errores in variantes(texto):
+        assert firma_tokens(tokens) == firma_tokens(esperado.tokens), variante
+        assert firma_errores(errores) == firma_errores(esperado.errores), variante
+    _, fusionado = analizar_fusionado(texto, tabla_compartida(os.path.join(BASE_DIR, 'table_ll1.csv')))
+    assert firma_errores(fusionado.errores) == firma_errores(esperado.errores)
+
+
+def test_buscadores_de_cierre():
+    assert fin_comentario_bloque('/* a */ b', 2) == 7
+    assert fin_comentario_bloque('/* a', 2) == -1
+    assert fin_cadena('"a\\"b" c', 1) == 6
+    assert fin_cadena('"a\\\\" c', 1) == 5
+    assert fin_cadena('"abc\n"', 1) == -1
+    assert fin_comentario_bloque(b'/* a */', 2) == 7
+    assert fin_cadena(b'"a\\"b"', 1) == 6
+
+
+@pytest.mark.parametrize('texto', [
+    '/*' + 'a' * 2_000_000,
+    '"' + '\\"' * 1_000_000,
+    '/*' * 500_000,
+], ids=['comentario_largo', 'escapes_largos', 'aperturas_repetidas'])
+def test_entradas_patologicas_en_tiempo_lineal(texto):
+    inicio = time.perf_counter()
+    resultado = referencia(texto)
+    assert time.perf_counter() - inicio < 5
+    assert len(resultado.errores) == 1
@@ -0,0 +1,70 @@
+import io
+import os
+
+import pytest
+
+from AnalizadorFusionado import analizar_fusionado
+from AnalizadorLexico import (MAX_ERRORES_LEXICOS, DemasiadosErroresLexicos, ErrorLexico,
+                              analizar_texto)
+from AnalizadorLexicoBytes import tokens_bytes
+from AnalizadorLexicoFlujo import LexerFlujo
+from AnalizadorLexicoNumpy import analizar_texto_numpy
+from AnalizadorSintactico import tabla_compartida
+from Diagnosticos import RESUMEN, Reporte, SalidaConsola
+from casos import BASE_DIR, firma_errores, referencia
+
+# Errores léxicos como registros: una racha de caracteres ilegales es un solo
+# error, el léxico no imprime nada y se abandona al llegar al máximo
+
+
+def test_racha_de_ilegales_es_un_error():
+    resultado = referencia('var a = 1 @$? 2;\n\x00\x01 ¿¡\n')
+    assert firma_errores(resultado.errores) == [
+        (ErrorLexico.CARACTER_ILEGAL, '@$?', 1, 10, 13),
+        (ErrorLexico.CARACTER_ILEGAL, '\x00\x01', 2, 17, 19),
+        (ErrorLexico.CARACTER_ILEGAL, '¿¡', 2, 20, 22),
+    ]
+    assert resultado.errores[0].mensaje == "3 caracteres ilegales '@$?'"
+    assert [t.type for t in resultado.tokens] == ['VAR', 'IDENTIFICADOR', 'IGUAL', 'NUMERO',
+                                                  'NUMERO', 'PUNTOYCOMA']
+
+
+def test_mismos_errores_en_cada_variante():
+    texto = 'x = @@ 1;\n$ y ~~~ 2\n' * 10
+    esperado = referencia(texto).errores
+    assert firma_errores(analizar_texto_numpy(texto).errores) == firma_errores(esperado)
+    errores = []
+    list(tokens_bytes(texto.encode('ascii'), errores))
+    assert firma_errores(errores) == firma_errores(esperado)
+    flujo = LexerFlujo()
+    flujo.feed(texto.encode('ascii'))
+    flujo.close()
+    assert firma_errores(flujo.errores) == firma_errores(esperado)
+
+
+def test_el_lexico_no_imprime(capsys):
+    analizar_texto('@ ' * 50)
+    assert capsys.readouterr().out == ''
+
+
+def test_errores_van_al_reporte():
+    salida = io.StringIO()
+    analizar_texto('var a = @;', Reporte(RESUMEN, [SalidaConsola(salida)]))
+    assert "Carácter ilegal '@' en la línea 1" in salida.getvalue()
+
+
+TEXTO_MALO = 'a @ ' * (MAX_ERRORES_LEXICOS + 50)
+
+
+def test_abandona_al_llegar_al_maximo():
+    assert analizar_texto(TEXTO_MALO) is None
+    assert analizar_texto_numpy(TEXTO_MALO) is None
+    with pytest.raises(DemasiadosErroresLexicos) as error:
+        list(tokens_bytes(TEXTO_MALO.encode('ascii'), [], max_errores=MAX_ERRORES_LEXICOS))
+    assert len(error.value.errores) == MAX_ERRORES_LEXICOS
+    flujo = LexerFlujo()
+    with pytest.raises(DemasiadosErroresLexicos) as error:
+        flujo.feed(TEXTO_MALO.encode('ascii') + b'\n')
+    assert len(error.value.errores) == MAX_ERRORES_LEXICOS
+    raiz, resultado = analizar_fusionado(TEXTO_MALO, tabla_compartida(os.path.join(BASE_DIR, 'table_ll1.csv')))
+    assert raiz is None and len(resultado.errores) == MAX_ERRORES_LEXICOS
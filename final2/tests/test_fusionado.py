@@ -0,0 +1,78 @@
+import io
+import os
+
+import pytest
+
+import AnalizadorFusionado
+from AnalizadorFusionado import MAX_TABLAS_ENTEROS, analizar_fusionado
+from AnalizadorLexico import analizar_texto
+from AnalizadorSintactico import cargar_tabla_desde_csv, congelar_tabla, parser_ll1, tabla_compartida
+from Diagnosticos import RESUMEN, Reporte, SalidaConsola
+from benchmark_fusionado import firma, separado
+from casos import BASE_DIR, CASOS
+
+# El front-end fusionado contra analizar_texto + parser_ll1: el mismo árbol
+# (valores, producciones y tokens con sus ids) y los mismos mensajes
+
+RUTA_TABLA = os.path.join(BASE_DIR, 'table_ll1.csv')
+
+CON_ERRORES = {
+    'falta_expresion': 'var x = ;\n',
+    'falta_punto_y_coma': 'var x = 1\nimprimir(x);\n',
+    'entrada_truncada': 'definir f(a) {\n  retornar a',
+    'lexico_y_sintactico': 'var x = 1 @ 2;\nvar = 3;\n',
+    'cadena_sin_cerrar': 'imprimir("hola);\n',
+}
+
+
+def mensajes(analizar, texto):
+    salida = io.StringIO()
+    analizar(texto, Reporte(RESUMEN, [SalidaConsola(salida)]))
+    return salida.getvalue()
+
+
+@pytest.mark.parametrize('nombre', ['programa', 'corpus', 'escapes', 'comentario_multilinea', 'vacio'])
+def test_mismo_arbol(nombre):
+    tabla = tabla_compartida(RUTA_TABLA)
+    esperado = separado(CASOS[nombre], tabla)
+    raiz, _ = analizar_fusionado(CASOS[nombre], tabla)
+    assert (raiz is None) == (esperado is None)
+    if raiz is not None:
+        assert firma(raiz) == firma(esperado)
+
+
+@pytest.mark.parametrize('nombre', sorted(CON_ERRORES))
+def test_mismos_mensajes_de_error(nombre):
+    tabla = tabla_compartida(RUTA_TABLA)
+
+    def por_fases(texto, reporte):
+        resultado = analizar_texto(texto, reporte)
+        return parser_ll1(resultado.tokens, tabla, source_map=resultado.source_map, reporte=reporte)
+
+    def fusionado(texto, reporte):
+        return analizar_fusionado(texto, tabla, reporte=reporte)
+
+    texto = CON_ERRORES[nombre]
+    assert analizar_fusionado(texto, tabla)[0] is None
+    esperado = mensajes(por_fases, texto)
+    assert esperado
+    # El léxico separado agrega su resumen; el resto debe coincidir línea a línea
+    esperado = '\n'.join(l for l in esperado.splitlines() if not l.startswith('Análisis léxico:'))
+    assert mensajes(fusionado, texto).rstrip('\n') == esperado
+
+
+def test_tabla_mutable_se_convierte_en_cada_llamada():
+    tabla = cargar_tabla_desde_csv(RUTA_TABLA)
+    assert analizar_fusionado('var x = 1;', tabla)[0] is not None
+    del tabla['sentencia']['VAR']
+    assert analizar_fusionado('var x = 1;', tabla)[0] is None
+    assert not any(entrada[0] is tabla for entrada in AnalizadorFusionado._tablas_enteros.values())
+
+
+def test_cache_de_tablas_congeladas_acotada():
+    tabla = cargar_tabla_desde_csv(RUTA_TABLA)
+    for _ in range(MAX_TABLAS_ENTEROS * 3):
+        assert analizar_fusionado('var x = 1;', congelar_tabla(tabla))[0] is not None
+    assert len(AnalizadorFusionado._tablas_enteros) <= MAX_TABLAS_ENTEROS
+    compartida = tabla_compartida(RUTA_TABLA)
+    assert AnalizadorFusionado.tabla_enteros(compartida) is AnalizadorFusionado.tabla_enteros(compartida)
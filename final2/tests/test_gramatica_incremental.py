@@ -0,0 +1,102 @@
+import copy
+import os
+import random
+
+import pytest
+
+from Gramatica import Gramatica, leer_gramatica
+from casos import BASE_DIR
+from creadorTabla import asegurar_tabla, construir_filas, parchear_filas
+
+# Gramatica.actualizar + parchear_filas contra reconstruir todo: mismos
+# FIRST/anulable/FOLLOW por nombre y mismas filas de la tabla LL(1)
+
+INICIAL, PRODUCCIONES = leer_gramatica(os.path.join(BASE_DIR, 'gramatica_SERPY.txt'))
+
+# Producciones que se agregan en las ediciones: terminales nuevos, no
+# terminales nuevos, producciones vacías y recursión
+NUEVAS = [
+    ('sentencia', ('ROMPER', 'PUNTOYCOMA')),
+    ('sentencia', ('hacer_sentencia',)),
+    ('hacer_sentencia', ('HACER', 'bloque', 'MIENTRAS', 'PAR_IZQ', 'expresion', 'PAR_DER')),
+    ('primario', ('CORCHETE_IZQ', 'lista_argumentos', 'CORCHETE_DER')),
+    ('exp_unario', ('ε',)),
+    ('parametros_cont', ('PUNTOYCOMA', 'parametros')),
+    ('bloque', ('sentencia',)),
+]
+
+
+def firma(gramatica):
+    return {a: (gramatica.conjunto(gramatica.first[i]), gramatica.anulable[i],
+                gramatica.conjunto(gramatica.follow[i]))
+            for i, a in enumerate(gramatica.no_terminales)}
+
+
+def comprobar(gramatica, filas, producciones):
+    anterior = firma(gramatica)
+    cambiados = gramatica.actualizar(INICIAL, producciones)
+    completa = Gramatica(INICIAL, producciones)
+    assert gramatica.no_terminales == completa.no_terminales
+    assert gramatica.terminales == completa.terminales
+    assert firma(gramatica) == firma(completa)
+    # Todo no terminal cuyos conjuntos cambiaron aparece en `cambiados`
+    assert {a for a, conjuntos in firma(completa).items() if anterior.get(a) != conjuntos} <= cambiados
+    filas, _ = parchear_filas(gramatica, filas, cambiados)
+    assert filas == construir_filas(completa)
+    return filas
+
+
+@pytest.mark.parametrize('nueva', NUEVAS, ids=lambda p: f"{p[0]}->{' '.join(p[1])}")
+def test_agregar_y_quitar_una_produccion(nueva):
+    gramatica = Gramatica(INICIAL, PRODUCCIONES)
+    filas = construir_filas(gramatica)
+    filas = comprobar(gramatica, filas, PRODUCCIONES + [nueva])
+    comprobar(gramatica, filas, PRODUCCIONES)
+
+
+# La 0 es la única producción del símbolo inicial: sin ella no hay gramática
+@pytest.mark.parametrize('indice', range(1, len(PRODUCCIONES), 3))
+def test_quitar_una_produccion_existente(indice):
+    gramatica = Gramatica(INICIAL, PRODUCCIONES)
+    filas = construir_filas(gramatica)
+    restantes = PRODUCCIONES[:indice] + PRODUCCIONES[indice + 1:]
+    filas = comprobar(gramatica, filas, restantes)
+    comprobar(gramatica, filas, PRODUCCIONES)
+
+
+def test_secuencia_de_ediciones():
+    azar = random.Random(42)
+    gramatica = Gramatica(INICIAL, PRODUCCIONES)
+    filas = construir_filas(gramatica)
+    actuales = list(PRODUCCIONES)
+    for _ in range(40):
+        if actuales and azar.random() < 0.5:
+            del actuales[azar.randrange(len(actuales))]
+        else:
+            actuales.insert(azar.randint(0, len(actuales)), azar.choice(NUEVAS + PRODUCCIONES))
+        if not any(a == INICIAL for a, _ in actuales):
+            actuales.insert(0, PRODUCCIONES[0])
+        filas = comprobar(gramatica, filas, actuales)
+
+
+def test_la_gramatica_no_se_modifica_sin_cambios():
+    gramatica = Gramatica(INICIAL, PRODUCCIONES)
+    antes = copy.deepcopy(firma(gramatica))
+    assert gramatica.actualizar(INICIAL, PRODUCCIONES) == set()
+    assert firma(gramatica) == antes
+
+
+def test_csv_incremental_igual_al_regenerado(tmp_path):
+    # asegurar_tabla usa la gramática y las filas guardadas en __pycache__
+    # para parchear; el CSV debe ser el mismo que regenerando con forzar
+    ruta_gramatica = tmp_path / 'gramatica.txt'
+    with open(os.path.join(BASE_DIR, 'gramatica_SERPY.txt'), encoding='utf-8') as f:
+        texto = f.read()
+    ruta_gramatica.write_text(texto, encoding='utf-8')
+    incremental, completa = tmp_path / 'incremental.csv', tmp_path / 'completa.csv'
+    assert asegurar_tabla(str(ruta_gramatica), str(incremental)) == []
+    ruta_gramatica.write_text(texto + '\nsentencia -> ROMPER PUNTOYCOMA\n', encoding='utf-8')
+    assert asegurar_tabla(str(ruta_gramatica), str(incremental)) == []
+    asegurar_tabla(str(ruta_gramatica), str(completa), forzar=True)
+    assert incremental.read_text(encoding='utf-8') == completa.read_text(encoding='utf-8')
+    assert 'ROMPER' in completa.read_text(encoding='utf-8').splitlines()[0]
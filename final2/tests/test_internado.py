@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+from AnalizadorFusionado import analizar_fusionado
+from AnalizadorLexicoFlujo import LexerFlujo
+from AnalizadorLexicoNumpy import analizar_texto_numpy
+from AnalizadorSintactico import tabla_compartida
+from casos import BASE_DIR, CASOS, firma_ids, referencia
+
+# Ids internados: densos, uno por valor distinto, y los mismos en cada
+# front-end que interna (analizar_texto, NumPy, feed()/close(), fusionado)
+
+VALIDOS = ['programa', 'corpus', 'comentario_multilinea', 'escapes']
+
+
+def test_un_id_denso_por_valor():
+    resultado = referencia('var a = a + b; var b = 1 + 1.0 + 1; imprimir("a", "a", a);')
+    nombres, constantes = resultado.nombres, resultado.constantes
+    assert [nombres[i] for i in range(len(nombres))] == ['a', 'b']
+    assert [constantes[i] for i in range(len(constantes))] == [1, 1.0, 'a']
+    # 1 y 1.0 son iguales en Python pero no se mezclan en el pool
+    assert type(constantes[1]) is float
+    for tok in resultado.tokens:
+        if tok.type == 'IDENTIFICADOR':
+            assert nombres[tok.id] is tok.value
+        elif tok.type in ('NUMERO', 'CADENA'):
+            assert constantes[tok.id] is tok.value
+
+
+@pytest.mark.parametrize('nombre', sorted(CASOS))
+def test_mismos_ids_con_numpy_y_flujo(nombre):
+    texto = CASOS[nombre]
+    esperado = referencia(texto)
+    assert firma_ids(analizar_texto_numpy(texto).tokens) == firma_ids(esperado.tokens)
+    flujo = LexerFlujo()
+    tokens = flujo.feed(texto.encode('utf-8')) + flujo.close()
+    assert firma_ids(tokens) == firma_ids(esperado.tokens)
+    assert flujo.nombres.valores == esperado.nombres.valores
+    assert flujo.constantes.valores == esperado.constantes.valores
+
+
+@pytest.mark.parametrize('nombre', VALIDOS)
+def test_mismas_tablas_con_el_fusionado(nombre):
+    texto = CASOS[nombre]
+    esperado = referencia(texto)
+    raiz, resultado = analizar_fusionado(texto, tabla_compartida(os.path.join(BASE_DIR, 'table_ll1.csv')))
+    assert raiz is not None
+    assert resultado.nombres.valores == esperado.nombres.valores
+    assert resultado.constantes.valores == esperado.constantes.valores
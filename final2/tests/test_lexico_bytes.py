@@ -0,0 +1,58 @@
+import mmap
+
+import pytest
+
+from AnalizadorLexicoBytes import analyze_file_mmap
+from casos import CASOS, firma_errores, firma_tokens, referencia
+
+# analyze_file_mmap contra analizar_texto: mismos tokens y errores, con las
+# posiciones en bytes en lugar de caracteres
+
+
+def en_bytes(texto, tokens, errores):
+    # Pasa las posiciones de la referencia (caracteres) a desplazamientos en bytes
+    def b(pos):
+        return len(texto[:pos].encode('utf-8'))
+    return ([(t.type, t.value, t.lineno, b(t.lexpos)) for t in tokens],
+            [(e.tipo, e.texto, e.lineno, b(e.lexpos), b(e.fin)) for e in errores])
+
+
+def lexear_mmap(tmp_path, texto):
+    ruta = tmp_path / 'entrada.serpy'
+    ruta.write_bytes(texto.encode('utf-8'))
+    errores = []
+    tokens, source_map = analyze_file_mmap(str(ruta), errores)
+    return tokens, errores, source_map
+
+
+@pytest.mark.parametrize('nombre', sorted(CASOS))
+def test_mismos_tokens_que_analizar_texto(tmp_path, nombre):
+    texto = CASOS[nombre]
+    esperado = referencia(texto)
+    tokens, errores, _ = lexear_mmap(tmp_path, texto)
+    assert (firma_tokens(tokens), firma_errores(errores)) == en_bytes(texto, esperado.tokens, esperado.errores)
+
+
+def test_digitos_no_ascii_son_ilegales_en_ambos_caminos(tmp_path):
+    texto = 'var x = ٣;\n'
+    esperado = referencia(texto)
+    tokens, errores, _ = lexear_mmap(tmp_path, texto)
+    assert (firma_tokens(tokens), firma_errores(errores)) == en_bytes(texto, esperado.tokens, esperado.errores)
+    assert [e.texto for e in errores] == ['٣']
+
+
+def test_tokens_validos_tras_cerrar_el_mmap(tmp_path, monkeypatch):
+    mapeos = []
+    original = mmap.mmap
+
+    class Registrado(original):
+        def __new__(cls, *args, **kwargs):
+            mapeo = super().__new__(cls, *args, **kwargs)
+            mapeos.append(mapeo)
+            return mapeo
+
+    monkeypatch.setattr(mmap, 'mmap', Registrado)
+    tokens, _, _ = lexear_mmap(tmp_path, CASOS['programa'])
+    assert mapeos and all(mapeo.closed for mapeo in mapeos)
+    assert firma_tokens(tokens) == firma_tokens(referencia(CASOS['programa']).tokens)
+    assert [t.lexema for t in tokens[:2]] == [b'var', b'x']
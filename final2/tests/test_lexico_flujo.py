@@ -0,0 +1,69 @@
+import io
+
+import pytest
+
+from AnalizadorLexicoFlujo import LexerFlujo, tokens_de_flujo
+from casos import CASOS, firma_errores, firma_ids, firma_tokens, referencia
+
+# feed()/close() contra analizar_texto sobre el texto completo, partiendo la
+# entrada en trozos de todos los tamaños: los cortes caen dentro de tokens,
+# de comentarios de bloque y de caracteres UTF-8 de varios bytes
+
+TEXTOS = dict(CASOS, utf8='var ñ = "añá"; /* ¿ */ imprimir(ñ);\n# ü\n')
+
+
+def por_trozos(texto, tamano):
+    datos = texto.encode('utf-8')
+    flujo = LexerFlujo()
+    tokens = []
+    for i in range(0, len(datos), tamano):
+        tokens += flujo.feed(datos[i:i + tamano])
+    tokens += flujo.close()
+    return tokens, flujo
+
+
+@pytest.mark.parametrize('tamano', [1, 2, 3, 5, 8])
+@pytest.mark.parametrize('nombre', sorted(TEXTOS))
+def test_mismos_tokens_con_cualquier_corte(nombre, tamano):
+    texto = TEXTOS[nombre]
+    esperado = referencia(texto)
+    tokens, flujo = por_trozos(texto, tamano)
+    assert firma_tokens(tokens) == firma_tokens(esperado.tokens)
+    assert firma_ids(tokens) == firma_ids(esperado.tokens)
+    assert firma_errores(flujo.errores) == firma_errores(esperado.errores)
+    assert flujo.source_map.inicios == esperado.source_map.inicios
+
+
+def test_tokens_salen_al_completar_la_linea():
+    flujo = LexerFlujo()
+    assert flujo.feed(b'var x') == []
+    assert [t.value for t in flujo.feed(b'yz = 1;\nvar')] == ['var', 'xyz', '=', 1, ';']
+    # El comentario abierto se retiene; lo anterior de la línea ya es definitivo
+    assert [t.value for t in flujo.feed(b' /* abierto\n sigue')] == ['var']
+    assert [t.value for t in flujo.feed(b' */ b;\n')] == ['b', ';']
+    assert flujo.close() == []
+    assert flujo.errores == []
+
+
+def test_comentario_sin_cerrar_se_informa_al_cerrar():
+    flujo = LexerFlujo()
+    assert [t.value for t in flujo.feed(b'a; /* nunca\n\n')] == ['a', ';']
+    # Todavía puede cerrarse: no es un error hasta close()
+    assert flujo.errores == []
+    flujo.close()
+    assert [(e.tipo, e.lineno) for e in flujo.errores] == [('comentario_sin_cerrar', 1)]
+
+
+def test_tokens_de_flujo_y_close():
+    texto = CASOS['corpus']
+    generador = tokens_de_flujo(io.BytesIO(texto.encode('utf-8')), tamano=7)
+    tokens = []
+    try:
+        while True:
+            tokens.append(next(generador))
+    except StopIteration as fin:
+        flujo = fin.value
+    assert firma_tokens(tokens) == firma_tokens(referencia(texto).tokens)
+    assert flujo.cerrado and flujo.close() == []
+    with pytest.raises(ValueError):
+        flujo.feed(b'x')
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from AnalizadorLexicoIncremental import LexerIncremental
+from casos import CASOS, firma_errores, firma_tokens, referencia
+
+# LexerIncremental tras cada edición contra analizar_texto sobre el texto
+# completo. Los ids pueden diferir (la tabla del buffer conserva los valores
+# de ediciones anteriores), pero cada token debe llevar el id de su valor en
+# esa misma tabla.
+
+FRAGMENTOS = ['x', '1', '"', "'", '/*', '*/', '\n', ' ', '@', 'var ', '2.5', ';', '#', 'zz']
+
+
+def comprobar(buffer):
+    esperado = referencia(buffer.texto)
+    assert firma_tokens(buffer.tokens) == firma_tokens(esperado.tokens)
+    assert firma_errores(buffer.lexer.errores) == firma_errores(esperado.errores)
+    for tok in buffer.tokens:
+        if tok.type == 'IDENTIFICADOR':
+            assert buffer.lexer.nombres[tok.id] == tok.value
+        elif tok.type in ('NUMERO', 'CADENA'):
+            assert buffer.lexer.constantes[tok.id] == tok.value
+
+
+@pytest.mark.parametrize('nombre', sorted(CASOS))
+def test_ediciones_aleatorias(nombre):
+    azar = random.Random(nombre)
+    buffer = LexerIncremental(CASOS[nombre])
+    comprobar(buffer)
+    for _ in range(60):
+        inicio = azar.randint(0, len(buffer.texto))
+        fin = min(len(buffer.texto), inicio + azar.choice((0, 0, 1, 2, 5)))
+        buffer.editar(inicio, fin, azar.choice(FRAGMENTOS + ['']))
+        comprobar(buffer)
+
+
+def test_renombrar_usa_la_tabla_del_buffer():
+    texto = 'var a=1; var b=2; var c=a;'
+    buffer = LexerIncremental(texto)
+    inicio = texto.index('b=2')
+    buffer.editar(inicio, inicio + 1, 'zz')
+    ids = {tok.value: tok.id for tok in buffer.tokens if tok.type == 'IDENTIFICADOR'}
+    assert len(set(ids.values())) == len(ids)
+    assert buffer.lexer.nombres[ids['zz']] == 'zz'
+
+
+def test_conserva_errores_fuera_de_la_edicion():
+    buffer = LexerIncremental('var a = @;\nvar b = 2;\nvar c = $;\n')
+    inicio = buffer.texto.index('2')
+    buffer.editar(inicio, inicio + 1, '\n\n345')
+    assert [(e.texto, e.lineno) for e in buffer.lexer.errores] == [('@', 1), ('$', 5)]
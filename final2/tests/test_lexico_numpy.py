@@ -0,0 +1,38 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from AnalizadorLexico import analizar_archivo, analizar_texto
+from AnalizadorLexicoNumpy import analizar_archivo_numpy, analizar_texto_numpy
+from casos import CASOS, firma_errores, firma_ids, firma_tokens
+
+# El pre-escaneo con NumPy debe dar exactamente los tokens, ids y errores de
+# analizar_texto (solo se prueba si NumPy está instalado)
+
+BORDES = {
+    'palabras_pegadas': 'varx = 12abc + si2 * 1.2.3 - .5 + 5.;\n',
+    'reservadas': 'si sino mientras para definir retornar verdadero falso imprimir var\n',
+    'operadores_dobles': 'a==b!=c>=d<=e&&f||g!h=i>j<k^2\n',
+    'no_ascii': 'var ñandú = "café"; ¿x? ٣\n',
+    'tabs_y_retornos': 'var\ta\r\n=\t1;\r\n',
+    'numero_al_final': 'var n = 42',
+}
+
+
+@pytest.mark.parametrize('texto', list(CASOS.values()) + list(BORDES.values()),
+                         ids=list(CASOS) + list(BORDES))
+def test_mismo_resultado_que_analizar_texto(texto):
+    esperado = analizar_texto(texto)
+    resultado = analizar_texto_numpy(texto)
+    assert firma_tokens(resultado.tokens) == firma_tokens(esperado.tokens)
+    assert firma_ids(resultado.tokens) == firma_ids(esperado.tokens)
+    assert firma_errores(resultado.errores) == firma_errores(esperado.errores)
+
+
+def test_archivo(tmp_path):
+    ruta = tmp_path / 'corpus.serpy'
+    ruta.write_text(CASOS['corpus'] * 5, encoding='utf-8')
+    esperado = analizar_archivo(str(ruta))
+    resultado = analizar_archivo_numpy(str(ruta))
+    assert firma_tokens(resultado.tokens) == firma_tokens(esperado.tokens)
+    assert firma_ids(resultado.tokens) == firma_ids(esperado.tokens)